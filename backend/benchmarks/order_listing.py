@@ -0,0 +1,103 @@
+# benchmarks/order_listing.py
+"""
+Compara las estrategias de carga del listado de pedidos contra la base configurada en DATABASE_URL.
+Reporta, por estrategia: consultas ejecutadas, filas devueltas por la base y latencia (mediana y p95).
+Uso (desde backend/): python -m benchmarks.order_listing --limit 100 --repeat 20
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import joinedload
+
+from src.infrastructure.database.database import SessionLocal, engine
+# Registra los modelos relacionados con los pedidos en el mapper de SQLAlchemy
+from src.infrastructure.persistence.models import (  # noqa: F401
+    type_client, customer, store, order_status, product_type, extra_option, product, order, order_detail
+)
+from src.infrastructure.persistence.models.order import OrderORM
+from src.infrastructure.persistence.models.order_detail import OrderDetailORM
+from src.infrastructure.persistence.repositories.order import SQLAlchemyOrderRepository
+
+
+class _QueryCounter:
+    """Cuenta sentencias y filas devueltas por la base mientras está activo."""
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+        # rowcount es exacto para SELECT en psycopg; otros drivers pueden devolver -1
+        if cursor.rowcount and cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+
+    def __enter__(self):
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "after_cursor_execute", self._after_execute)
+
+
+def _joined_listing(db, skip, limit):
+    """Estrategia anterior: un solo SELECT con JOIN de detalles, extras, cliente, tienda y estado."""
+    repository = SQLAlchemyOrderRepository(db)
+    orm_orders = db.query(OrderORM).options(
+        joinedload(OrderORM.details).joinedload(OrderDetailORM.extra_options),
+        joinedload(OrderORM.customer),
+        joinedload(OrderORM.store),
+        joinedload(OrderORM.order_status)
+    ).filter(OrderORM.deleted_at.is_(None)).order_by(OrderORM.id).offset(skip).limit(limit).all()
+    return [repository._to_domain_model(o) for o in orm_orders]
+
+
+def _selectin_listing(db, skip, limit):
+    return SQLAlchemyOrderRepository(db).get_all(skip, limit)
+
+
+def _summary_listing(db, skip, limit):
+    return SQLAlchemyOrderRepository(db).get_all(skip, limit, include_details=False)
+
+
+STRATEGIES = {
+    "joinedload (anterior)": _joined_listing,
+    "selectinload": _selectin_listing,
+    "resumen (sin detalles)": _summary_listing,
+}
+
+
+def run(skip: int, limit: int, repeat: int) -> None:
+    print(f"Listado de pedidos: skip={skip} limit={limit} repeticiones={repeat}")
+    print(f"{'estrategia':<24}{'pedidos':>9}{'consultas':>11}{'filas BD':>10}{'mediana ms':>12}{'p95 ms':>9}")
+    for name, strategy in STRATEGIES.items():
+        timings = []
+        for i in range(repeat + 1):
+            db = SessionLocal()
+            try:
+                with _QueryCounter() as counter:
+                    started = time.perf_counter()
+                    orders = strategy(db, skip, limit)
+                    elapsed = (time.perf_counter() - started) * 1000
+            finally:
+                db.close()
+            # La primera ejecución solo calienta la caché de sentencias compiladas
+            if i > 0:
+                timings.append(elapsed)
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) >= 2 else timings[0]
+        print(f"{name:<24}{len(orders):>9}{counter.statements:>11}{counter.rows:>10}"
+              f"{statistics.median(timings):>12.1f}{p95:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de estrategias de carga del listado de pedidos.")
+    parser.add_argument("--skip", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.skip, args.limit, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/quote_pricing.py
+"""
+Compara el motor de precios línea por línea (price_quote, una vez por margen) con el motor
+vectorizado (price_lines_batch, todos los márgenes a la vez) sobre líneas generadas en memoria.
+Reporta latencia (mediana y p95), líneas por segundo y verifica que ambos den los mismos montos.
+No usa la base de datos. Uso (desde backend/): python -m benchmarks.quote_pricing --lines 10000 --repeat 10
+"""
+import argparse
+import random
+import statistics
+import time
+
+from src.domain.services.pricing import ExtraOptionPriceInput, LinePriceInput, price_quote
+from src.domain.services.pricing_batch import price_lines_batch
+
+# Márgenes de ejemplo, uno por tipo de cliente
+DEFAULT_MARGINS = [0.5, 0.35, 0.25, 0.15]
+
+
+def _make_lines(count: int, seed: int):
+    """Líneas con productos de las tres formas de cobro y 0-3 extras de cualquier regla."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        extras = []
+        for _ in range(rng.randint(0, 3)):
+            extra_id = rng.randint(1, 21)
+            extras.append(ExtraOptionPriceInput(
+                extra_option_id=extra_id,
+                price=round(rng.uniform(1, 30), 2),
+                quantity=rng.randint(1, 4),
+                linear_meter=round(rng.uniform(0.5, 6), 2),
+                width=round(rng.uniform(0.5, 3), 2)
+            ))
+        lines.append(LinePriceInput(
+            product_id=rng.randint(1, 12),
+            price=round(rng.uniform(10, 120), 2),
+            quantity=rng.randint(1, 10),
+            linear_meter=round(rng.uniform(0.5, 6), 2),
+            width=round(rng.uniform(0.5, 3), 2),
+            extra_options=extras
+        ))
+    return lines
+
+
+def _measure(fn, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, timings
+
+
+def _p95(values):
+    ordered = sorted(values)
+    return ordered[max(0, int(round(0.95 * len(ordered))) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    lines = _make_lines(args.lines, args.seed)
+    margins = DEFAULT_MARGINS
+
+    loop_quotes, loop_timings = _measure(lambda: [price_quote(lines, margin) for margin in margins], args.repeat)
+    batch, batch_timings = _measure(lambda: price_lines_batch(lines, margins), args.repeat)
+
+    # Ambos motores deben dar los mismos montos, línea por línea y por margen
+    mismatches = sum(
+        abs(quote.final_amount - float(batch.final_amount[j])) > 0.001
+        for j, quote in enumerate(loop_quotes)
+    )
+    line_mismatches = sum(
+        abs(line.total - float(batch.line_totals[i])) > 0.001
+        for i, line in enumerate(loop_quotes[0].lines)
+    )
+
+    print(f"{args.lines} líneas x {len(margins)} márgenes, {args.repeat} repeticiones")
+    print(f"{'motor':<12} {'mediana ms':>11} {'p95 ms':>9} {'líneas/s':>12}")
+    for name, timings in (("por línea", loop_timings), ("vectorizado", batch_timings)):
+        median = statistics.median(timings)
+        print(f"{name:<12} {median:>11.2f} {_p95(timings):>9.2f} {args.lines * 1000 / median:>12.0f}")
+    print(f"diferencias: {line_mismatches} líneas, {mismatches} totales")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+-- Create "daily_sales" table
+CREATE TABLE "daily_sales" (
+  "store_id" integer NOT NULL,
+  "day" date NOT NULL,
+  "order_status_id" integer NOT NULL,
+  "order_count" integer NOT NULL,
+  "total_amount" numeric(14,2) NOT NULL,
+  "final_amount" numeric(14,2) NOT NULL,
+  "discount_applied" numeric(14,2) NOT NULL,
+  "profit" numeric(14,2) NOT NULL,
+  "updated_at" timestamp NULL,
+  PRIMARY KEY ("store_id", "day", "order_status_id"),
+  CONSTRAINT "daily_sales_order_status_id_fkey" FOREIGN KEY ("order_status_id") REFERENCES "order_status" ("id") ON UPDATE NO ACTION ON DELETE NO ACTION,
+  CONSTRAINT "daily_sales_store_id_fkey" FOREIGN KEY ("store_id") REFERENCES "stores" ("id") ON UPDATE NO ACTION ON DELETE NO ACTION
+);
+-- Fill "daily_sales" from the existing orders
+INSERT INTO "daily_sales" ("store_id", "day", "order_status_id", "order_count", "total_amount", "final_amount", "discount_applied", "profit", "updated_at")
+SELECT "store_id", CAST("created_at" AS date), "order_status_id", count("id"), sum("total_amount"), sum("final_amount"), sum("discount_applied"), sum("profit_margin"), now()
+FROM "orders"
+WHERE "deleted_at" IS NULL
+GROUP BY "store_id", CAST("created_at" AS date), "order_status_id";
@@ -0,0 +1,10 @@
+-- Create index "idx_orders_active" to table: "orders"
+CREATE INDEX "idx_orders_active" ON "orders" ("id") WHERE (deleted_at IS NULL);
+-- Create index "idx_customers_active" to table: "customers"
+CREATE INDEX "idx_customers_active" ON "customers" ("id") WHERE (deleted_at IS NULL);
+-- Create index "idx_products_active" to table: "products"
+CREATE INDEX "idx_products_active" ON "products" ("id") WHERE (deleted_at IS NULL);
+-- Create index "idx_extra_options_active" to table: "extra_options"
+CREATE INDEX "idx_extra_options_active" ON "extra_options" ("id") WHERE (deleted_at IS NULL);
+-- Create index "idx_product_types_active" to table: "product_types"
+CREATE INDEX "idx_product_types_active" ON "product_types" ("id") WHERE (deleted_at IS NULL);
@@ -0,0 +1,4 @@
+-- Create index "idx_orders_active_created" to table: "orders"
+CREATE INDEX "idx_orders_active_created" ON "orders" ("created_at", "id") WHERE (deleted_at IS NULL);
+-- Create index "idx_customers_active_created" to table: "customers"
+CREATE INDEX "idx_customers_active_created" ON "customers" ("created_at", "id") WHERE (deleted_at IS NULL);
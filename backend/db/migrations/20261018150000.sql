@@ -0,0 +1,19 @@
+-- Create "price_list_entries" table
+CREATE TABLE "price_list_entries" (
+  "id" serial NOT NULL,
+  "type_client_id" integer NOT NULL,
+  "product_id" integer NULL,
+  "extra_option_id" integer NULL,
+  "name" character varying(255) NOT NULL,
+  "base_price" numeric(10,2) NOT NULL,
+  "price" numeric(10,2) NOT NULL,
+  "final_price" numeric(10,2) NOT NULL,
+  "updated_at" timestamp NULL,
+  PRIMARY KEY ("id"),
+  CONSTRAINT "price_list_entries_extra_option_id_fkey" FOREIGN KEY ("extra_option_id") REFERENCES "extra_options" ("id") ON UPDATE NO ACTION ON DELETE NO ACTION,
+  CONSTRAINT "price_list_entries_product_id_fkey" FOREIGN KEY ("product_id") REFERENCES "products" ("id") ON UPDATE NO ACTION ON DELETE NO ACTION,
+  CONSTRAINT "price_list_entries_type_client_id_fkey" FOREIGN KEY ("type_client_id") REFERENCES "type_clients" ("id") ON UPDATE NO ACTION ON DELETE NO ACTION,
+  CONSTRAINT "price_list_entries_item_check" CHECK (num_nonnulls(product_id, extra_option_id) = 1)
+);
+-- Create index "idx_price_list_entries_type_client" to table: "price_list_entries"
+CREATE INDEX "idx_price_list_entries_type_client" ON "price_list_entries" ("type_client_id");
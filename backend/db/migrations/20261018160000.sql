@@ -0,0 +1,10 @@
+-- Create "idempotency_keys" table
+CREATE TABLE "idempotency_keys" (
+  "key" character varying(100) NOT NULL,
+  "request_hash" character varying(64) NOT NULL,
+  "order_id" integer NULL,
+  "response" jsonb NULL,
+  "created_at" timestamp NOT NULL,
+  PRIMARY KEY ("key"),
+  CONSTRAINT "idempotency_keys_order_id_fkey" FOREIGN KEY ("order_id") REFERENCES "orders" ("id") ON UPDATE NO ACTION ON DELETE NO ACTION
+);
@@ -0,0 +1,10 @@
+-- Remove duplicated "price_list_entries" rows left by concurrent rebuilds (keeps the newest row of each item)
+DELETE FROM "price_list_entries" a USING "price_list_entries" b
+WHERE a."id" < b."id"
+  AND a."type_client_id" = b."type_client_id"
+  AND a."product_id" IS NOT DISTINCT FROM b."product_id"
+  AND a."extra_option_id" IS NOT DISTINCT FROM b."extra_option_id";
+-- Create index "uq_price_list_entries_product" to table: "price_list_entries"
+CREATE UNIQUE INDEX "uq_price_list_entries_product" ON "price_list_entries" ("type_client_id", "product_id") WHERE (product_id IS NOT NULL);
+-- Create index "uq_price_list_entries_extra_option" to table: "price_list_entries"
+CREATE UNIQUE INDEX "uq_price_list_entries_extra_option" ON "price_list_entries" ("type_client_id", "extra_option_id") WHERE (extra_option_id IS NOT NULL);
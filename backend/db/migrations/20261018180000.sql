@@ -0,0 +1,9 @@
+-- Create "catalog_versions" table
+CREATE TABLE "catalog_versions" (
+  "name" character varying(50) NOT NULL,
+  "version" bigint NOT NULL,
+  "updated_at" timestamp NULL,
+  PRIMARY KEY ("name")
+);
+-- Seed the version counters used by the catalog ETags
+INSERT INTO "catalog_versions" ("name", "version", "updated_at") VALUES ('catalog', 0, now()), ('type_clients', 0, now());
@@ -1,6 +1,6 @@
 # src/application/dtos/customer.py (VERSION ACTUALIZADA Y FINAL)
 from pydantic import BaseModel, Field, EmailStr, BeforeValidator, model_validator
-from typing import Optional, Literal, Annotated
+from typing import List, Optional, Literal, Annotated
 from datetime import datetime
 import re
 
@@ -144,4 +144,9 @@ class CustomerResponseDto(BaseModel):
     deleted_at: Optional[datetime]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# DTO para una página de clientes con paginación por cursor
+class CustomerPageDto(BaseModel):
+    items: List[CustomerResponseDto] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="Cursor para pedir la siguiente página; None si no hay más.")
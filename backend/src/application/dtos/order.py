@@ -51,7 +51,43 @@ class OrderResponseDto(BaseModel):
     class Config:
         from_attributes = True
 
+# DTO liviano para los listados de pedidos (sin detalles ni relaciones anidadas)
+class OrderSummaryDto(BaseModel):
+    id: int
+    customer_name: Optional[str]
+    store_name: Optional[str]
+    status_name: Optional[str]
+    final_amount: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+# DTO para una página de pedidos con paginación por cursor
+class OrderPageDto(BaseModel):
+    items: List[OrderResponseDto] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="Cursor para pedir la siguiente página; None si no hay más.")
+
+# Máximo de pedidos por cambio de estado masivo
+MAX_BULK_STATUS_ORDERS = 500
+
+class BulkUpdateOrderStatusDto(BaseModel):
+    order_ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_STATUS_ORDERS, description="IDs de los pedidos a actualizar.")
+    order_status_id: int = Field(..., description="El nuevo ID del estado de los pedidos.")
+    notes: Optional[str] = Field(None, max_length=200, description="Notas a registrar en todos los pedidos.")
+
+class OrderStatusResultDto(BaseModel):
+    order_id: int
+    success: bool
+    detail: Optional[str] = None
+
+class BulkUpdateOrderStatusResponseDto(BaseModel):
+    order_status_id: int
+    updated_count: int
+    results: List[OrderStatusResultDto] = Field(default_factory=list)
+
 class UpdateOrderStatusDto(BaseModel):
     order_status_id: int = Field(..., description="El nuevo ID del estado del pedido.")
     notes: Optional[str] = Field(None, max_length=200, description="Notas adicionales sobre el cambio de estado.")
-    payment_method: Optional[str] = Field(None, description="Método de pago del pedido.")
\ No newline at end of file
+    payment_method: Optional[str] = Field(None, description="Método de pago del pedido.")
+    expected_updated_at: Optional[datetime] = Field(None, description="updated_at que el cliente leyó del pedido; si cambió desde entonces se responde 409.")
\ No newline at end of file
@@ -0,0 +1,29 @@
+# src/application/dtos/order_import.py
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from datetime import datetime
+from src.application.dtos.order import CreateOrderDto
+
+OrderImportFormat = Literal['ndjson', 'csv']
+
+# Pedidos por lote de INSERT (una transacción por lote)
+ORDER_IMPORT_BATCH_SIZE = 500
+# Máximo de pedidos por importación
+MAX_IMPORT_ORDERS = 50000
+
+# Un pedido importado: lo mismo que un pedido nuevo, con la fecha original si es histórico
+class ImportOrderDto(CreateOrderDto):
+    created_at: Optional[datetime] = Field(None, description="Fecha original del pedido; por defecto, la de la importación.")
+
+class OrderImportErrorDto(BaseModel):
+    row: int = Field(..., description="Línea del archivo donde empieza el pedido.")
+    ref: Optional[str] = Field(None, description="Referencia del pedido en el archivo (order_ref del CSV), si la hay.")
+    message: str
+
+class OrderImportResultDto(BaseModel):
+    total: int = Field(..., description="Pedidos leídos del archivo.")
+    imported: int
+    failed: int
+    dry_run: bool = False
+    order_ids: List[int] = Field(default_factory=list, description="IDs creados, en el orden del archivo.")
+    errors: List[OrderImportErrorDto] = Field(default_factory=list)
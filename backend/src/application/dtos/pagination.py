@@ -0,0 +1,28 @@
+# src/application/dtos/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+from src.application.exceptions import InvalidInputException
+
+# Tamaño máximo de página para la paginación por cursor
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """Codifica la posición (created_at, id) del último registro de la página en un cursor opaco."""
+    raw = json.dumps({"c": created_at.isoformat(), "i": record_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Decodifica un cursor generado por encode_cursor. Lanza InvalidInputException si no es válido."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["c"]), int(data["i"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidInputException("Cursor de paginación inválido.")
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
 
 # DTO para las opciones extra que vienen de Angular
 class AngularExtraOptionDto(BaseModel):
@@ -33,4 +33,19 @@ class AngularCartItemDto(BaseModel):
 
 # DTO para el request de generación de PDF
 class GeneratePdfRequest(BaseModel):
-    items: List[AngularCartItemDto] = Field(..., description="Lista de ítems detallados del carrito para la generación del PDF.")
\ No newline at end of file
+    items: List[AngularCartItemDto] = Field(..., description="Lista de ítems detallados del carrito para la generación del PDF.")
+
+# DTO para la exportación masiva de PDFs (ZIP)
+class BatchPdfExportDto(BaseModel):
+    order_ids: Optional[List[int]] = Field(None, description="IDs de los pedidos a exportar.")
+    start_date: Optional[date] = Field(None, description="Fecha inicial (inclusive) de creación de los pedidos.")
+    end_date: Optional[date] = Field(None, description="Fecha final (inclusive) de creación de los pedidos.")
+    store_id: Optional[int] = Field(None, description="Filtra los pedidos por tienda.")
+
+    @model_validator(mode='after')
+    def check_selection(self):
+        if not self.order_ids and not (self.start_date and self.end_date):
+            raise ValueError("Debe indicar order_ids o un rango de fechas (start_date y end_date).")
+        if self.start_date and self.end_date and self.start_date > self.end_date:
+            raise ValueError("start_date no puede ser mayor que end_date.")
+        return self
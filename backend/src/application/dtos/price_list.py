@@ -0,0 +1,22 @@
+# src/application/dtos/price_list.py
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from datetime import datetime
+
+class PriceListEntryDto(BaseModel):
+    item_type: Literal['product', 'extra_option']
+    item_id: int
+    name: str
+    base_price: float = Field(..., description="Precio del catálogo.")
+    price: float = Field(..., description="Precio con el margen del tipo de cliente, sin IGV.")
+    final_price: float = Field(..., description="Precio con margen e IGV.")
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
+class PriceListDto(BaseModel):
+    type_client_id: int
+    code: str
+    margin: float
+    items: List[PriceListEntryDto] = Field(default_factory=list)
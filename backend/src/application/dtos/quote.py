@@ -0,0 +1,91 @@
+# src/application/dtos/quote.py
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List
+
+# Máximo de líneas por cotización
+MAX_QUOTE_LINES = 200
+
+# DTOs de entrada: mismas medidas que un detalle de pedido, sin montos (los calcula el servidor)
+class QuoteExtraOptionDto(BaseModel):
+    extra_option_id: int = Field(..., description="ID de la opción extra.")
+    quantity: float = Field(1, gt=0, description="Cantidad de la opción extra.")
+    linear_meter: Optional[float] = Field(None, gt=0, description="Medida lineal (o largo) si aplica.")
+    width: Optional[float] = Field(None, gt=0, description="Ancho si aplica.")
+
+class QuoteLineDto(BaseModel):
+    product_id: int = Field(..., description="ID del producto.")
+    quantity: int = Field(..., gt=0, description="Cantidad del producto.")
+    linear_meter: Optional[float] = Field(None, gt=0, description="Medida lineal (o largo) si aplica.")
+    width: Optional[float] = Field(None, gt=0, description="Ancho si aplica.")
+    extra_options: List[QuoteExtraOptionDto] = Field(default_factory=list, description="Opciones extra de la línea.")
+
+class QuoteRequestDto(BaseModel):
+    customer_id: Optional[int] = Field(None, description="Cliente a cotizar; se usa el margen de su tipo de cliente.")
+    type_client_id: Optional[int] = Field(None, description="Tipo de cliente, si aún no hay cliente registrado.")
+    discount_applied: float = Field(0.00, ge=0, description="Descuento a aplicar sobre la cotización.")
+    lines: List[QuoteLineDto] = Field(..., min_length=1, max_length=MAX_QUOTE_LINES, description="Líneas a cotizar.")
+
+    @model_validator(mode="after")
+    def _check_client(self):
+        if self.customer_id is None and self.type_client_id is None:
+            raise ValueError("Se requiere customer_id o type_client_id.")
+        return self
+
+# DTOs de respuesta
+class QuoteExtraOptionPriceDto(BaseModel):
+    extra_option_id: int
+    rule: str
+    amount: float
+
+    class Config:
+        from_attributes = True
+
+class QuoteLinePriceDto(BaseModel):
+    product_id: int
+    rule: str
+    subtotal: float
+    total_extra_options: float
+    total: float
+    extra_options: List[QuoteExtraOptionPriceDto] = Field(default_factory=list)
+
+    class Config:
+        from_attributes = True
+
+class QuotePriceDto(BaseModel):
+    type_client_id: int
+    margin: float
+    lines: List[QuoteLinePriceDto]
+    total_amount: float
+    profit_margin: float
+    discount_applied: float
+    final_amount: float
+    igv: float
+
+# Cotización masiva: muchas líneas con los márgenes de varios tipos de cliente a la vez
+MAX_BATCH_QUOTE_LINES = 20000
+
+class BatchQuoteRequestDto(BaseModel):
+    type_client_ids: List[int] = Field(default_factory=list, description="Tipos de cliente a simular; vacío = todos los activos.")
+    discount_applied: float = Field(0.00, ge=0, description="Descuento a aplicar sobre la cotización.")
+    lines: List[QuoteLineDto] = Field(..., min_length=1, max_length=MAX_BATCH_QUOTE_LINES, description="Líneas a cotizar.")
+
+class QuoteTotalsDto(BaseModel):
+    type_client_id: int
+    margin: float
+    total_amount: float
+    profit_margin: float
+    discount_applied: float
+    final_amount: float
+    igv: float
+
+class BatchQuotePriceDto(BaseModel):
+    """
+    Respuesta compacta en columnas: la posición i de cada lista corresponde a la línea i del pedido
+    y la columna j de `line_final` al tipo de cliente `totals[j]`.
+    """
+    product_ids: List[int]
+    subtotals: List[float]
+    total_extra_options: List[float]
+    line_totals: List[float]
+    line_final: List[List[float]] = Field(..., description="Precio final (margen + IGV) por línea y tipo de cliente.")
+    totals: List[QuoteTotalsDto]
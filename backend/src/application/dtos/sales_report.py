@@ -0,0 +1,28 @@
+# src/application/dtos/sales_report.py
+from pydantic import BaseModel, Field
+from typing import Optional, Literal
+from datetime import date
+
+SalesReportGroupBy = Literal['store', 'day', 'week', 'month', 'customer_type', 'product']
+
+# DTO con los filtros del reporte de ventas
+class SalesReportFilterDto(BaseModel):
+    group_by: SalesReportGroupBy = Field('store', description="Criterio de agrupación.")
+    start_date: Optional[date] = Field(None, description="Fecha inicial (inclusive).")
+    end_date: Optional[date] = Field(None, description="Fecha final (inclusive).")
+    store_id: Optional[int] = Field(None, description="Filtra por tienda.")
+    order_status_id: Optional[int] = Field(None, description="Filtra por estado del pedido.")
+
+# DTO para cada fila del reporte
+class SalesReportRowDto(BaseModel):
+    group_key: str = Field(..., description="Valor del grupo (ID o fecha de inicio del periodo).")
+    group_label: Optional[str] = Field(None, description="Nombre legible del grupo.")
+    order_count: int
+    total_amount: float
+    discount_applied: Optional[float] = None
+    profit: Optional[float] = None
+    final_amount: Optional[float] = None
+    quantity: Optional[int] = None
+
+    class Config:
+        from_attributes = True
@@ -25,4 +25,9 @@ class InvalidInputException(ApplicationException):
 class UnauthorizedException(ApplicationException):
     """Exception raised for unauthorized access."""
     def __init__(self, message: str = "No autorizado"):
-        super().__init__(message, status_code=401)
\ No newline at end of file
+        super().__init__(message, status_code=401)
+class ServiceUnavailableException(ApplicationException):
+    """Exception raised when a service is temporarily saturated; clients should retry later."""
+    def __init__(self, message: str = "Servicio no disponible temporalmente", retry_after: int = 5):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=503)
@@ -1,6 +1,7 @@
 # src/application/ports/customer.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from src.domain.models.customer import Customer
 
 class CustomerRepository(ABC):
@@ -22,6 +23,15 @@ class CustomerRepository(ABC):
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Customer]:
+        """Obtiene los clientes activos (no eliminados), paginados por ID."""
+        pass
+
+    @abstractmethod
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Customer]:
+        """
+        Obtiene hasta `limit` clientes activos ordenados del más reciente al más antiguo por (created_at, id),
+        empezando después de la posición `after` (paginación por cursor, sin OFFSET).
+        """
         pass
 
     @abstractmethod
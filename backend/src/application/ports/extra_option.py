@@ -8,12 +8,23 @@ class ExtraOptionRepository(ABC):
     def get_by_id(self, extra_option_id: int) -> Optional[ExtraOption]:
         pass
 
+    @abstractmethod
+    def get_many_by_ids(self, extra_option_ids: List[int]) -> List[ExtraOption]:
+        """Obtiene en una sola consulta las opciones extra con los IDs indicados (incluye eliminadas; las inexistentes se omiten)."""
+        pass
+
     @abstractmethod
     def get_by_name(self, name: str) -> Optional[ExtraOption]:
         pass
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ExtraOption]:
+        """Obtiene las opciones extra activas (no eliminadas), paginadas por ID."""
+        pass
+
+    @abstractmethod
+    def get_version(self) -> str:
+        """Versión del contenido de la tabla; cambia cuando se crea, modifica o elimina un registro."""
         pass
 
     @abstractmethod
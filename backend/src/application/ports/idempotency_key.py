@@ -0,0 +1,39 @@
+# src/application/ports/idempotency_key.py
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.models.idempotency_key import IdempotencyKey
+
+class IdempotencyKeyRepository(ABC):
+    """
+    Puerto (interfaz) para las claves de idempotencia de creación de pedidos.
+    """
+    @abstractmethod
+    def get(self, key: str) -> Optional[IdempotencyKey]:
+        """Busca una clave por su valor (clave primaria)."""
+        pass
+
+    @abstractmethod
+    def reserve(self, key: str, request_hash: str) -> bool:
+        """
+        Reserva la clave antes de crear el pedido. Retorna False si otra solicitud ya la tiene
+        (completada o todavía en proceso); una reserva abandonada hace tiempo se puede volver a tomar.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, order_id: int, response: dict) -> None:
+        """
+        Guarda la respuesta que se devolverá en los reintentos. El order_id ya quedó asociado
+        al crear el pedido (OrderRepository.save con idempotency_key).
+        """
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Libera una reserva cuando la creación del pedido falló, para que el cliente pueda reintentar."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Elimina las claves más antiguas que el periodo de retención. Retorna cuántas se borraron."""
+        pass
@@ -1,7 +1,9 @@
 # src/application/ports/order.py
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple
+from datetime import datetime
 from src.domain.models.order import Order
+from src.domain.models.order_summary import OrderSummary
 
 class OrderRepository(ABC):
     """
@@ -13,15 +15,77 @@ class OrderRepository(ABC):
         pass
     
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Order]:
-        """Obtiene todos los pedidos activos, paginados."""
+    def get_by_id_with_catalog(self, order_id: int) -> Optional[Order]:
+        """
+        Obtiene un pedido con sus detalles enriquecidos con el producto y las opciones extra del catálogo,
+        en una sola consulta. Se usa para generar el PDF desde los datos persistidos.
+        """
+        pass
+
+    @abstractmethod
+    def get_all(self, skip: int = 0, limit: int = 100, include_details: bool = True) -> List[Order]:
+        """
+        Obtiene los pedidos activos (no eliminados), paginados por ID.
+        Con include_details=False no se cargan los detalles (modo resumen para listados).
+        """
+        pass
+
+    @abstractmethod
+    def get_summaries(self, skip: int = 0, limit: int = 100, store_id: Optional[int] = None,
+                      order_status_id: Optional[int] = None) -> List[OrderSummary]:
+        """
+        Obtiene la proyección resumida de los pedidos activos, paginada por ID.
+        Solo lee columnas de pedidos, clientes, tiendas y estados (nunca los detalles).
+        """
         pass
 
     @abstractmethod
-    def save(self, order: Order) -> Order:
+    def get_ids_created_between(self, start: datetime, end: datetime, store_id: Optional[int] = None) -> List[int]:
+        """Obtiene los IDs de los pedidos activos creados en [start, end), opcionalmente filtrados por tienda."""
+        pass
+
+    @abstractmethod
+    def iter_report_rows(self, start: Optional[datetime] = None, end: Optional[datetime] = None, store_id: Optional[int] = None) -> Iterator[tuple]:
+        """
+        Recorre los pedidos activos para el reporte sin cargarlos todos en memoria.
+        Cada fila es (id, cliente, tienda, estado, monto final, fecha de creación).
+        """
+        pass
+
+    @abstractmethod
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[Order]:
+        """
+        Obtiene hasta `limit` pedidos activos ordenados del más reciente al más antiguo por (created_at, id),
+        empezando después de la posición `after` (paginación por cursor, sin OFFSET).
+        """
+        pass
+
+    @abstractmethod
+    def save(self, order: Order, idempotency_key: Optional[str] = None) -> Order:
         """
         Guarda o actualiza un pedido en la base de datos.
         Esto debe manejar la persistencia de los OrderDetail y OrderDetailExtraOption anidados.
+        Al crear con idempotency_key, la clave reservada se asocia al pedido en la misma transacción;
+        si la clave ya apunta a otro pedido se lanza ConflictException y no se crea nada.
+        """
+        pass
+
+    @abstractmethod
+    def update_status(self, order_id: int, order_status_id: int, notes: Optional[str] = None,
+                      payment_method: Optional[str] = None,
+                      expected_updated_at: Optional[datetime] = None) -> Optional[Order]:
+        """
+        Cambia el estado (y opcionalmente notas y método de pago) de un pedido activo sin tocar sus detalles.
+        Retorna el pedido actualizado sin detalles, o None si no existe o está eliminado.
+        Si se indica expected_updated_at y el pedido fue modificado después, lanza ConflictException.
+        """
+        pass
+
+    @abstractmethod
+    def update_status_many(self, order_ids: List[int], order_status_id: int, notes: Optional[str] = None) -> List[int]:
+        """
+        Cambia el estado de varios pedidos activos con una sola sentencia UPDATE.
+        Retorna los IDs actualizados; los inexistentes o eliminados se omiten.
         """
         pass
 
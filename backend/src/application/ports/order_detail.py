@@ -14,7 +14,7 @@ class OrderDetailRepository(ABC):
 
     @abstractmethod
     def get_all_by_order_id(self, order_id: int) -> List[OrderDetail]:
-        """Obtiene todos los detalles de pedido para un pedido específico."""
+        """Obtiene los detalles activos de un pedido específico."""
         pass
 
     @abstractmethod
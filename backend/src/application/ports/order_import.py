@@ -0,0 +1,22 @@
+# src/application/ports/order_import.py
+from abc import ABC, abstractmethod
+from typing import List
+from src.domain.models.order import Order
+from src.domain.models.order_import import OrderImportReferences
+
+class OrderImportRepository(ABC):
+    """
+    Puerto (interfaz) para la importación masiva de pedidos.
+    """
+    @abstractmethod
+    def get_references(self) -> OrderImportReferences:
+        """IDs activos de clientes, tiendas, estados, productos y opciones extra."""
+        pass
+
+    @abstractmethod
+    def insert_orders(self, orders: List[Order]) -> List[int]:
+        """
+        Inserta un lote de pedidos ya validados con sus detalles y extras en una sola transacción
+        y actualiza el resumen diario. Retorna los IDs creados en el mismo orden que `orders`.
+        """
+        pass
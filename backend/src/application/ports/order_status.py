@@ -18,6 +18,7 @@ class OrderStatusRepository(ABC):
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[OrderStatus]:
+        """Obtiene los estados de pedido activos (no eliminados), paginados por ID."""
         pass
 
     @abstractmethod
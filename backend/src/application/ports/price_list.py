@@ -0,0 +1,26 @@
+# src/application/ports/price_list.py
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from src.domain.models.price_list import PriceListEntry
+
+class PriceListRepository(ABC):
+    """
+    Puerto (interfaz) para la lista de precios materializada por tipo de cliente.
+    """
+    @abstractmethod
+    def get_by_type_client(self, type_client_id: int) -> List[PriceListEntry]:
+        """Precios de un tipo de cliente: primero los productos y luego las opciones extra, por ID."""
+        pass
+
+    @abstractmethod
+    def rebuild(
+        self,
+        product_id: Optional[int] = None,
+        extra_option_id: Optional[int] = None,
+        type_client_id: Optional[int] = None
+    ) -> int:
+        """
+        Regenera las filas afectadas por un producto, una opción extra o un tipo de cliente
+        (sin filtros, la lista completa). Retorna la cantidad de filas generadas.
+        """
+        pass
@@ -10,6 +10,11 @@ class ProductRepository(ABC):
     def get_by_id(self, product_id: int) -> Optional[Product]:
         pass
 
+    @abstractmethod
+    def get_many_by_ids(self, product_ids: List[int]) -> List[Product]:
+        """Obtiene en una sola consulta los productos con los IDs indicados (incluye eliminados; los inexistentes se omiten)."""
+        pass
+
     @abstractmethod
     def get_by_sku(self, sku: str) -> Optional[Product]:
         pass
@@ -20,6 +25,12 @@ class ProductRepository(ABC):
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+        """Obtiene los productos activos (no eliminados), paginados por ID."""
+        pass
+
+    @abstractmethod
+    def get_version(self) -> str:
+        """Versión del catálogo de productos (incluye opciones extra y tipos de producto, que se devuelven anidados)."""
         pass
 
     @abstractmethod
@@ -14,6 +14,12 @@ class ProductTypeRepository(ABC):
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[ProductType]:
+        """Obtiene los tipos de producto activos (no eliminados), paginados por ID."""
+        pass
+
+    @abstractmethod
+    def get_version(self) -> str:
+        """Versión del contenido de la tabla; cambia cuando se crea, modifica o elimina un registro."""
         pass
 
     @abstractmethod
@@ -0,0 +1,25 @@
+# src/application/ports/sales_report.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from src.domain.models.sales_report import SalesReportRow
+
+class SalesReportRepository(ABC):
+    """
+    Puerto (interfaz) para los reportes agregados de ventas.
+    Las agregaciones se resuelven en la base de datos (GROUP BY), no en memoria.
+    """
+    @abstractmethod
+    def get_sales_summary(
+        self,
+        group_by: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        store_id: Optional[int] = None,
+        order_status_id: Optional[int] = None
+    ) -> List[SalesReportRow]:
+        """
+        Agrega los pedidos activos creados en [start, end) según `group_by`:
+        'store', 'day', 'week', 'month', 'customer_type' o 'product'.
+        """
+        pass
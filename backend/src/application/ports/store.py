@@ -18,6 +18,7 @@ class StoreRepository(ABC):
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Store]:
+        """Obtiene las tiendas activas (no eliminadas), paginadas por ID."""
         pass
 
     @abstractmethod
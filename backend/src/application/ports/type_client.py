@@ -18,6 +18,12 @@ class TypeClientRepository(ABC):
 
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[TypeClient]:
+        """Obtiene los tipos de cliente activos (no eliminados), paginados por ID."""
+        pass
+
+    @abstractmethod
+    def get_version(self) -> str:
+        """Versión del contenido de la tabla; cambia cuando se crea, modifica o elimina un registro."""
         pass
 
     @abstractmethod
@@ -3,7 +3,8 @@ from typing import List, Optional
 from src.domain.models.customer import Customer
 from src.application.ports.customer import CustomerRepository
 from src.application.ports.type_client import TypeClientRepository # Necesario para buscar TypeClients
-from src.application.dtos.customer import CreateCustomerDto, UpdateCustomerDto, CustomerResponseDto
+from src.application.dtos.customer import CreateCustomerDto, UpdateCustomerDto, CustomerResponseDto, CustomerPageDto
+from src.application.dtos.pagination import MAX_PAGE_SIZE, encode_cursor, decode_cursor
 from src.application.exceptions import NotFoundException, ConflictException
 from datetime import datetime
 
@@ -63,8 +64,21 @@ class CustomerUseCases:
     def get_all_customers(self, skip: int = 0, limit: int = 100) -> List[CustomerResponseDto]:
         """Recupera todos los clientes activos paginados, incluyendo sus tipos de cliente."""
         customers = self.customer_repository.get_all(skip, limit)
-        active_customers = [c for c in customers if c.is_active()]
-        return [CustomerResponseDto.model_validate(customer) for customer in active_customers]
+        return [CustomerResponseDto.model_validate(customer) for customer in customers]
+
+    def get_customers_page(self, cursor: Optional[str] = None, limit: int = 50) -> CustomerPageDto:
+        """Recupera una página de clientes activos (más recientes primero) a partir del cursor de la página anterior."""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        customers = self.customer_repository.get_page(limit + 1, decode_cursor(cursor))
+        next_cursor = None
+        if len(customers) > limit:
+            customers = customers[:limit]
+            last = customers[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return CustomerPageDto(
+            items=[CustomerResponseDto.model_validate(customer) for customer in customers],
+            next_cursor=next_cursor
+        )
 
     def update_customer(self, customer_id: int, customer_dto: UpdateCustomerDto) -> CustomerResponseDto:
         """Actualiza un cliente existente."""
@@ -2,6 +2,7 @@
 from typing import List, Optional
 from src.domain.models.extra_option import ExtraOption
 from src.application.ports.extra_option import ExtraOptionRepository
+from src.application.ports.price_list import PriceListRepository
 from src.application.dtos.extra_option import CreateExtraOptionDto, UpdateExtraOptionDto, ExtraOptionResponseDto
 from src.application.exceptions import NotFoundException, ConflictException
 from datetime import datetime
@@ -10,8 +11,14 @@ class ExtraOptionUseCases:
     """
     Casos de uso para la gestión de Opciones Extra.
     """
-    def __init__(self, repository: ExtraOptionRepository):
+    def __init__(self, repository: ExtraOptionRepository, price_list_repository: Optional[PriceListRepository] = None):
         self.repository = repository
+        self.price_list_repository = price_list_repository
+
+    def _refresh_price_list(self, extra_option_id: int) -> None:
+        """Regenera los precios de la opción extra en la lista de cada tipo de cliente."""
+        if self.price_list_repository is not None:
+            self.price_list_repository.rebuild(extra_option_id=extra_option_id)
 
     def create_extra_option(self, extra_option_dto: CreateExtraOptionDto) -> ExtraOptionResponseDto:
         """Crea una nueva opción extra."""
@@ -26,6 +33,7 @@ class ExtraOptionUseCases:
         )
         
         created_extra_option = self.repository.save(new_extra_option)
+        self._refresh_price_list(created_extra_option.id)
         
         return ExtraOptionResponseDto.model_validate(created_extra_option)
 
@@ -36,11 +44,14 @@ class ExtraOptionUseCases:
             raise NotFoundException(f"Opción extra con ID {extra_option_id} no encontrada o eliminada.")
         return ExtraOptionResponseDto.model_validate(extra_option)
 
+    def get_extra_options_version(self) -> str:
+        """Versión actual de las opciones extra, para validar cachés del cliente (ETag)."""
+        return self.repository.get_version()
+
     def get_all_extra_options(self, skip: int = 0, limit: int = 100) -> List[ExtraOptionResponseDto]:
         """Recupera todas las opciones extra activas paginadas."""
         extra_options = self.repository.get_all(skip, limit)
-        active_extra_options = [eo for eo in extra_options if eo.is_active()]
-        return [ExtraOptionResponseDto.model_validate(extra_option) for extra_option in active_extra_options]
+        return [ExtraOptionResponseDto.model_validate(extra_option) for extra_option in extra_options]
 
     def update_extra_option(self, extra_option_id: int, extra_option_dto: UpdateExtraOptionDto) -> ExtraOptionResponseDto:
         """Actualiza una opción extra existente."""
@@ -56,6 +67,8 @@ class ExtraOptionUseCases:
         existing_extra_option.update(**update_data)
 
         updated_extra_option = self.repository.save(existing_extra_option)
+        if 'price' in update_data or 'name' in update_data:
+            self._refresh_price_list(extra_option_id)
         return ExtraOptionResponseDto.model_validate(updated_extra_option)
 
     def delete_extra_option(self, extra_option_id: int) -> ExtraOptionResponseDto:
@@ -67,4 +80,5 @@ class ExtraOptionUseCases:
         extra_option_to_delete.mark_as_deleted()
         
         deleted_extra_option = self.repository.save(extra_option_to_delete)
+        self._refresh_price_list(extra_option_id)
         return ExtraOptionResponseDto.model_validate(deleted_extra_option)
\ No newline at end of file
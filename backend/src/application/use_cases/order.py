@@ -1,5 +1,6 @@
 # src/application/use_cases/order.py
-from typing import List, Optional
+import hashlib
+from typing import Iterator, List, Optional, Tuple
 from src.domain.models.order import Order
 from src.domain.models.order_detail import OrderDetail, OrderDetailExtraOption
 from src.application.ports.order import OrderRepository
@@ -8,10 +9,16 @@ from src.application.ports.store import StoreRepository
 from src.application.ports.order_status import OrderStatusRepository
 from src.application.ports.product import ProductRepository
 from src.application.ports.extra_option import ExtraOptionRepository
-from src.application.dtos.order import CreateOrderDto, OrderResponseDto, UpdateOrderStatusDto
+from src.application.ports.idempotency_key import IdempotencyKeyRepository
+from src.application.dtos.order import (
+    CreateOrderDto, OrderResponseDto, OrderPageDto, OrderSummaryDto, UpdateOrderStatusDto,
+    BulkUpdateOrderStatusDto, BulkUpdateOrderStatusResponseDto, OrderStatusResultDto
+)
+from src.application.dtos.pagination import MAX_PAGE_SIZE, encode_cursor, decode_cursor
 from src.application.dtos.order_detail import CreateOrderDetailDto
+from src.application.dtos.pdf_generation import BatchPdfExportDto
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 
 class OrderUseCases:
     """
@@ -23,18 +30,21 @@ class OrderUseCases:
                  store_repo: StoreRepository,
                  order_status_repo: OrderStatusRepository,
                  product_repo: ProductRepository,
-                 extra_option_repo: ExtraOptionRepository):
+                 extra_option_repo: ExtraOptionRepository,
+                 idempotency_repo: Optional[IdempotencyKeyRepository] = None):
         self.repository = repository
         self.customer_repo = customer_repo
         self.store_repo = store_repo
         self.order_status_repo = order_status_repo
         self.product_repo = product_repo
         self.extra_option_repo = extra_option_repo
+        self.idempotency_repo = idempotency_repo
 
-    def create_order(self, order_dto: CreateOrderDto) -> OrderResponseDto:
+    def create_order(self, order_dto: CreateOrderDto, idempotency_key: Optional[str] = None) -> OrderResponseDto:
         """
         Crea un nuevo pedido completo con sus detalles.
         Asume que los montos (total_amount, final_amount, etc.) ya vienen calculados del frontend.
+        Con idempotency_key (ya reservada) la clave queda asociada al pedido en su misma transacción.
         """
         # 1. Validar la existencia de las entidades relacionadas
         customer = self.customer_repo.get_by_id(order_dto.customer_id)
@@ -69,16 +79,24 @@ class OrderUseCases:
         )
 
         # 3. Mapear los detalles del pedido y validar productos/extras
+        # Se consultan todos los productos y extras del pedido de una vez (cantidad de consultas fija)
+        products = {p.id: p for p in self.product_repo.get_many_by_ids(
+            [detail_dto.product_id for detail_dto in order_dto.details]
+        )}
+        extra_options = {eo.id: eo for eo in self.extra_option_repo.get_many_by_ids(
+            [eo_dto.extra_option_id for detail_dto in order_dto.details for eo_dto in detail_dto.extra_options]
+        )}
+
         for detail_dto in order_dto.details:
             # Validar que el producto existe
-            product = self.product_repo.get_by_id(detail_dto.product_id)
+            product = products.get(detail_dto.product_id)
             if not product or not product.is_active():
                 raise NotFoundException(f"Producto con ID {detail_dto.product_id} no encontrado o eliminado en el detalle.")
                 
             # Mapear las opciones extra y validar su existencia
             extra_options_domain = []
             for eo_dto in detail_dto.extra_options:
-                extra_option = self.extra_option_repo.get_by_id(eo_dto.extra_option_id)
+                extra_option = extra_options.get(eo_dto.extra_option_id)
                 if not extra_option or not extra_option.is_active():
                     raise NotFoundException(f"Opción extra con ID {eo_dto.extra_option_id} no encontrada o eliminada.")
                 extra_options_domain.append(OrderDetailExtraOption(
@@ -105,10 +123,45 @@ class OrderUseCases:
             new_order.details.append(order_detail_domain)
             
         # 4. Guardar el pedido completo (y sus detalles anidados) en el repositorio
-        created_order = self.repository.save(new_order)
+        created_order = self.repository.save(new_order, idempotency_key=idempotency_key)
         
         return OrderResponseDto.model_validate(created_order)
 
+    def create_order_idempotent(self, order_dto: CreateOrderDto, idempotency_key: str) -> Tuple[OrderResponseDto, bool]:
+        """
+        Crea el pedido una sola vez por Idempotency-Key. Un reintento con la misma clave devuelve
+        la respuesta original (una lectura por clave primaria) sin validar ni insertar de nuevo.
+        Retorna (pedido, True si es una respuesta repetida).
+        """
+        request_hash = hashlib.sha256(order_dto.model_dump_json().encode()).hexdigest()
+
+        stored = self.idempotency_repo.get(idempotency_key)
+        # Una reserva pendiente solo se vuelve a tomar si quedó abandonada (lo decide el repositorio)
+        if (stored is None or not stored.is_completed()) and self.idempotency_repo.reserve(idempotency_key, request_hash):
+            try:
+                created = self.create_order(order_dto, idempotency_key=idempotency_key)
+            except Exception:
+                self.idempotency_repo.release(idempotency_key)
+                raise
+            try:
+                self.idempotency_repo.complete(idempotency_key, created.id, created.model_dump(mode="json"))
+            except Exception:
+                # El pedido ya está confirmado y la clave apunta a él: los reintentos lo leerán por su ID
+                pass
+            return created, False
+
+        # Otra solicitud ya tomó la clave (antes o en paralelo con esta)
+        if stored is None or not stored.is_completed():
+            stored = self.idempotency_repo.get(idempotency_key)
+        if stored is not None and stored.request_hash != request_hash:
+            raise ConflictException("La Idempotency-Key ya se usó con un pedido distinto.")
+        if stored is None or not stored.is_completed():
+            raise ConflictException("Ya hay una solicitud en proceso con esta Idempotency-Key; reintente en unos segundos.")
+        if stored.response is None:
+            # El pedido se creó pero no se llegó a guardar la respuesta
+            return self.get_order_by_id(stored.order_id), True
+        return OrderResponseDto.model_validate(stored.response), True
+
     def get_order_by_id(self, order_id: int) -> OrderResponseDto:
         """Recupera un pedido completo por su ID."""
         order = self.repository.get_by_id(order_id)
@@ -117,11 +170,93 @@ class OrderUseCases:
         
         return OrderResponseDto.model_validate(order)
     
-    def get_all_orders(self, skip: int = 0, limit: int = 100) -> List[OrderResponseDto]:
-        """Recupera todos los pedidos activos paginados."""
-        orders = self.repository.get_all(skip, limit)
-        active_orders = [o for o in orders if o.is_active()]
-        return [OrderResponseDto.model_validate(order) for order in active_orders]
+    def get_order_for_pdf(self, order_id: int) -> Tuple[OrderResponseDto, List[dict]]:
+        """
+        Recupera un pedido y arma los ítems a mostrar en el PDF a partir de los datos persistidos
+        (detalles + catálogo de productos y opciones extra), sin depender del carrito del cliente.
+        """
+        order = self.repository.get_by_id_with_catalog(order_id)
+        if not order or not order.is_active():
+            raise NotFoundException(f"Pedido con ID {order_id} no encontrado o eliminado.")
+
+        display_items = []
+        for detail in order.details:
+            if not detail.is_active():
+                continue
+            extra_options = []
+            for eo in detail.extra_options:
+                extra_options.append({
+                    "extra_option_id": eo.extra_option_id,
+                    "quantity": eo.quantity,
+                    "linear_meter": eo.linear_meter,
+                    "width": eo.width,
+                    "giga_select": eo.giga_select,
+                    "name": eo.extra_option.name,
+                    "price": eo.extra_option.price
+                })
+            display_items.append({
+                "product_id": detail.product_id,
+                "height": detail.height,
+                "width": detail.width,
+                "quantity": detail.quantity,
+                "linear_meter": detail.linear_meter,
+                "subtotal": detail.subtotal,
+                "total_extra_options": detail.total_extra_options,
+                "sku": detail.product.sku,
+                "name": detail.product.name,
+                "price": detail.product.price,
+                "image": detail.product.image_url,
+                "extra_options": extra_options
+            })
+
+        return OrderResponseDto.model_validate(order), display_items
+
+    def get_order_ids_for_export(self, export_dto: BatchPdfExportDto) -> List[int]:
+        """
+        Resuelve los pedidos a exportar: los IDs indicados (sin duplicados, en el mismo orden)
+        o los pedidos activos creados en el rango de fechas, opcionalmente de una tienda.
+        """
+        if export_dto.order_ids:
+            return list(dict.fromkeys(export_dto.order_ids))
+
+        start = datetime.combine(export_dto.start_date, time.min)
+        end = datetime.combine(export_dto.end_date + timedelta(days=1), time.min)
+        return self.repository.get_ids_created_between(start, end, export_dto.store_id)
+
+    def iter_orders_report(self, start_date: Optional[date] = None, end_date: Optional[date] = None, store_id: Optional[int] = None) -> Iterator[tuple]:
+        """Recorre las filas del reporte de pedidos activos, filtrando por rango de fechas (inclusive) y tienda."""
+        start = datetime.combine(start_date, time.min) if start_date else None
+        end = datetime.combine(end_date + timedelta(days=1), time.min) if end_date else None
+        return self.repository.iter_report_rows(start, end, store_id)
+
+    def get_all_orders(self, skip: int = 0, limit: int = 100, include_details: bool = True) -> List[OrderResponseDto]:
+        """Recupera todos los pedidos activos paginados. Sin detalles si include_details es False."""
+        orders = self.repository.get_all(skip, limit, include_details)
+        return [OrderResponseDto.model_validate(order) for order in orders]
+
+    def get_order_summaries(self, skip: int = 0, limit: int = 100, store_id: Optional[int] = None,
+                            order_status_id: Optional[int] = None) -> List[OrderSummaryDto]:
+        """Recupera el listado resumido de pedidos activos (cliente, tienda, estado, monto y fecha)."""
+        summaries = self.repository.get_summaries(skip, limit, store_id, order_status_id)
+        return [OrderSummaryDto.model_validate(summary) for summary in summaries]
+
+    def get_orders_page(self, cursor: Optional[str] = None, limit: int = 50) -> OrderPageDto:
+        """
+        Recupera una página de pedidos activos, del más reciente al más antiguo.
+        `cursor` es el next_cursor de la página anterior; el costo no depende de qué tan profunda sea la página.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        # Se pide un registro extra para saber si hay una página siguiente
+        orders = self.repository.get_page(limit + 1, decode_cursor(cursor))
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            last = orders[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return OrderPageDto(
+            items=[OrderResponseDto.model_validate(order) for order in orders],
+            next_cursor=next_cursor
+        )
 
     def delete_order(self, order_id: int) -> OrderResponseDto:
         """Elimina lógicamente un pedido."""
@@ -134,25 +269,51 @@ class OrderUseCases:
     def update_order_status(self, order_id: int, status_dto: UpdateOrderStatusDto) -> OrderResponseDto:
         """
         Actualiza el estado, notas y método de pago de un pedido existente.
+        Solo modifica la fila del pedido: la respuesta trae el pedido con cliente, tienda y estado,
+        pero sin detalles (`details` va vacío; para verlos usar GET /orders/{id}).
+        Lanza ConflictException si se envió expected_updated_at y el pedido cambió desde entonces.
         """
-        # 1. Recuperar el pedido por su ID
-        order_to_update = self.repository.get_by_id(order_id)
-        if not order_to_update or not order_to_update.is_active():
-            raise NotFoundException(f"Pedido con ID {order_id} no encontrado o eliminado.")
-
-        # 2. Validar que el nuevo estado de pedido existe y está activo
+        # 1. Validar que el nuevo estado de pedido existe y está activo
         new_status = self.order_status_repo.get_by_id(status_dto.order_status_id)
         if not new_status or not new_status.is_active():
             raise NotFoundException(f"Estado de pedido con ID {status_dto.order_status_id} no encontrado o eliminado.")
-        
-        # 3. Actualizar el modelo de dominio con los nuevos datos
-        order_to_update.order_status_id = status_dto.order_status_id
-        if status_dto.notes is not None:
-            order_to_update.notes = status_dto.notes
-        if status_dto.payment_method is not None:
-            order_to_update.payment_method = status_dto.payment_method
-        
-        # 4. Guardar los cambios a través del repositorio
-        updated_order = self.repository.save(order_to_update)
-        
-        return OrderResponseDto.model_validate(updated_order)
\ No newline at end of file
+
+        # 2. Bloquear la fila del pedido y actualizarla con un UPDATE ... RETURNING
+        updated_order = self.repository.update_status(
+            order_id,
+            status_dto.order_status_id,
+            notes=status_dto.notes,
+            payment_method=status_dto.payment_method,
+            expected_updated_at=status_dto.expected_updated_at
+        )
+        if not updated_order:
+            raise NotFoundException(f"Pedido con ID {order_id} no encontrado o eliminado.")
+
+        # 3. Enriquecer la respuesta: tienda y estado salen de la caché de referencia, el cliente por su PK
+        updated_order.status = new_status
+        updated_order.store = self.store_repo.get_by_id(updated_order.store_id)
+        updated_order.customer = self.customer_repo.get_by_id(updated_order.customer_id)
+        return OrderResponseDto.model_validate(updated_order)
+
+    def update_orders_status(self, bulk_dto: BulkUpdateOrderStatusDto) -> BulkUpdateOrderStatusResponseDto:
+        """
+        Cambia el estado de varios pedidos a la vez: valida el estado una sola vez y aplica un único UPDATE.
+        Devuelve el resultado por pedido; los que no existen o están eliminados se reportan sin cancelar el resto.
+        """
+        new_status = self.order_status_repo.get_by_id(bulk_dto.order_status_id)
+        if not new_status or not new_status.is_active():
+            raise NotFoundException(f"Estado de pedido con ID {bulk_dto.order_status_id} no encontrado o eliminado.")
+
+        order_ids = list(dict.fromkeys(bulk_dto.order_ids))  # Sin duplicados, respetando el orden recibido
+        updated_ids = set(self.repository.update_status_many(order_ids, bulk_dto.order_status_id, bulk_dto.notes))
+
+        results = [
+            OrderStatusResultDto(order_id=order_id, success=True) if order_id in updated_ids
+            else OrderStatusResultDto(order_id=order_id, success=False, detail=f"Pedido con ID {order_id} no encontrado o eliminado.")
+            for order_id in order_ids
+        ]
+        return BulkUpdateOrderStatusResponseDto(
+            order_status_id=bulk_dto.order_status_id,
+            updated_count=len(updated_ids),
+            results=results
+        )
\ No newline at end of file
@@ -70,8 +70,7 @@ class OrderDetailUseCases:
     def get_order_details_by_order_id(self, order_id: int) -> List[OrderDetailResponseDto]:
         """Recupera todos los detalles de pedido para un ID de pedido dado."""
         details = self.repository.get_all_by_order_id(order_id)
-        active_details = [d for d in details if d.is_active()]
-        return [OrderDetailResponseDto.model_validate(detail) for detail in active_details]
+        return [OrderDetailResponseDto.model_validate(detail) for detail in details]
 
     def delete_order_detail(self, detail_id: int) -> OrderDetailResponseDto:
         """Elimina lógicamente un detalle de pedido."""
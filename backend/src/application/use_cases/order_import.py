@@ -0,0 +1,148 @@
+# src/application/use_cases/order_import.py
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, List, Tuple
+from pydantic import ValidationError
+
+from src.domain.models.order import Order
+from src.domain.models.order_detail import OrderDetail, OrderDetailExtraOption
+from src.domain.models.order_import import OrderImportReferences, OrderImportRow
+from src.application.ports.order_import import OrderImportRepository
+from src.application.dtos.order_import import (
+    ImportOrderDto, OrderImportErrorDto, OrderImportResultDto, ORDER_IMPORT_BATCH_SIZE, MAX_IMPORT_ORDERS
+)
+from src.application.exceptions import InvalidInputException
+
+class OrderImportUseCases:
+    """
+    Casos de uso para importar pedidos en bloque (pedidos históricos o tomados sin conexión).
+    Las referencias se validan contra conjuntos de IDs cargados una sola vez y los pedidos
+    se insertan por lotes, sin pasar por create_order pedido a pedido.
+    """
+    def __init__(self, repository: OrderImportRepository, batch_size: int = ORDER_IMPORT_BATCH_SIZE):
+        self.repository = repository
+        self.batch_size = batch_size
+
+    def _validation_message(self, error: ValidationError) -> str:
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first["loc"])
+        extra = f" (y {error.error_count() - 1} errores más)" if error.error_count() > 1 else ""
+        return f"{location}: {first['msg']}{extra}"
+
+    def _check_references(self, order_dto: ImportOrderDto, refs: OrderImportReferences) -> None:
+        """Valida en memoria que cliente, tienda, estado, productos y extras existan y estén activos."""
+        if order_dto.customer_id not in refs.customer_ids:
+            raise ValueError(f"Cliente con ID {order_dto.customer_id} no encontrado o eliminado.")
+        if order_dto.store_id not in refs.store_ids:
+            raise ValueError(f"Tienda con ID {order_dto.store_id} no encontrada o eliminada.")
+        if order_dto.order_status_id not in refs.order_status_ids:
+            raise ValueError(f"Estado de pedido con ID {order_dto.order_status_id} no encontrado o eliminado.")
+        for detail_dto in order_dto.details:
+            if detail_dto.product_id not in refs.product_ids:
+                raise ValueError(f"Producto con ID {detail_dto.product_id} no encontrado o eliminado en el detalle.")
+            extra_ids = [eo_dto.extra_option_id for eo_dto in detail_dto.extra_options]
+            for extra_option_id in extra_ids:
+                if extra_option_id not in refs.extra_option_ids:
+                    raise ValueError(f"Opción extra con ID {extra_option_id} no encontrada o eliminada.")
+            if len(set(extra_ids)) != len(extra_ids):
+                raise ValueError(f"Opción extra repetida en un detalle del producto {detail_dto.product_id}.")
+
+    def _to_domain(self, order_dto: ImportOrderDto, imported_at: datetime) -> Order:
+        return Order(
+            customer_id=order_dto.customer_id,
+            store_id=order_dto.store_id,
+            order_status_id=order_dto.order_status_id,
+            total_amount=order_dto.total_amount,
+            profit_margin=order_dto.profit_margin,
+            discount_applied=order_dto.discount_applied,
+            final_amount=order_dto.final_amount,
+            payment_method=order_dto.payment_method,
+            shipping_address=order_dto.shipping_address,
+            notes=order_dto.notes,
+            created_at=order_dto.created_at or imported_at,
+            details=[
+                OrderDetail(
+                    order_id=0, # Se asigna al insertar el lote
+                    product_id=detail_dto.product_id,
+                    height=detail_dto.height,
+                    width=detail_dto.width,
+                    quantity=detail_dto.quantity,
+                    linear_meter=detail_dto.linear_meter,
+                    subtotal=detail_dto.subtotal,
+                    total_extra_options=detail_dto.total_extra_options,
+                    extra_options=[
+                        OrderDetailExtraOption(
+                            extra_option_id=eo_dto.extra_option_id,
+                            quantity=eo_dto.quantity,
+                            linear_meter=eo_dto.linear_meter,
+                            width=eo_dto.width,
+                            giga_select=eo_dto.giga_select
+                        ) for eo_dto in detail_dto.extra_options
+                    ]
+                ) for detail_dto in order_dto.details
+            ]
+        )
+
+    def _insert_batch(self, batch: List[Tuple[OrderImportRow, Order]], result: OrderImportResultDto) -> None:
+        """
+        Inserta el lote en una transacción. Si la base lo rechaza, se reintenta pedido a pedido
+        para reportar solo las filas que fallan.
+        """
+        try:
+            result.order_ids.extend(self.repository.insert_orders([order for _, order in batch]))
+            return
+        except Exception:
+            if len(batch) == 1:
+                raise
+        for item in batch:
+            try:
+                self._insert_batch([item], result)
+            except Exception as e:
+                row, _ = item
+                result.errors.append(OrderImportErrorDto(row=row.row, ref=row.ref, message=f"Error al insertar: {e}"))
+
+    def import_orders(self, rows: Iterable[OrderImportRow], dry_run: bool = False) -> OrderImportResultDto:
+        """
+        Valida e inserta los pedidos leídos del archivo. Los pedidos con errores se reportan
+        por fila y no impiden importar los demás. Con dry_run solo se valida.
+        El límite de pedidos se comprueba antes de insertar el primer lote: un archivo demasiado
+        grande se rechaza entero en lugar de dejar lotes confirmados a medias.
+        """
+        rows = list(islice(rows, MAX_IMPORT_ORDERS + 1))
+        if len(rows) > MAX_IMPORT_ORDERS:
+            raise InvalidInputException(f"La importación admite como máximo {MAX_IMPORT_ORDERS} pedidos por archivo.")
+
+        refs = self.repository.get_references()
+        imported_at = datetime.now()
+        result = OrderImportResultDto(total=0, imported=0, failed=0, dry_run=dry_run)
+        batch: List[Tuple[OrderImportRow, Order]] = []
+
+        for row in rows:
+            result.total += 1
+            if row.error is not None:
+                result.errors.append(OrderImportErrorDto(row=row.row, ref=row.ref, message=row.error))
+                continue
+            try:
+                order_dto = ImportOrderDto.model_validate(row.data)
+                self._check_references(order_dto, refs)
+            except ValidationError as e:
+                result.errors.append(OrderImportErrorDto(row=row.row, ref=row.ref, message=self._validation_message(e)))
+                continue
+            except ValueError as e:
+                result.errors.append(OrderImportErrorDto(row=row.row, ref=row.ref, message=str(e)))
+                continue
+
+            if dry_run:
+                continue
+            batch.append((row, self._to_domain(order_dto, imported_at)))
+            if len(batch) >= self.batch_size:
+                self._insert_batch(batch, result)
+                batch = []
+
+        if batch:
+            self._insert_batch(batch, result)
+
+        result.errors.sort(key=lambda error: error.row)
+        result.failed = len(result.errors)
+        result.imported = len(result.order_ids)
+        return result
@@ -39,8 +39,7 @@ class OrderStatusUseCases:
     def get_all_order_statuses(self, skip: int = 0, limit: int = 100) -> List[OrderStatusResponseDto]:
         """Recupera todos los estados de pedido activos paginados."""
         statuses = self.repository.get_all(skip, limit)
-        active_statuses = [s for s in statuses if s.is_active()]
-        return [OrderStatusResponseDto.model_validate(status) for status in active_statuses]
+        return [OrderStatusResponseDto.model_validate(status) for status in statuses]
 
     def update_order_status(self, status_id: int, status_dto: UpdateOrderStatusDto) -> OrderStatusResponseDto:
         """Actualiza un estado de pedido existente."""
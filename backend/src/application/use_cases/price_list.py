@@ -0,0 +1,30 @@
+# src/application/use_cases/price_list.py
+from src.application.ports.price_list import PriceListRepository
+from src.application.ports.type_client import TypeClientRepository
+from src.application.dtos.price_list import PriceListDto, PriceListEntryDto
+from src.application.exceptions import NotFoundException
+
+class PriceListUseCases:
+    """
+    Casos de uso para consultar la lista de precios por tipo de cliente.
+    """
+    def __init__(self, repository: PriceListRepository, type_client_repo: TypeClientRepository):
+        self.repository = repository
+        self.type_client_repo = type_client_repo
+
+    def get_price_list(self, type_client_id: int) -> PriceListDto:
+        """Lista de precios de un tipo de cliente; si aún no se generó (p. ej. tras migrar), se genera ahora."""
+        type_client = self.type_client_repo.get_by_id(type_client_id)
+        if not type_client or not type_client.is_active():
+            raise NotFoundException(f"Tipo de cliente con ID {type_client_id} no encontrado o eliminado.")
+
+        entries = self.repository.get_by_type_client(type_client_id)
+        if not entries and self.repository.rebuild(type_client_id=type_client_id):
+            entries = self.repository.get_by_type_client(type_client_id)
+
+        return PriceListDto(
+            type_client_id=type_client.id,
+            code=type_client.code,
+            margin=type_client.margin,
+            items=[PriceListEntryDto.model_validate(entry) for entry in entries]
+        )
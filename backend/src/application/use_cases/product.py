@@ -6,6 +6,7 @@ from src.domain.models.extra_option import ExtraOption
 from src.application.ports.product import ProductRepository
 from src.application.ports.product_type import ProductTypeRepository # Necesario para buscar ProductTypes
 from src.application.ports.extra_option import ExtraOptionRepository # Necesario para buscar ExtraOptions
+from src.application.ports.price_list import PriceListRepository
 from src.application.dtos.product import CreateProductDto, UpdateProductDto, ProductResponseDto
 from src.application.exceptions import NotFoundException, ConflictException
 from datetime import datetime
@@ -18,11 +19,18 @@ class ProductUseCases:
         self,
         product_repository: ProductRepository,
         product_type_repository: ProductTypeRepository,
-        extra_option_repository: ExtraOptionRepository
+        extra_option_repository: ExtraOptionRepository,
+        price_list_repository: Optional[PriceListRepository] = None
     ):
         self.product_repository = product_repository
         self.product_type_repository = product_type_repository
         self.extra_option_repository = extra_option_repository
+        self.price_list_repository = price_list_repository
+
+    def _refresh_price_list(self, product_id: int) -> None:
+        """Regenera los precios del producto en la lista de cada tipo de cliente."""
+        if self.price_list_repository is not None:
+            self.price_list_repository.rebuild(product_id=product_id)
 
     def create_product(self, product_dto: CreateProductDto) -> ProductResponseDto:
         """Crea un nuevo producto y asocia sus tipos y opciones extra."""
@@ -43,6 +51,7 @@ class ProductUseCases:
         )
         # El repositorio guarda el producto base y le asigna un ID si es nuevo
         created_product = self.product_repository.save(new_product)
+        self._refresh_price_list(created_product.id)
 
         # 2. Asociar Tipos de Producto
         if product_dto.product_type_ids:
@@ -77,11 +86,14 @@ class ProductUseCases:
             raise NotFoundException(f"Producto con ID {product_id} no encontrado o eliminado.")
         return ProductResponseDto.model_validate(product)
 
+    def get_products_version(self) -> str:
+        """Versión actual del catálogo de productos, para validar cachés del cliente (ETag)."""
+        return self.product_repository.get_version()
+
     def get_all_products(self, skip: int = 0, limit: int = 100) -> List[ProductResponseDto]:
         """Recupera todos los productos activos paginados, incluyendo sus relaciones."""
         products = self.product_repository.get_all(skip, limit)
-        active_products = [p for p in products if p.is_active()]
-        return [ProductResponseDto.model_validate(product) for product in active_products]
+        return [ProductResponseDto.model_validate(product) for product in products]
 
     def update_product(self, product_id: int, product_dto: UpdateProductDto) -> ProductResponseDto:
         """Actualiza un producto existente y sus relaciones."""
@@ -103,6 +115,8 @@ class ProductUseCases:
         
         # Guardar cambios base
         updated_product = self.product_repository.save(existing_product)
+        if 'price' in update_data or 'name' in update_data:
+            self._refresh_price_list(product_id)
 
         # 2. Actualizar Tipos de Producto si se proporcionaron IDs
         if product_dto.product_type_ids is not None: # Usar 'is not None' para diferenciar de lista vacía
@@ -135,4 +149,5 @@ class ProductUseCases:
         product_to_delete.mark_as_deleted()
         
         deleted_product = self.product_repository.save(product_to_delete)
+        self._refresh_price_list(product_id)
         return ProductResponseDto.model_validate(deleted_product)
\ No newline at end of file
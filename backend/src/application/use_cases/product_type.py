@@ -35,11 +35,14 @@ class ProductTypeUseCases:
             raise NotFoundException(f"Tipo de producto con ID {product_type_id} no encontrado o eliminado.")
         return ProductTypeResponseDto.model_validate(product_type)
 
+    def get_product_types_version(self) -> str:
+        """Versión actual de los tipos de producto, para validar cachés del cliente (ETag)."""
+        return self.repository.get_version()
+
     def get_all_product_types(self, skip: int = 0, limit: int = 100) -> List[ProductTypeResponseDto]:
         """Recupera todos los tipos de producto activos paginados."""
         product_types = self.repository.get_all(skip, limit)
-        active_product_types = [pt for pt in product_types if pt.is_active()]
-        return [ProductTypeResponseDto.model_validate(product_type) for product_type in active_product_types]
+        return [ProductTypeResponseDto.model_validate(product_type) for product_type in product_types]
 
     def update_product_type(self, product_type_id: int, product_type_dto: UpdateProductTypeDto) -> ProductTypeResponseDto:
         """Actualiza un tipo de producto existente."""
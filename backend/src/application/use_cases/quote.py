@@ -0,0 +1,149 @@
+# src/application/use_cases/quote.py
+from typing import List
+from src.application.ports.customer import CustomerRepository
+from src.application.ports.type_client import TypeClientRepository
+from src.application.ports.product import ProductRepository
+from src.application.ports.extra_option import ExtraOptionRepository
+from src.application.dtos.quote import (
+    QuoteRequestDto, QuoteLineDto, QuoteLinePriceDto, QuotePriceDto,
+    BatchQuoteRequestDto, BatchQuotePriceDto, QuoteTotalsDto
+)
+from src.application.exceptions import NotFoundException, InvalidInputException
+from src.domain.models.type_client import TypeClient
+from src.domain.services.pricing import ExtraOptionPriceInput, LinePriceInput, price_quote
+from src.domain.services.pricing_batch import price_lines_batch
+
+# Tope al listar los tipos de cliente para una simulación (son pocos, es solo un límite de seguridad)
+MAX_TYPE_CLIENTS = 100
+
+class QuoteUseCases:
+    """
+    Casos de uso para cotizar en el servidor: los montos salen de los precios del catálogo
+    y del margen del tipo de cliente, no de lo que calcule el frontend.
+    """
+    def __init__(
+        self,
+        customer_repo: CustomerRepository,
+        type_client_repo: TypeClientRepository,
+        product_repo: ProductRepository,
+        extra_option_repo: ExtraOptionRepository
+    ):
+        self.customer_repo = customer_repo
+        self.type_client_repo = type_client_repo
+        self.product_repo = product_repo
+        self.extra_option_repo = extra_option_repo
+
+    def _get_type_client(self, quote_dto: QuoteRequestDto) -> TypeClient:
+        type_client_id = quote_dto.type_client_id
+        if quote_dto.customer_id is not None:
+            customer = self.customer_repo.get_by_id(quote_dto.customer_id)
+            if not customer or not customer.is_active():
+                raise NotFoundException(f"Cliente con ID {quote_dto.customer_id} no encontrado o eliminado.")
+            type_client_id = customer.type_client_id
+
+        type_client = self.type_client_repo.get_by_id(type_client_id)
+        if not type_client or not type_client.is_active():
+            raise NotFoundException(f"Tipo de cliente con ID {type_client_id} no encontrado o eliminado.")
+        return type_client
+
+    def _build_lines(self, line_dtos: List[QuoteLineDto]) -> List[LinePriceInput]:
+        """Valida productos y extras (una consulta por tabla) y arma las entradas del motor de precios."""
+        products = {p.id: p for p in self.product_repo.get_many_by_ids(
+            [line.product_id for line in line_dtos]
+        )}
+        extra_options = {eo.id: eo for eo in self.extra_option_repo.get_many_by_ids(
+            [eo.extra_option_id for line in line_dtos for eo in line.extra_options]
+        )}
+
+        lines = []
+        for line_dto in line_dtos:
+            product = products.get(line_dto.product_id)
+            if not product or not product.is_active():
+                raise NotFoundException(f"Producto con ID {line_dto.product_id} no encontrado o eliminado.")
+
+            extras = []
+            for eo_dto in line_dto.extra_options:
+                extra_option = extra_options.get(eo_dto.extra_option_id)
+                if not extra_option or not extra_option.is_active():
+                    raise NotFoundException(f"Opción extra con ID {eo_dto.extra_option_id} no encontrada o eliminada.")
+                extras.append(ExtraOptionPriceInput(
+                    extra_option_id=extra_option.id,
+                    price=float(extra_option.price),
+                    quantity=eo_dto.quantity,
+                    linear_meter=eo_dto.linear_meter,
+                    width=eo_dto.width
+                ))
+
+            lines.append(LinePriceInput(
+                product_id=product.id,
+                price=float(product.price),
+                quantity=line_dto.quantity,
+                linear_meter=line_dto.linear_meter,
+                width=line_dto.width,
+                extra_options=extras
+            ))
+        return lines
+
+    def price_quote(self, quote_dto: QuoteRequestDto) -> QuotePriceDto:
+        """Calcula subtotales, extras, margen, IGV y monto final de una cotización."""
+        type_client = self._get_type_client(quote_dto)
+        lines = self._build_lines(quote_dto.lines)
+
+        margin = float(type_client.margin)
+        try:
+            quote = price_quote(lines, margin, quote_dto.discount_applied)
+        except ValueError as e:
+            raise InvalidInputException(str(e))
+
+        return QuotePriceDto(
+            type_client_id=type_client.id,
+            margin=margin,
+            lines=[QuoteLinePriceDto.model_validate(line) for line in quote.lines],
+            total_amount=quote.total_amount,
+            profit_margin=quote.profit_margin,
+            discount_applied=quote.discount_applied,
+            final_amount=quote.final_amount,
+            igv=quote.igv
+        )
+
+    def price_quote_batch(self, batch_dto: BatchQuoteRequestDto) -> BatchQuotePriceDto:
+        """
+        Cotiza todas las líneas con el margen de cada tipo de cliente pedido (o de todos los activos)
+        usando el motor vectorizado; devuelve el resultado en columnas.
+        """
+        if batch_dto.type_client_ids:
+            type_clients = []
+            for type_client_id in dict.fromkeys(batch_dto.type_client_ids):
+                type_client = self.type_client_repo.get_by_id(type_client_id)
+                if not type_client or not type_client.is_active():
+                    raise NotFoundException(f"Tipo de cliente con ID {type_client_id} no encontrado o eliminado.")
+                type_clients.append(type_client)
+        else:
+            type_clients = [tc for tc in self.type_client_repo.get_all(0, MAX_TYPE_CLIENTS) if tc.is_active()]
+            if not type_clients:
+                raise NotFoundException("No hay tipos de cliente activos para simular.")
+
+        lines = self._build_lines(batch_dto.lines)
+        try:
+            batch = price_lines_batch(lines, [float(tc.margin) for tc in type_clients], batch_dto.discount_applied)
+        except ValueError as e:
+            raise InvalidInputException(str(e))
+
+        return BatchQuotePriceDto(
+            product_ids=[line.product_id for line in lines],
+            subtotals=batch.subtotals.tolist(),
+            total_extra_options=batch.total_extra_options.tolist(),
+            line_totals=batch.line_totals.tolist(),
+            line_final=batch.line_final.tolist(),
+            totals=[
+                QuoteTotalsDto(
+                    type_client_id=type_client.id,
+                    margin=float(batch.margins[j]),
+                    total_amount=float(batch.total_amount[j]),
+                    profit_margin=float(batch.profit_margin[j]),
+                    discount_applied=batch.discount_applied,
+                    final_amount=float(batch.final_amount[j]),
+                    igv=float(batch.igv[j])
+                ) for j, type_client in enumerate(type_clients)
+            ]
+        )
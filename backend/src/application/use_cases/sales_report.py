@@ -0,0 +1,30 @@
+# src/application/use_cases/sales_report.py
+from typing import List
+from datetime import datetime, time, timedelta
+from src.application.ports.sales_report import SalesReportRepository
+from src.application.dtos.sales_report import SalesReportFilterDto, SalesReportRowDto
+from src.application.exceptions import InvalidInputException
+
+class SalesReportUseCases:
+    """
+    Casos de uso para los reportes agregados de ventas.
+    """
+    def __init__(self, repository: SalesReportRepository):
+        self.repository = repository
+
+    def get_sales_summary(self, filter_dto: SalesReportFilterDto) -> List[SalesReportRowDto]:
+        """Obtiene el resumen de ventas agrupado según el filtro (rango de fechas inclusive)."""
+        if filter_dto.start_date and filter_dto.end_date and filter_dto.start_date > filter_dto.end_date:
+            raise InvalidInputException("start_date no puede ser mayor que end_date.")
+
+        start = datetime.combine(filter_dto.start_date, time.min) if filter_dto.start_date else None
+        end = datetime.combine(filter_dto.end_date + timedelta(days=1), time.min) if filter_dto.end_date else None
+
+        rows = self.repository.get_sales_summary(
+            filter_dto.group_by,
+            start=start,
+            end=end,
+            store_id=filter_dto.store_id,
+            order_status_id=filter_dto.order_status_id
+        )
+        return [SalesReportRowDto.model_validate(row) for row in rows]
@@ -52,9 +52,7 @@ class StoreUseCases:
     def get_all_stores(self, skip: int = 0, limit: int = 100) -> List[StoreResponseDto]:
         """Recupera todas las tiendas activas paginadas."""
         stores = self.repository.get_all(skip, limit)
-        # Filtrar solo las tiendas activas si el repositorio trae también las eliminadas lógicamente
-        active_stores = [s for s in stores if s.is_active()]
-        return [StoreResponseDto.model_validate(store) for store in active_stores] # <-- CAMBIO AQUÍ
+        return [StoreResponseDto.model_validate(store) for store in stores]
 
     def update_store(self, store_id: int, store_dto: UpdateStoreDto) -> StoreResponseDto:
         """Actualiza una tienda existente."""
@@ -2,6 +2,7 @@
 from typing import List, Optional
 from src.domain.models.type_client import TypeClient
 from src.application.ports.type_client import TypeClientRepository
+from src.application.ports.price_list import PriceListRepository
 from src.application.dtos.type_client import CreateTypeClientDto, UpdateTypeClientDto, TypeClientResponseDto
 from src.application.exceptions import NotFoundException, ConflictException
 from datetime import datetime
@@ -10,8 +11,14 @@ class TypeClientUseCases:
     """
     Casos de uso para la gestión de Tipos de Cliente.
     """
-    def __init__(self, repository: TypeClientRepository):
+    def __init__(self, repository: TypeClientRepository, price_list_repository: Optional[PriceListRepository] = None):
         self.repository = repository
+        self.price_list_repository = price_list_repository
+
+    def _refresh_price_list(self, type_client_id: int) -> None:
+        """Regenera la lista de precios del tipo de cliente (todos los productos y extras)."""
+        if self.price_list_repository is not None:
+            self.price_list_repository.rebuild(type_client_id=type_client_id)
 
     def create_type_client(self, type_client_dto: CreateTypeClientDto) -> TypeClientResponseDto:
         """Crea un nuevo tipo de cliente."""
@@ -30,6 +37,7 @@ class TypeClientUseCases:
         )
         
         created_type_client = self.repository.save(new_type_client)
+        self._refresh_price_list(created_type_client.id)
         
         # Usar model_validate para la conversión a DTO de respuesta
         return TypeClientResponseDto.model_validate(created_type_client)
@@ -41,11 +49,14 @@ class TypeClientUseCases:
             raise NotFoundException(f"Tipo de cliente con ID {type_client_id} no encontrado o eliminado.")
         return TypeClientResponseDto.model_validate(type_client)
 
+    def get_type_clients_version(self) -> str:
+        """Versión actual de los tipos de cliente, para validar cachés del cliente (ETag)."""
+        return self.repository.get_version()
+
     def get_all_type_clients(self, skip: int = 0, limit: int = 100) -> List[TypeClientResponseDto]:
         """Recupera todos los tipos de cliente activos paginados."""
         type_clients = self.repository.get_all(skip, limit)
-        active_type_clients = [tc for tc in type_clients if tc.is_active()]
-        return [TypeClientResponseDto.model_validate(type_client) for type_client in active_type_clients]
+        return [TypeClientResponseDto.model_validate(type_client) for type_client in type_clients]
 
     def update_type_client(self, type_client_id: int, type_client_dto: UpdateTypeClientDto) -> TypeClientResponseDto:
         """Actualiza un tipo de cliente existente."""
@@ -66,6 +77,8 @@ class TypeClientUseCases:
         existing_type_client.update(**update_data) # Usa el método 'update' definido en el dominio
 
         updated_type_client = self.repository.save(existing_type_client)
+        if 'margin' in update_data:
+            self._refresh_price_list(type_client_id)
         return TypeClientResponseDto.model_validate(updated_type_client)
 
     def delete_type_client(self, type_client_id: int) -> TypeClientResponseDto:
@@ -77,4 +90,5 @@ class TypeClientUseCases:
         type_client_to_delete.mark_as_deleted()
         
         deleted_type_client = self.repository.save(type_client_to_delete)
+        self._refresh_price_list(type_client_id)
         return TypeClientResponseDto.model_validate(deleted_type_client)
\ No newline at end of file
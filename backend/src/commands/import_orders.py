@@ -0,0 +1,48 @@
+# src/commands/import_orders.py
+"""
+Importa pedidos en bloque desde un archivo NDJSON o CSV (pedidos históricos o tomados sin conexión).
+Uso: python -m src.commands.import_orders pedidos.csv [--format csv|ndjson] [--dry-run]
+El formato se deduce de la extensión si no se indica.
+"""
+import argparse
+
+from src.infrastructure.database.database import SessionLocal
+# Registra los modelos relacionados con los pedidos en el mapper de SQLAlchemy
+from src.infrastructure.persistence.models import (  # noqa: F401
+    type_client, customer, store, order_status, product_type, extra_option, product, order, order_detail
+)
+from src.infrastructure.persistence.repositories.order_import import SQLAlchemyOrderImportRepository
+from src.application.use_cases.order_import import OrderImportUseCases
+from src.application.exceptions import InvalidInputException
+from src.services.order_import.order_import_reader import read_csv, read_ndjson
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa pedidos desde NDJSON o CSV.")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["ndjson", "csv"])
+    parser.add_argument("--dry-run", action="store_true", help="Solo valida, no inserta.")
+    args = parser.parse_args()
+
+    file_format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    reader = read_csv if file_format == "csv" else read_ndjson
+
+    db = SessionLocal()
+    try:
+        # newline="" para que el lector CSV maneje los saltos de línea dentro de celdas
+        with open(args.path, encoding="utf-8-sig", newline="") as f:
+            result = OrderImportUseCases(SQLAlchemyOrderImportRepository(db)).import_orders(reader(f), dry_run=args.dry_run)
+    except InvalidInputException as e:
+        raise SystemExit(e.message)
+    finally:
+        db.close()
+
+    for error in result.errors:
+        ref = f" [{error.ref}]" if error.ref else ""
+        print(f"Fila {error.row}{ref}: {error.message}")
+    action = "validados" if result.dry_run else "importados"
+    print(f"Pedidos leídos: {result.total}, {action}: {result.total - result.failed if result.dry_run else result.imported}, con errores: {result.failed}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+# src/commands/purge_idempotency_keys.py
+"""
+Elimina las claves de idempotencia ('idempotency_keys') más antiguas que IDEMPOTENCY_KEY_RETENTION_HOURS.
+Pensado para ejecutarse periódicamente (cron).
+Uso: python -m src.commands.purge_idempotency_keys
+"""
+from src.infrastructure.database.database import SessionLocal
+# Registra los modelos relacionados en el mapper de SQLAlchemy
+from src.infrastructure.persistence.models import (  # noqa: F401
+    type_client, customer, store, order_status, product_type, extra_option, product, order, order_detail, idempotency_key
+)
+from src.infrastructure.persistence.repositories.idempotency_key import (
+    IDEMPOTENCY_KEY_RETENTION_HOURS, SQLAlchemyIdempotencyKeyRepository
+)
+
+
+def main():
+    db = SessionLocal()
+    try:
+        deleted = SQLAlchemyIdempotencyKeyRepository(db).purge_expired()
+        print(f"Claves de idempotencia eliminadas (más de {IDEMPOTENCY_KEY_RETENTION_HOURS} h): {deleted}.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# src/commands/rebuild_daily_sales.py
+"""
+Recalcula la tabla de resumen 'daily_sales' desde la tabla de pedidos.
+Uso: python -m src.commands.rebuild_daily_sales
+"""
+from src.infrastructure.database.database import SessionLocal
+# Registra los modelos relacionados con los pedidos en el mapper de SQLAlchemy
+from src.infrastructure.persistence.models import (  # noqa: F401
+    type_client, customer, store, order_status, product_type, extra_option, product, order, order_detail
+)
+from src.infrastructure.persistence.repositories.daily_sales import SQLAlchemyDailySalesRepository
+
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = SQLAlchemyDailySalesRepository(db).rebuild()
+        print(f"Resumen diario de ventas reconstruido: {rows} filas.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
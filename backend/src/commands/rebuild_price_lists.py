@@ -0,0 +1,24 @@
+# src/commands/rebuild_price_lists.py
+"""
+Regenera la lista de precios materializada ('price_list_entries') para todos los tipos de cliente.
+Uso: python -m src.commands.rebuild_price_lists
+"""
+from src.infrastructure.database.database import SessionLocal
+# Registra los modelos del catálogo en el mapper de SQLAlchemy
+from src.infrastructure.persistence.models import (  # noqa: F401
+    type_client, customer, product_type, extra_option, product, price_list_entry
+)
+from src.infrastructure.persistence.repositories.price_list import SQLAlchemyPriceListRepository
+
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = SQLAlchemyPriceListRepository(db).rebuild()
+        print(f"Lista de precios reconstruida: {rows} filas.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
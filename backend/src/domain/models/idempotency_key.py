@@ -0,0 +1,20 @@
+# src/domain/models/idempotency_key.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class IdempotencyKey:
+    """
+    Clave enviada por el cliente en el header Idempotency-Key al crear un pedido.
+    Mientras el pedido se crea queda reservada (sin order_id ni respuesta). El order_id se escribe
+    en la misma transacción que el pedido; la respuesta se guarda después y puede faltar.
+    """
+    key: str
+    request_hash: str
+    order_id: Optional[int] = None
+    response: Optional[dict] = None
+    created_at: Optional[datetime] = None
+
+    def is_completed(self) -> bool:
+        return self.order_id is not None
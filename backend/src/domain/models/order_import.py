@@ -0,0 +1,24 @@
+# src/domain/models/order_import.py
+from dataclasses import dataclass, field
+from typing import Optional, Set
+
+@dataclass
+class OrderImportReferences:
+    """
+    IDs activos del catálogo y de los maestros contra los que se valida una importación de pedidos.
+    Se cargan una sola vez por importación y se consultan en memoria.
+    """
+    customer_ids: Set[int] = field(default_factory=set)
+    store_ids: Set[int] = field(default_factory=set)
+    order_status_ids: Set[int] = field(default_factory=set)
+    product_ids: Set[int] = field(default_factory=set)
+    extra_option_ids: Set[int] = field(default_factory=set)
+
+
+@dataclass
+class OrderImportRow:
+    """Un pedido leído del archivo de importación, todavía sin validar; `error` indica que no se pudo leer."""
+    row: int
+    ref: Optional[str] = None
+    data: Optional[dict] = None
+    error: Optional[str] = None
@@ -0,0 +1,17 @@
+# src/domain/models/order_summary.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class OrderSummary:
+    """
+    Proyección de un pedido para listados: solo los datos que muestra la tabla de pedidos,
+    sin detalles ni relaciones completas.
+    """
+    id: int
+    customer_name: Optional[str]
+    store_name: Optional[str]
+    status_name: Optional[str]
+    final_amount: float
+    created_at: datetime
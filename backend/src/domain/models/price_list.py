@@ -0,0 +1,19 @@
+# src/domain/models/price_list.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Optional
+
+@dataclass
+class PriceListEntry:
+    """
+    Precio de un producto u opción extra para un tipo de cliente, ya con su margen aplicado.
+    `price` es el precio de lista sin IGV y `final_price` el precio con IGV.
+    """
+    type_client_id: int
+    item_type: Literal['product', 'extra_option']
+    item_id: int
+    name: str
+    base_price: float
+    price: float
+    final_price: float
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,18 @@
+# src/domain/models/sales_report.py
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class SalesReportRow:
+    """
+    Fila agregada de ventas para un grupo (tienda, periodo, tipo de cliente o producto).
+    Los montos a nivel de pedido (descuento, ganancia, monto final) no aplican al agrupar por producto.
+    """
+    group_key: str
+    order_count: int
+    total_amount: float
+    group_label: Optional[str] = None
+    discount_applied: Optional[float] = None
+    profit: Optional[float] = None
+    final_amount: Optional[float] = None
+    quantity: Optional[int] = None
@@ -0,0 +1,185 @@
+# src/domain/services/pricing.py
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# Tasa del IGV; los montos de lista no lo incluyen
+IGV_RATE = 0.18
+
+# Reglas de cobro según el ID del producto / opción extra (las mismas que usa el PDF de cotización)
+PRODUCT_AREA_IDS = range(1, 2)          # Largo x Ancho (m²)
+PRODUCT_LINEAR_IDS = range(2, 10)       # Metro lineal
+EXTRA_GIGA_SELECT_IDS = range(1, 3)     # Gigantografía: se muestra la opción elegida
+EXTRA_LINEAR_IDS = range(5, 9)          # Metro lineal
+EXTRA_AREA_IDS = range(10, 14)          # Largo x Ancho (m²)
+EXTRA_FIXED_IDS = range(15, 22)         # Monto fijo, no depende de la cantidad
+
+UNIT = "unit"
+LINEAR = "linear"
+AREA = "area"
+FIXED = "fixed"
+
+
+def product_rule(product_id: Optional[int]) -> str:
+    """Forma de cobro de un producto: por m², por metro lineal o por unidad."""
+    if product_id in PRODUCT_AREA_IDS:
+        return AREA
+    if product_id in PRODUCT_LINEAR_IDS:
+        return LINEAR
+    return UNIT
+
+
+def extra_option_rule(extra_option_id: Optional[int]) -> str:
+    """Forma de cobro de una opción extra: monto fijo, por m², por metro lineal o por unidad."""
+    if extra_option_id in EXTRA_FIXED_IDS:
+        return FIXED
+    if extra_option_id in EXTRA_AREA_IDS:
+        return AREA
+    if extra_option_id in EXTRA_LINEAR_IDS:
+        return LINEAR
+    return UNIT
+
+
+def _round(amount: float) -> float:
+    # Igual que np.round(x, 2) (a céntimos, mitades al par) para que el motor vectorizado dé los mismos montos
+    return round(amount * 100) / 100
+
+
+def _measure(rule: str, linear_meter: Optional[float], width: Optional[float], label: str) -> float:
+    """Factor de medida de la regla; falla si falta la dimensión que la regla necesita."""
+    if rule == AREA:
+        if not linear_meter or not width:
+            raise ValueError(f"{label} se cobra por m²: se requieren largo (linear_meter) y ancho (width).")
+        return linear_meter * width
+    if rule == LINEAR:
+        if not linear_meter:
+            raise ValueError(f"{label} se cobra por metro lineal: se requiere linear_meter.")
+        return linear_meter
+    return 1.0
+
+
+def price_extra_option(
+    extra_option_id: int,
+    price: float,
+    quantity: float,
+    linear_meter: Optional[float] = None,
+    width: Optional[float] = None
+) -> float:
+    """Importe de una opción extra dentro de una línea."""
+    rule = extra_option_rule(extra_option_id)
+    if rule == FIXED:
+        return _round(price)
+    return _round(price * quantity * _measure(rule, linear_meter, width, f"La opción extra {extra_option_id}"))
+
+
+def price_product(
+    product_id: int,
+    price: float,
+    quantity: float,
+    linear_meter: Optional[float] = None,
+    width: Optional[float] = None
+) -> float:
+    """Subtotal del producto de una línea, sin extras."""
+    rule = product_rule(product_id)
+    return _round(price * quantity * _measure(rule, linear_meter, width, f"El producto {product_id}"))
+
+
+def list_price(price: float, margin: float) -> float:
+    """Precio de lista de una unidad para un margen: el mismo total_amount que daría price_quote."""
+    return _round(price + _round(price * margin))
+
+
+def with_igv(amount: float) -> float:
+    """Monto con IGV incluido."""
+    return _round(amount * (1 + IGV_RATE))
+
+
+@dataclass
+class ExtraOptionPriceInput:
+    extra_option_id: int
+    price: float
+    quantity: float
+    linear_meter: Optional[float] = None
+    width: Optional[float] = None
+
+
+@dataclass
+class LinePriceInput:
+    product_id: int
+    price: float
+    quantity: int
+    linear_meter: Optional[float] = None
+    width: Optional[float] = None
+    extra_options: List[ExtraOptionPriceInput] = field(default_factory=list)
+
+
+@dataclass
+class ExtraOptionPrice:
+    extra_option_id: int
+    rule: str
+    amount: float
+
+
+@dataclass
+class LinePrice:
+    product_id: int
+    rule: str
+    subtotal: float
+    total_extra_options: float
+    total: float
+    extra_options: List[ExtraOptionPrice] = field(default_factory=list)
+
+
+@dataclass
+class QuotePrice:
+    lines: List[LinePrice]
+    total_amount: float
+    profit_margin: float
+    discount_applied: float
+    final_amount: float
+    igv: float
+
+
+def price_line(line: LinePriceInput) -> LinePrice:
+    """Calcula subtotal, total de extras y total de una línea de cotización."""
+    extras = [
+        ExtraOptionPrice(
+            extra_option_id=eo.extra_option_id,
+            rule=extra_option_rule(eo.extra_option_id),
+            amount=price_extra_option(eo.extra_option_id, eo.price, eo.quantity, eo.linear_meter, eo.width)
+        ) for eo in line.extra_options
+    ]
+    subtotal = price_product(line.product_id, line.price, line.quantity, line.linear_meter, line.width)
+    total_extra_options = _round(sum(eo.amount for eo in extras))
+    return LinePrice(
+        product_id=line.product_id,
+        rule=product_rule(line.product_id),
+        subtotal=subtotal,
+        total_extra_options=total_extra_options,
+        total=_round(subtotal + total_extra_options),
+        extra_options=extras
+    )
+
+
+def price_quote(lines: List[LinePriceInput], margin: float, discount: float = 0.0) -> QuotePrice:
+    """
+    Totales de una cotización a partir de sus líneas y del margen del tipo de cliente.
+    - profit_margin = suma de líneas x margen
+    - total_amount (gravado) = suma de líneas + profit_margin - descuento
+    - final_amount = total_amount + IGV
+    """
+    priced = [price_line(line) for line in lines]
+    lines_total = _round(sum(line.total for line in priced))
+    profit_margin = _round(lines_total * margin)
+    if discount > lines_total + profit_margin:
+        raise ValueError("El descuento no puede ser mayor que el monto de la cotización.")
+
+    total_amount = _round(lines_total + profit_margin - discount)
+    final_amount = with_igv(total_amount)
+    return QuotePrice(
+        lines=priced,
+        total_amount=total_amount,
+        profit_margin=profit_margin,
+        discount_applied=_round(discount),
+        final_amount=final_amount,
+        igv=_round(final_amount - total_amount)
+    )
@@ -0,0 +1,112 @@
+# src/domain/services/pricing_batch.py
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+from src.domain.services.pricing import (
+    IGV_RATE, PRODUCT_AREA_IDS, PRODUCT_LINEAR_IDS, EXTRA_AREA_IDS, EXTRA_LINEAR_IDS, EXTRA_FIXED_IDS,
+    LinePriceInput
+)
+
+# Códigos de regla en los arreglos (equivalen a UNIT, LINEAR, AREA y FIXED de pricing.py)
+_UNIT, _LINEAR, _AREA, _FIXED = 0, 1, 2, 3
+
+
+@dataclass
+class BatchQuotePrice:
+    """
+    Resultado de cotizar N líneas con M márgenes a la vez.
+    Los arreglos por línea tienen forma (N,), los de totales (M,) y `line_final` (N, M):
+    precio final (margen + IGV, sin descuento) de cada línea con cada margen.
+    """
+    margins: np.ndarray
+    subtotals: np.ndarray
+    total_extra_options: np.ndarray
+    line_totals: np.ndarray
+    line_final: np.ndarray
+    total_amount: np.ndarray
+    profit_margin: np.ndarray
+    discount_applied: float
+    final_amount: np.ndarray
+    igv: np.ndarray
+
+
+def _in_range(ids: np.ndarray, ids_range: range) -> np.ndarray:
+    return (ids >= ids_range.start) & (ids < ids_range.stop)
+
+
+def _rule_codes(ids: np.ndarray, area_ids: range, linear_ids: range, fixed_ids: range = range(0)) -> np.ndarray:
+    """Código de regla por ID, con la misma precedencia que product_rule / extra_option_rule."""
+    codes = np.full(ids.shape, _UNIT, dtype=np.int8)
+    codes[_in_range(ids, linear_ids)] = _LINEAR
+    codes[_in_range(ids, area_ids)] = _AREA
+    codes[_in_range(ids, fixed_ids)] = _FIXED
+    return codes
+
+
+def _measures(codes: np.ndarray, linear_meter: np.ndarray, width: np.ndarray, ids: np.ndarray, label: str) -> np.ndarray:
+    """Factor de medida por fila (m², metros o 1); las medidas ausentes llegan como 0."""
+    missing = ((codes == _AREA) & ((linear_meter <= 0) | (width <= 0))) | ((codes == _LINEAR) & (linear_meter <= 0))
+    if missing.any():
+        row = int(np.argmax(missing))
+        raise ValueError(f"{label} {int(ids[row])} requiere medidas (linear_meter/width) según su forma de cobro.")
+    return np.where(codes == _AREA, linear_meter * width, np.where(codes == _LINEAR, linear_meter, 1.0))
+
+
+def price_lines_batch(lines: List[LinePriceInput], margins: Sequence[float], discount: float = 0.0) -> BatchQuotePrice:
+    """
+    Versión vectorizada de price_quote: mismas reglas y redondeo a céntimos, pero calcula todas
+    las líneas y todos los márgenes con operaciones sobre arreglos en lugar de un bucle por línea y por margen.
+    Las extras se aplanan en arreglos paralelos con el índice de su línea y se suman con bincount.
+    """
+    n = len(lines)
+    margins = np.asarray(margins, dtype=np.float64)
+
+    product_ids = np.fromiter((line.product_id for line in lines), dtype=np.int64, count=n)
+    prices = np.fromiter((line.price for line in lines), dtype=np.float64, count=n)
+    quantities = np.fromiter((line.quantity for line in lines), dtype=np.float64, count=n)
+    linear_meters = np.fromiter((line.linear_meter or 0.0 for line in lines), dtype=np.float64, count=n)
+    widths = np.fromiter((line.width or 0.0 for line in lines), dtype=np.float64, count=n)
+
+    product_codes = _rule_codes(product_ids, PRODUCT_AREA_IDS, PRODUCT_LINEAR_IDS)
+    subtotals = np.round(prices * quantities * _measures(product_codes, linear_meters, widths, product_ids, "El producto"), 2)
+
+    extras = [(idx, eo) for idx, line in enumerate(lines) for eo in line.extra_options]
+    if extras:
+        k = len(extras)
+        line_index = np.fromiter((idx for idx, _ in extras), dtype=np.int64, count=k)
+        extra_ids = np.fromiter((eo.extra_option_id for _, eo in extras), dtype=np.int64, count=k)
+        extra_prices = np.fromiter((eo.price for _, eo in extras), dtype=np.float64, count=k)
+        extra_quantities = np.fromiter((eo.quantity for _, eo in extras), dtype=np.float64, count=k)
+        extra_linear = np.fromiter((eo.linear_meter or 0.0 for _, eo in extras), dtype=np.float64, count=k)
+        extra_widths = np.fromiter((eo.width or 0.0 for _, eo in extras), dtype=np.float64, count=k)
+
+        extra_codes = _rule_codes(extra_ids, EXTRA_AREA_IDS, EXTRA_LINEAR_IDS, EXTRA_FIXED_IDS)
+        extra_measures = _measures(extra_codes, extra_linear, extra_widths, extra_ids, "La opción extra")
+        amounts = np.round(np.where(extra_codes == _FIXED, extra_prices, extra_prices * extra_quantities * extra_measures), 2)
+        total_extra_options = np.round(np.bincount(line_index, weights=amounts, minlength=n), 2)
+    else:
+        total_extra_options = np.zeros(n)
+
+    line_totals = np.round(subtotals + total_extra_options, 2)
+    lines_total = round(float(line_totals.sum()), 2)
+
+    profit_margin = np.round(lines_total * margins, 2)
+    if (discount > lines_total + profit_margin).any():
+        raise ValueError("El descuento no puede ser mayor que el monto de la cotización.")
+    total_amount = np.round(lines_total + profit_margin - discount, 2)
+    final_amount = np.round(total_amount * (1 + IGV_RATE), 2)
+
+    return BatchQuotePrice(
+        margins=margins,
+        subtotals=subtotals,
+        total_extra_options=total_extra_options,
+        line_totals=line_totals,
+        line_final=np.round(np.outer(line_totals, 1 + margins) * (1 + IGV_RATE), 2),
+        total_amount=total_amount,
+        profit_margin=profit_margin,
+        discount_applied=round(discount, 2),
+        final_amount=final_amount,
+        igv=np.round(final_amount - total_amount, 2)
+    )
@@ -0,0 +1,24 @@
+# src/infrastructure/api/conditional.py
+import hashlib
+from typing import Optional
+
+# El navegador guarda la respuesta pero la revalida siempre con If-None-Match
+CATALOG_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts) -> str:
+    """ETag débil a partir de la versión de los datos y los parámetros que afectan la respuesta."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de If-None-Match (ignora el prefijo W/ y acepta '*')."""
+    if not if_none_match:
+        return False
+    target = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == target:
+            return True
+    return False
@@ -7,6 +7,10 @@ from . import product
 from . import customer
 from . import order_status
 from . import order
+from . import report
+from . import cache
+from . import quote
+from . import price_list
 
 api_router = APIRouter()
 api_router.include_router(store.router)
@@ -16,4 +20,8 @@ api_router.include_router(extra_option.router)
 api_router.include_router(product.router)
 api_router.include_router(customer.router)
 api_router.include_router(order_status.router)
-api_router.include_router(order.router)
\ No newline at end of file
+api_router.include_router(order.router)
+api_router.include_router(report.router)
+api_router.include_router(cache.router)
+api_router.include_router(quote.router)
+api_router.include_router(price_list.router)
\ No newline at end of file
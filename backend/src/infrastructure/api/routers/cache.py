@@ -0,0 +1,29 @@
+# src/infrastructure/api/routers/cache.py
+from fastapi import APIRouter
+
+from src.infrastructure.cache.catalog import catalog_cache
+from src.infrastructure.cache.reference import reference_cache
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+@router.get("/catalog")
+def get_catalog_cache_stats():
+    """
+    Estado del caché de catálogo de este proceso: aciertos, fallos, cargas, invalidaciones y tamaño.
+    """
+    return catalog_cache.stats()
+
+@router.post("/catalog/invalidate")
+def invalidate_catalog_cache():
+    """
+    Descarta el catálogo cacheado (p. ej. tras editar productos directamente en la base de datos).
+    """
+    catalog_cache.invalidate()
+    return catalog_cache.stats()
+
+@router.get("/reference")
+def get_reference_cache_stats():
+    """
+    Estado del caché de tablas de referencia (estados de pedido, tipos de cliente, tiendas) de este proceso.
+    """
+    return reference_cache.stats()
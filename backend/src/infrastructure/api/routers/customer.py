@@ -1,21 +1,21 @@
 # src/infrastructure/api/routers/customer.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from src.infrastructure.database.database import get_db
-from src.application.dtos.customer import CreateCustomerDto, UpdateCustomerDto, CustomerResponseDto
+from src.application.dtos.customer import CreateCustomerDto, UpdateCustomerDto, CustomerResponseDto, CustomerPageDto
 from src.application.use_cases.customer import CustomerUseCases
 from src.infrastructure.persistence.repositories.customer import SQLAlchemyCustomerRepository
-from src.infrastructure.persistence.repositories.type_client import SQLAlchemyTypeClientRepository # Necesario para los casos de uso
-from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
+from src.infrastructure.cache.reference import CachedTypeClientRepository # Necesario para los casos de uso
+from src.application.exceptions import NotFoundException, ConflictException, ApplicationException, InvalidInputException
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 
 # Dependencia para obtener una instancia de CustomerUseCases
 def get_customer_use_cases(db: Session = Depends(get_db)) -> CustomerUseCases:
     customer_repo = SQLAlchemyCustomerRepository(db)
-    type_client_repo = SQLAlchemyTypeClientRepository(db)
+    type_client_repo = CachedTypeClientRepository(db)
     return CustomerUseCases(customer_repo, type_client_repo)
 
 @router.post("/", response_model=CustomerResponseDto, status_code=status.HTTP_201_CREATED)
@@ -32,6 +32,19 @@ def create_customer(
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al crear cliente: {e}")
 
+@router.get("/page", response_model=CustomerPageDto)
+def get_customers_page(
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    use_cases: CustomerUseCases = Depends(get_customer_use_cases)
+):
+    try:
+        return use_cases.get_customers_page(cursor, limit)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener clientes: {e}")
+
 @router.get("/{customer_id}", response_model=CustomerResponseDto)
 def get_customer(
     customer_id: int,
@@ -1,20 +1,22 @@
 # src/infrastructure/api/routers/extra_option.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from src.infrastructure.database.database import get_db
+from src.infrastructure.api.conditional import CATALOG_CACHE_CONTROL, etag_matches, make_etag
 from src.application.dtos.extra_option import CreateExtraOptionDto, UpdateExtraOptionDto, ExtraOptionResponseDto
 from src.application.use_cases.extra_option import ExtraOptionUseCases
-from src.infrastructure.persistence.repositories.extra_option import SQLAlchemyExtraOptionRepository
+from src.infrastructure.cache.catalog import CachedExtraOptionRepository
+from src.infrastructure.persistence.repositories.price_list import SQLAlchemyPriceListRepository
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
 
 router = APIRouter(prefix="/extra_options", tags=["Extra Options"])
 
 # Dependencia para obtener una instancia de ExtraOptionUseCases
 def get_extra_option_use_cases(db: Session = Depends(get_db)) -> ExtraOptionUseCases:
-    repository = SQLAlchemyExtraOptionRepository(db)
-    return ExtraOptionUseCases(repository)
+    repository = CachedExtraOptionRepository(db)
+    return ExtraOptionUseCases(repository, SQLAlchemyPriceListRepository(db))
 
 @router.post("/", response_model=ExtraOptionResponseDto, status_code=status.HTTP_201_CREATED)
 def create_extra_option(
@@ -42,11 +44,18 @@ def get_extra_option(
 
 @router.get("/", response_model=List[ExtraOptionResponseDto])
 def get_all_extra_options(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
     use_cases: ExtraOptionUseCases = Depends(get_extra_option_use_cases)
 ):
     try:
+        etag = make_etag("extra_options", use_cases.get_extra_options_version(), skip, limit)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
         return use_cases.get_all_extra_options(skip, limit)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener opciones extra: {e}")
@@ -1,33 +1,43 @@
 # src/infrastructure/api/routers/order.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse # Necesario para devolver el PDF
+from fastapi import APIRouter, Depends, HTTPException, Header, Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse # Necesario para devolver el PDF
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel, Field, ValidationError # Necesario para definir DTOs si no están en otro archivo
 from io import BytesIO # Necesario para manejar el buffer del PDF
+from datetime import date
 
 
 # Importa las dependencias necesarias
-from src.application.dtos.pdf_generation import AngularCartItemDto
-from src.infrastructure.database.database import get_db
-from src.application.dtos.order import CreateOrderDto, OrderResponseDto, UpdateOrderStatusDto
+from src.application.dtos.pdf_generation import AngularCartItemDto, BatchPdfExportDto
+from src.infrastructure.database.database import get_db, SessionLocal
+from src.application.dtos.order import (
+    CreateOrderDto, OrderResponseDto, OrderPageDto, OrderSummaryDto, UpdateOrderStatusDto,
+    BulkUpdateOrderStatusDto, BulkUpdateOrderStatusResponseDto
+)
 from src.application.use_cases.order import OrderUseCases
+from src.application.use_cases.order_import import OrderImportUseCases
+from src.application.dtos.order_import import OrderImportFormat, OrderImportResultDto
 from src.infrastructure.persistence.repositories.order import SQLAlchemyOrderRepository
 from src.infrastructure.persistence.repositories.customer import SQLAlchemyCustomerRepository
-from src.infrastructure.persistence.repositories.store import SQLAlchemyStoreRepository
-from src.infrastructure.persistence.repositories.order_status import SQLAlchemyOrderStatusRepository
-from src.infrastructure.persistence.repositories.product import SQLAlchemyProductRepository
-from src.infrastructure.persistence.repositories.extra_option import SQLAlchemyExtraOptionRepository
-from src.application.exceptions import NotFoundException, ConflictException
+from src.infrastructure.persistence.repositories.idempotency_key import SQLAlchemyIdempotencyKeyRepository
+from src.infrastructure.persistence.repositories.order_import import SQLAlchemyOrderImportRepository
+from src.infrastructure.cache.catalog import CachedProductRepository, CachedExtraOptionRepository
+from src.infrastructure.cache.reference import CachedStoreRepository, CachedOrderStatusRepository
+from src.application.exceptions import NotFoundException, ConflictException, InvalidInputException, ServiceUnavailableException
 
 # Importa el servicio de generación de PDF
-from src.services.order_pdf.pdf_generator import generate_order_pdf
+from src.services.order_pdf.pdf_executor import pdf_render_executor
+from src.services.order_pdf.pdf_cache import compute_pdf_cache_key, pdf_disk_cache
+from src.services.order_pdf.pdf_batch import PDF_BATCH_MAX_ORDERS, stream_orders_pdf_zip
 from src.services.order_pdf.pdf_generator import (
     DisplayCartItemSchema,
     DisplayProductExtraOptionSchema,
     MyCartDetailExtraOptionSchema # Aunque no se usa directamente en el endpoint, es parte del esquema
 )
 from src.services.order_report.generate_orders_excel import generate_orders_csv
+from src.services.order_import.order_import_reader import read_csv, read_ndjson
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
@@ -35,10 +45,10 @@ router = APIRouter(prefix="/orders", tags=["Orders"])
 def get_order_use_cases(db: Session = Depends(get_db)) -> OrderUseCases:
     order_repo = SQLAlchemyOrderRepository(db)
     customer_repo = SQLAlchemyCustomerRepository(db)
-    store_repo = SQLAlchemyStoreRepository(db)
-    order_status_repo = SQLAlchemyOrderStatusRepository(db)
-    product_repo = SQLAlchemyProductRepository(db)
-    extra_option_repo = SQLAlchemyExtraOptionRepository(db)
+    store_repo = CachedStoreRepository(db)
+    order_status_repo = CachedOrderStatusRepository(db)
+    product_repo = CachedProductRepository(db)
+    extra_option_repo = CachedExtraOptionRepository(db)
     
     return OrderUseCases(
         repository=order_repo,
@@ -46,9 +56,25 @@ def get_order_use_cases(db: Session = Depends(get_db)) -> OrderUseCases:
         store_repo=store_repo,
         order_status_repo=order_status_repo,
         product_repo=product_repo,
-        extra_option_repo=extra_option_repo
+        extra_option_repo=extra_option_repo,
+        idempotency_repo=SQLAlchemyIdempotencyKeyRepository(db)
     )
 
+# Dependencia para obtener una instancia de OrderImportUseCases
+def get_order_import_use_cases(db: Session = Depends(get_db)) -> OrderImportUseCases:
+    return OrderImportUseCases(SQLAlchemyOrderImportRepository(db))
+
+def _load_order_for_pdf(order_id: int):
+    """
+    Carga un pedido para el PDF con una sesión propia.
+    Se usa dentro de respuestas en streaming, donde la sesión de la dependencia ya se cerró.
+    """
+    db = SessionLocal()
+    try:
+        return get_order_use_cases(db).get_order_for_pdf(order_id)
+    finally:
+        db.close()
+
 # DTO para el cuerpo de la solicitud del PDF (lo que Angular enviará)
 class GeneratePdfRequest(BaseModel):
     items: List[DisplayCartItemSchema] = Field(..., description="Lista de ítems detallados del carrito para la generación del PDF.")
@@ -57,13 +83,22 @@ class GeneratePdfRequest(BaseModel):
 @router.post("/", response_model=OrderResponseDto, status_code=status.HTTP_201_CREATED)
 def create_order(
     order_dto: CreateOrderDto,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", min_length=1, max_length=100),
     use_cases: OrderUseCases = Depends(get_order_use_cases)
 ):
     """
     Crea un nuevo pedido con sus detalles y opciones extra.
+    Con el header Idempotency-Key, los reintentos devuelven el pedido ya creado
+    (con 'Idempotent-Replayed: true') en lugar de duplicarlo.
     """
     try:
-        return use_cases.create_order(order_dto)
+        if idempotency_key is None:
+            return use_cases.create_order(order_dto)
+        created, replayed = use_cases.create_order_idempotent(order_dto, idempotency_key)
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
+        return created
     except (NotFoundException, ConflictException) as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
@@ -71,6 +106,65 @@ def create_order(
         print(f"Error al crear el pedido: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error interno del servidor al crear el pedido.")
 
+@router.post("/import", response_model=OrderImportResultDto)
+async def import_orders(
+    request: Request,
+    format: OrderImportFormat = 'ndjson',
+    dry_run: bool = False,
+    use_cases: OrderImportUseCases = Depends(get_order_import_use_cases)
+):
+    """
+    Importa pedidos en bloque desde el cuerpo de la solicitud (NDJSON o CSV, UTF-8).
+    Los pedidos con errores se reportan por fila y no impiden importar los demás;
+    con dry_run=true solo se valida. Ver también: python -m src.commands.import_orders
+    """
+    try:
+        text = (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="El archivo debe estar en UTF-8.")
+
+    reader = read_csv if format == 'csv' else read_ndjson
+    try:
+        return await run_in_threadpool(use_cases.import_orders, reader(text.splitlines(keepends=True)), dry_run)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al importar los pedidos: {e}")
+
+@router.get("/summary", response_model=List[OrderSummaryDto])
+def get_order_summaries(
+    skip: int = 0,
+    limit: int = 100,
+    store_id: Optional[int] = None,
+    order_status_id: Optional[int] = None,
+    use_cases: OrderUseCases = Depends(get_order_use_cases)
+):
+    """
+    Obtiene el listado resumido de pedidos activos para la pantalla de pedidos:
+    id, cliente, tienda, estado, monto final y fecha.
+    """
+    try:
+        return use_cases.get_order_summaries(skip, limit, store_id, order_status_id)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener los pedidos: {e}")
+
+@router.get("/page", response_model=OrderPageDto)
+def get_orders_page(
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    use_cases: OrderUseCases = Depends(get_order_use_cases)
+):
+    """
+    Obtiene una página de pedidos activos (más recientes primero) con paginación por cursor.
+    Para la página siguiente se envía el `next_cursor` recibido; es null en la última página.
+    """
+    try:
+        return use_cases.get_orders_page(cursor, limit)
+    except InvalidInputException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener los pedidos: {e}")
+
 @router.get("/{order_id}", response_model=OrderResponseDto)
 def get_order(
     order_id: int,
@@ -90,13 +184,15 @@ def get_order(
 def get_all_orders(
     skip: int = 0,
     limit: int = 100,
+    include_details: bool = True,
     use_cases: OrderUseCases = Depends(get_order_use_cases)
 ):
     """
     Obtiene una lista de todos los pedidos activos.
+    Con include_details=false se devuelven sin detalles (respuesta más liviana para listados).
     """
     try:
-        return use_cases.get_all_orders(skip, limit)
+        return use_cases.get_all_orders(skip, limit, include_details)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener los pedidos: {e}")
 
@@ -109,12 +205,32 @@ def delete_order(
     Elimina lógicamente un pedido por su ID.
     """
     try:
-        return use_cases.delete_order(order_id)
+        deleted_order = use_cases.delete_order(order_id)
+        pdf_disk_cache.invalidate_order(order_id)
+        return deleted_order
     except NotFoundException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al eliminar el pedido: {e}")
     
+@router.patch("/status/bulk", response_model=BulkUpdateOrderStatusResponseDto)
+def update_orders_status(
+    bulk_dto: BulkUpdateOrderStatusDto,
+    use_cases: OrderUseCases = Depends(get_order_use_cases)
+):
+    """
+    Cambia el estado de varios pedidos en una sola operación.
+    Responde con el resultado por pedido (los inexistentes o eliminados se marcan como fallidos).
+    """
+    try:
+        result = use_cases.update_orders_status(bulk_dto)
+        pdf_disk_cache.invalidate_orders([r.order_id for r in result.results if r.success])
+        return result
+    except NotFoundException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al actualizar el estado de los pedidos: {e}")
+
 @router.patch("/{order_id}/status", response_model=OrderResponseDto)
 def update_order_status(
     order_id: int,
@@ -122,27 +238,103 @@ def update_order_status(
     use_cases: OrderUseCases = Depends(get_order_use_cases)
 ):
     """
-    Actualiza el estado de un pedido por su ID.
+    Actualiza el estado de un pedido por su ID. La respuesta trae cliente, tienda y estado, pero no los detalles (`details` vacío).
+    Si se envía expected_updated_at y el pedido fue modificado después, responde 409.
     """
     try:
-        return use_cases.update_order_status(order_id, status_dto)
-    except NotFoundException as e:
+        updated_order = use_cases.update_order_status(order_id, status_dto)
+        pdf_disk_cache.invalidate_order(order_id)
+        return updated_order
+    except (NotFoundException, ConflictException) as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al actualizar el estado del pedido: {e}")
 
+async def _order_pdf_response(order_id: int, order: OrderResponseDto, display_items: List[dict], if_none_match: Optional[str]):
+    """
+    Flujo común de entrega del PDF: caché en disco por contenido (ETag = clave),
+    304 si el cliente ya lo tiene y generación en el pool de procesos si no está cacheado.
+    """
+    cache_key = compute_pdf_cache_key(order, display_items)
+    etag = f'"{cache_key}"'
+    headers = {
+        "Content-Disposition": f"attachment; filename=orden_{order_id}.pdf",
+        "ETag": etag
+    }
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    cached_path = pdf_disk_cache.get(order_id, cache_key)
+    if cached_path:
+        return FileResponse(cached_path, media_type="application/pdf", headers=headers)
+
+    # Generar el PDF en el pool de procesos (no bloquea el event loop) y guardarlo en el caché
+    pdf_bytes = await pdf_render_executor.render_order_pdf(order, display_items)
+    await run_in_threadpool(pdf_disk_cache.put, order_id, cache_key, pdf_bytes)
+
+    return StreamingResponse(BytesIO(pdf_bytes), media_type="application/pdf", headers=headers)
+
+@router.get("/{order_id}/pdf", response_class=StreamingResponse)
+async def get_order_pdf(
+    order_id: int,
+    use_cases: OrderUseCases = Depends(get_order_use_cases),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Genera el PDF de la orden a partir de los datos guardados (detalles + catálogo),
+    sin que el cliente tenga que reenviar los ítems del carrito.
+    """
+    try:
+        order, display_items = await run_in_threadpool(use_cases.get_order_for_pdf, order_id)
+        return await _order_pdf_response(order_id, order, display_items, if_none_match)
+    except NotFoundException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except ServiceUnavailableException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message, headers={"Retry-After": str(e.retry_after)})
+    except Exception as e:
+        print(f"Error al generar el PDF para la orden {order_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {e}")
+
+@router.post("/pdf/batch", response_class=StreamingResponse)
+def export_orders_pdf_zip(
+    export_dto: BatchPdfExportDto,
+    use_cases: OrderUseCases = Depends(get_order_use_cases)
+):
+    """
+    Exporta en un ZIP los PDFs de varios pedidos (por IDs o por rango de fechas y tienda).
+    Los PDFs se generan en paralelo y el ZIP se envía por partes a medida que cada uno termina.
+    """
+    try:
+        order_ids = use_cases.get_order_ids_for_export(export_dto)
+        if not order_ids:
+            raise NotFoundException("No se encontraron pedidos para exportar.")
+        if len(order_ids) > PDF_BATCH_MAX_ORDERS:
+            raise InvalidInputException(f"La exportación supera el máximo de {PDF_BATCH_MAX_ORDERS} pedidos, reduzca el rango.")
+    except (NotFoundException, InvalidInputException) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al preparar la exportación de PDFs: {e}")
+
+    return StreamingResponse(
+        stream_orders_pdf_zip(order_ids, _load_order_for_pdf),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=cotizaciones.zip"}
+    )
+
 @router.post("/{order_id}/generate-pdf", response_class=StreamingResponse)
 async def generate_pdf_for_order(
     order_id: int,
     request_data: List[AngularCartItemDto],  # Cambiado: Angular envía directamente el array
-    use_cases: OrderUseCases = Depends(get_order_use_cases)
+    use_cases: OrderUseCases = Depends(get_order_use_cases),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
-    Genera un PDF de la orden especificada.
+    Genera un PDF de la orden especificada con los ítems enviados por Angular.
+    El resultado se cachea en disco por contenido (orden + ítems); el ETag es la clave del caché.
     """
     try:
-        # 1. Obtener la orden completa
-        order = use_cases.get_order_by_id(order_id)
+        # 1. Obtener la orden completa (la consulta es síncrona, se ejecuta en el threadpool)
+        order = await run_in_threadpool(use_cases.get_order_by_id, order_id)
         if not order:
             raise NotFoundException(f"Order with ID {order_id} not found.")
 
@@ -179,37 +371,43 @@ async def generate_pdf_for_order(
             }
             display_items.append(display_item)
 
-        # 3. Generar el PDF
-        from src.services.order_pdf.pdf_generator import generate_order_pdf
-        pdf_buffer = generate_order_pdf(
-            order=order,
-            display_items=display_items
-        )
-
-        # 4. Devolver el PDF
-        return StreamingResponse(pdf_buffer, media_type="application/pdf", headers={
-            "Content-Disposition": f"attachment; filename=orden_{order_id}.pdf"
-        })
+        # 3. Caché / generación / respuesta
+        return await _order_pdf_response(order_id, order, display_items, if_none_match)
 
     except ValidationError as e:
         print(f"Validation error: {e}")
         raise HTTPException(status_code=422, detail=f"Error de validación: {e}")
     except NotFoundException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
+    except ServiceUnavailableException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message, headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         print(f"Error al generar el PDF para la orden {order_id}: {e}")
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {e}")
 
+def _stream_orders_csv(start_date: Optional[date], end_date: Optional[date], store_id: Optional[int]):
+    """Emite el CSV con una sesión propia que vive mientras dura el streaming."""
+    db = SessionLocal()
+    try:
+        rows = get_order_use_cases(db).iter_orders_report(start_date, end_date, store_id)
+        yield from generate_orders_csv(rows)
+    finally:
+        db.close()
+
 @router.get("/report/csv")
 def download_orders_csv(
-    skip: int = 0,
-    limit: int = 100,
-    use_cases: OrderUseCases = Depends(get_order_use_cases)
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    store_id: Optional[int] = None
 ):
-    orders = use_cases.get_all_orders(skip, limit)
-    csv_buffer = generate_orders_csv(orders)
+    """
+    Descarga el reporte de pedidos activos en CSV, filtrado por rango de fechas (inclusive) y tienda.
+    Se genera por bloques desde un cursor de la base de datos, con memoria constante.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date no puede ser mayor que end_date.")
     return StreamingResponse(
-        csv_buffer,
+        _stream_orders_csv(start_date, end_date, store_id),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=orders_report.csv"}
-    )
\ No newline at end of file
+    )
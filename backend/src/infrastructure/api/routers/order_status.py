@@ -6,14 +6,14 @@ from typing import List
 from src.infrastructure.database.database import get_db
 from src.application.dtos.order_status import CreateOrderStatusDto, UpdateOrderStatusDto, OrderStatusResponseDto
 from src.application.use_cases.order_status import OrderStatusUseCases
-from src.infrastructure.persistence.repositories.order_status import SQLAlchemyOrderStatusRepository
+from src.infrastructure.cache.reference import CachedOrderStatusRepository
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
 
 router = APIRouter(prefix="/order_statuses", tags=["Order Statuses"])
 
 # Dependencia para obtener una instancia de OrderStatusUseCases
 def get_order_status_use_cases(db: Session = Depends(get_db)) -> OrderStatusUseCases:
-    repo = SQLAlchemyOrderStatusRepository(db)
+    repo = CachedOrderStatusRepository(db)
     return OrderStatusUseCases(repo)
 
 @router.post("/", response_model=OrderStatusResponseDto, status_code=status.HTTP_201_CREATED)
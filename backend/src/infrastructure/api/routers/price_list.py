@@ -0,0 +1,29 @@
+# src/infrastructure/api/routers/price_list.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.database import get_db
+from src.application.dtos.price_list import PriceListDto
+from src.application.use_cases.price_list import PriceListUseCases
+from src.infrastructure.persistence.repositories.price_list import SQLAlchemyPriceListRepository
+from src.infrastructure.cache.reference import CachedTypeClientRepository
+from src.application.exceptions import NotFoundException
+
+router = APIRouter(prefix="/price-list", tags=["Price List"])
+
+# Dependencia para obtener una instancia de PriceListUseCases
+def get_price_list_use_cases(db: Session = Depends(get_db)) -> PriceListUseCases:
+    return PriceListUseCases(SQLAlchemyPriceListRepository(db), CachedTypeClientRepository(db))
+
+@router.get("/{type_client_id}", response_model=PriceListDto)
+def get_price_list(type_client_id: int, use_cases: PriceListUseCases = Depends(get_price_list_use_cases)):
+    """
+    Precios finales de todos los productos y opciones extra activos para un tipo de cliente,
+    leídos de la lista materializada (una consulta por índice).
+    """
+    try:
+        return use_cases.get_price_list(type_client_id)
+    except NotFoundException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener la lista de precios: {e}")
@@ -1,24 +1,24 @@
 # src/infrastructure/api/routers/product.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from src.infrastructure.database.database import get_db
+from src.infrastructure.api.conditional import CATALOG_CACHE_CONTROL, etag_matches, make_etag
 from src.application.dtos.product import CreateProductDto, UpdateProductDto, ProductResponseDto
 from src.application.use_cases.product import ProductUseCases
-from src.infrastructure.persistence.repositories.product import SQLAlchemyProductRepository
-from src.infrastructure.persistence.repositories.product_type import SQLAlchemyProductTypeRepository
-from src.infrastructure.persistence.repositories.extra_option import SQLAlchemyExtraOptionRepository
+from src.infrastructure.cache.catalog import CachedProductRepository, CachedProductTypeRepository, CachedExtraOptionRepository
+from src.infrastructure.persistence.repositories.price_list import SQLAlchemyPriceListRepository
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
 # Dependencia para obtener una instancia de ProductUseCases
 def get_product_use_cases(db: Session = Depends(get_db)) -> ProductUseCases:
-    product_repo = SQLAlchemyProductRepository(db)
-    product_type_repo = SQLAlchemyProductTypeRepository(db) # Necesario para los casos de uso
-    extra_option_repo = SQLAlchemyExtraOptionRepository(db) # Necesario para los casos de uso
-    return ProductUseCases(product_repo, product_type_repo, extra_option_repo)
+    product_repo = CachedProductRepository(db)
+    product_type_repo = CachedProductTypeRepository(db) # Necesario para los casos de uso
+    extra_option_repo = CachedExtraOptionRepository(db) # Necesario para los casos de uso
+    return ProductUseCases(product_repo, product_type_repo, extra_option_repo, SQLAlchemyPriceListRepository(db))
 
 @router.post("/", response_model=ProductResponseDto, status_code=status.HTTP_201_CREATED)
 def create_product(
@@ -46,11 +46,21 @@ def get_product(
 
 @router.get("/", response_model=List[ProductResponseDto])
 def get_all_products(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
     use_cases: ProductUseCases = Depends(get_product_use_cases)
 ):
+    """
+    Lista paginada con ETag: si el cliente envía If-None-Match con la versión vigente se responde 304 sin cuerpo.
+    """
     try:
+        etag = make_etag("products", use_cases.get_products_version(), skip, limit)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
         return use_cases.get_all_products(skip, limit)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener productos: {e}")
@@ -1,19 +1,20 @@
 # src/infrastructure/api/routers/product_type.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from src.infrastructure.database.database import get_db
+from src.infrastructure.api.conditional import CATALOG_CACHE_CONTROL, etag_matches, make_etag
 from src.application.dtos.product_type import CreateProductTypeDto, UpdateProductTypeDto, ProductTypeResponseDto
 from src.application.use_cases.product_type import ProductTypeUseCases
-from src.infrastructure.persistence.repositories.product_type import SQLAlchemyProductTypeRepository
+from src.infrastructure.cache.catalog import CachedProductTypeRepository
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
 
 router = APIRouter(prefix="/product_types", tags=["Product Types"])
 
 # Dependencia para obtener una instancia de ProductTypeUseCases
 def get_product_type_use_cases(db: Session = Depends(get_db)) -> ProductTypeUseCases:
-    repository = SQLAlchemyProductTypeRepository(db)
+    repository = CachedProductTypeRepository(db)
     return ProductTypeUseCases(repository)
 
 @router.post("/", response_model=ProductTypeResponseDto, status_code=status.HTTP_201_CREATED)
@@ -42,11 +43,18 @@ def get_product_type(
 
 @router.get("/", response_model=List[ProductTypeResponseDto])
 def get_all_product_types(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
     use_cases: ProductTypeUseCases = Depends(get_product_type_use_cases)
 ):
     try:
+        etag = make_etag("product_types", use_cases.get_product_types_version(), skip, limit)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
         return use_cases.get_all_product_types(skip, limit)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener tipos de producto: {e}")
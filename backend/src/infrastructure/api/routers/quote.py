@@ -0,0 +1,48 @@
+# src/infrastructure/api/routers/quote.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from src.infrastructure.database.database import get_db
+from src.application.dtos.quote import QuoteRequestDto, QuotePriceDto, BatchQuoteRequestDto, BatchQuotePriceDto
+from src.application.use_cases.quote import QuoteUseCases
+from src.infrastructure.persistence.repositories.customer import SQLAlchemyCustomerRepository
+from src.infrastructure.cache.catalog import CachedProductRepository, CachedExtraOptionRepository
+from src.infrastructure.cache.reference import CachedTypeClientRepository
+from src.application.exceptions import NotFoundException, InvalidInputException
+
+router = APIRouter(prefix="/quotes", tags=["Quotes"])
+
+# Dependencia para obtener una instancia de QuoteUseCases
+def get_quote_use_cases(db: Session = Depends(get_db)) -> QuoteUseCases:
+    return QuoteUseCases(
+        customer_repo=SQLAlchemyCustomerRepository(db),
+        type_client_repo=CachedTypeClientRepository(db),
+        product_repo=CachedProductRepository(db),
+        extra_option_repo=CachedExtraOptionRepository(db)
+    )
+
+@router.post("/price", response_model=QuotePriceDto)
+def price_quote(quote_dto: QuoteRequestDto, use_cases: QuoteUseCases = Depends(get_quote_use_cases)):
+    """
+    Cotiza en el servidor: subtotal por línea, total de extras, margen del tipo de cliente,
+    descuento, IGV y monto final, con los precios vigentes del catálogo.
+    """
+    try:
+        return use_cases.price_quote(quote_dto)
+    except (NotFoundException, InvalidInputException) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al cotizar: {e}")
+
+@router.post("/price/batch", response_model=BatchQuotePriceDto)
+def price_quote_batch(batch_dto: BatchQuoteRequestDto, use_cases: QuoteUseCases = Depends(get_quote_use_cases)):
+    """
+    Simulación masiva: cotiza muchas líneas con el margen de varios tipos de cliente a la vez
+    (todos los activos si no se indican) y devuelve una matriz línea x tipo de cliente.
+    """
+    try:
+        return use_cases.price_quote_batch(batch_dto)
+    except (NotFoundException, InvalidInputException) as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al cotizar en lote: {e}")
@@ -0,0 +1,55 @@
+# src/infrastructure/api/routers/report.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import List, Literal, Optional
+from datetime import date
+
+from src.infrastructure.database.database import get_db
+from src.application.dtos.sales_report import SalesReportFilterDto, SalesReportGroupBy, SalesReportRowDto
+from src.application.use_cases.sales_report import SalesReportUseCases
+from src.infrastructure.persistence.repositories.sales_report import SQLAlchemySalesReportRepository
+from src.application.exceptions import InvalidInputException
+from src.services.order_report.generate_sales_report import generate_sales_report_csv
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+# Dependencia para obtener una instancia de SalesReportUseCases
+def get_sales_report_use_cases(db: Session = Depends(get_db)) -> SalesReportUseCases:
+    repository = SQLAlchemySalesReportRepository(db)
+    return SalesReportUseCases(repository)
+
+@router.get("/sales", response_model=List[SalesReportRowDto])
+def get_sales_report(
+    group_by: SalesReportGroupBy = 'store',
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    store_id: Optional[int] = None,
+    order_status_id: Optional[int] = None,
+    format: Literal['json', 'csv'] = 'json',
+    use_cases: SalesReportUseCases = Depends(get_sales_report_use_cases)
+):
+    """
+    Reporte de ventas agregado en la base de datos: cantidad de pedidos, total, descuentos,
+    ganancia y monto final por tienda, día, semana, mes, tipo de cliente o producto.
+    """
+    try:
+        rows = use_cases.get_sales_summary(SalesReportFilterDto(
+            group_by=group_by,
+            start_date=start_date,
+            end_date=end_date,
+            store_id=store_id,
+            order_status_id=order_status_id
+        ))
+    except InvalidInputException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al generar el reporte de ventas: {e}")
+
+    if format == 'csv':
+        return StreamingResponse(
+            generate_sales_report_csv(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": f"attachment; filename=sales_report_{group_by}.csv"}
+        )
+    return rows
@@ -6,14 +6,14 @@ from typing import List
 from src.infrastructure.database.database import get_db
 from src.application.dtos.store import CreateStoreDto, UpdateStoreDto, StoreResponseDto
 from src.application.use_cases.store import StoreUseCases
-from src.infrastructure.persistence.repositories.store import SQLAlchemyStoreRepository
+from src.infrastructure.cache.reference import CachedStoreRepository
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
 
 router = APIRouter(prefix="/stores", tags=["Stores"])
 
 # Dependencia para obtener una instancia de StoreUseCases
 def get_store_use_cases(db: Session = Depends(get_db)) -> StoreUseCases:
-    repository = SQLAlchemyStoreRepository(db)
+    repository = CachedStoreRepository(db)
     return StoreUseCases(repository)
 
 @router.post("/", response_model=StoreResponseDto, status_code=status.HTTP_201_CREATED)
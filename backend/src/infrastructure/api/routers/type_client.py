@@ -1,20 +1,22 @@
 # src/infrastructure/api/routers/type_client.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from src.infrastructure.database.database import get_db
+from src.infrastructure.api.conditional import CATALOG_CACHE_CONTROL, etag_matches, make_etag
 from src.application.dtos.type_client import CreateTypeClientDto, UpdateTypeClientDto, TypeClientResponseDto
 from src.application.use_cases.type_client import TypeClientUseCases
-from src.infrastructure.persistence.repositories.type_client import SQLAlchemyTypeClientRepository
+from src.infrastructure.cache.reference import CachedTypeClientRepository
+from src.infrastructure.persistence.repositories.price_list import SQLAlchemyPriceListRepository
 from src.application.exceptions import NotFoundException, ConflictException, ApplicationException
 
 router = APIRouter(prefix="/type_clients", tags=["Type Clients"])
 
 # Dependencia para obtener una instancia de TypeClientUseCases
 def get_type_client_use_cases(db: Session = Depends(get_db)) -> TypeClientUseCases:
-    repository = SQLAlchemyTypeClientRepository(db)
-    return TypeClientUseCases(repository)
+    repository = CachedTypeClientRepository(db)
+    return TypeClientUseCases(repository, SQLAlchemyPriceListRepository(db))
 
 @router.post("/", response_model=TypeClientResponseDto, status_code=status.HTTP_201_CREATED)
 def create_type_client(
@@ -42,11 +44,18 @@ def get_type_client(
 
 @router.get("/", response_model=List[TypeClientResponseDto])
 def get_all_type_clients(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    if_none_match: Optional[str] = Header(None),
     use_cases: TypeClientUseCases = Depends(get_type_client_use_cases)
 ):
     try:
+        etag = make_etag("type_clients", use_cases.get_type_clients_version(), skip, limit)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
         return use_cases.get_all_type_clients(skip, limit)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error al obtener tipos de cliente: {e}")
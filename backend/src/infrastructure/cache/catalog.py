@@ -0,0 +1,256 @@
+# src/infrastructure/cache/catalog.py
+import copy
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.application.ports.product import ProductRepository
+from src.application.ports.extra_option import ExtraOptionRepository
+from src.application.ports.product_type import ProductTypeRepository
+from src.domain.models.product import Product
+from src.domain.models.extra_option import ExtraOption
+from src.domain.models.product_type import ProductType
+from src.infrastructure.persistence.repositories.product import SQLAlchemyProductRepository
+from src.infrastructure.persistence.repositories.extra_option import SQLAlchemyExtraOptionRepository
+from src.infrastructure.persistence.repositories.product_type import SQLAlchemyProductTypeRepository
+from src.infrastructure.cache.snapshot import active_page, find_by
+
+# Segundos que un snapshot del catálogo se considera vigente
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))
+
+
+@dataclass
+class CatalogSnapshot:
+    """Copia completa del catálogo (incluye registros eliminados, igual que get_by_id en la base)."""
+    products: Dict[int, Product] = field(default_factory=dict)
+    extra_options: Dict[int, ExtraOption] = field(default_factory=dict)
+    product_types: Dict[int, ProductType] = field(default_factory=dict)
+    loaded_at: float = 0.0
+    # Versión de las tablas del catálogo en la base, leída antes que los datos
+    version: str = ""
+
+
+def load_catalog_version(db: Session) -> str:
+    """Versión conjunta de productos, opciones extra y tipos de producto (contador 'catalog', una consulta)."""
+    return SQLAlchemyProductRepository(db).get_version()
+
+
+def load_catalog_snapshot(db: Session) -> CatalogSnapshot:
+    """
+    Lee el catálogo completo: la versión y luego cuatro consultas (productos con sus relaciones, opciones extra, tipos).
+    La versión se lee primero, así los datos nunca son más antiguos que la versión con la que se publican.
+    """
+    version = load_catalog_version(db)
+    return CatalogSnapshot(
+        version=version,
+        products={p.id: p for p in SQLAlchemyProductRepository(db).load_all()},
+        extra_options={eo.id: eo for eo in SQLAlchemyExtraOptionRepository(db).load_all()},
+        product_types={pt.id: pt for pt in SQLAlchemyProductTypeRepository(db).load_all()},
+        loaded_at=time.monotonic()
+    )
+
+
+class CatalogCache:
+    """
+    Caché en memoria del proceso para productos, opciones extra y tipos de producto.
+    Se carga el catálogo completo de una vez y se reutiliza hasta que vence el TTL o se invalida.
+    Cada worker tiene su propio caché: las escrituras invalidan el del proceso que las atiende
+    y el TTL acota cuánto puede tardar en verse un cambio en los demás.
+    """
+    def __init__(self, ttl: float = CATALOG_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        # Se incrementa en cada invalidación; una carga que empezó antes no se publica
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    def _is_fresh(self, snapshot: Optional[CatalogSnapshot]) -> bool:
+        return snapshot is not None and time.monotonic() - snapshot.loaded_at < self.ttl
+
+    def get_snapshot(self, loader: Callable[[], CatalogSnapshot]) -> CatalogSnapshot:
+        return self._get(self._is_fresh, loader)
+
+    def get_snapshot_at(self, version: str, loader: Callable[[], CatalogSnapshot]) -> CatalogSnapshot:
+        """
+        Snapshot de la versión indicada (la vigente en la base): si el del proceso es de otra versión
+        se recarga aunque no haya vencido el TTL, porque otro worker pudo haber escrito.
+        El TTL se sigue respetando para cubrir cambios hechos fuera de los repositorios (sin versión).
+        """
+        return self._get(lambda snapshot: self._is_fresh(snapshot) and snapshot.version == version, loader)
+
+    def _get(self, is_current: Callable[[Optional[CatalogSnapshot]], bool],
+             loader: Callable[[], CatalogSnapshot]) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if is_current(snapshot):
+            self.hits += 1
+            return snapshot
+
+        with self._lock:
+            # Otro hilo pudo haberlo cargado mientras se esperaba el lock
+            snapshot = self._snapshot
+            if is_current(snapshot):
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            generation = self._generation
+            snapshot = loader()
+            self.loads += 1
+            if generation == self._generation:
+                self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        lookups = self.hits + self.misses
+        return {
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+            "loaded": snapshot is not None,
+            "age_seconds": round(time.monotonic() - snapshot.loaded_at, 1) if snapshot else None,
+            "products": len(snapshot.products) if snapshot else 0,
+            "extra_options": len(snapshot.extra_options) if snapshot else 0,
+            "product_types": len(snapshot.product_types) if snapshot else 0,
+        }
+
+
+catalog_cache = CatalogCache()
+
+
+class _CachedCatalogRepository:
+    """
+    Base de los repositorios con caché: las lecturas salen del snapshot y las escrituras
+    se delegan al repositorio SQLAlchemy e invalidan el caché.
+    Se devuelven copias para que los casos de uso puedan modificar el objeto sin tocar el snapshot.
+    """
+    def __init__(self, db: Session, cache: CatalogCache):
+        self.db = db
+        self.cache = cache
+
+    def _snapshot(self) -> CatalogSnapshot:
+        return self.cache.get_snapshot(lambda: load_catalog_snapshot(self.db))
+
+    def get_version(self) -> str:
+        """
+        Versión conjunta del catálogo, leída siempre de la base para que sea la misma en todos los workers.
+        Antes de devolverla se alinea el snapshot del proceso con esa versión: así el ETag nunca
+        anuncia datos más nuevos que el cuerpo que sale del caché.
+        """
+        snapshot = self.cache.get_snapshot_at(load_catalog_version(self.db), lambda: load_catalog_snapshot(self.db))
+        return snapshot.version
+
+    def _write(self, result):
+        self.cache.invalidate()
+        return result
+
+
+class CachedProductRepository(_CachedCatalogRepository, ProductRepository):
+    def __init__(self, db: Session, cache: CatalogCache = catalog_cache):
+        super().__init__(db, cache)
+        self.inner = SQLAlchemyProductRepository(db)
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        product = self._snapshot().products.get(product_id)
+        return copy.copy(product) if product else None
+
+    def get_many_by_ids(self, product_ids: List[int]) -> List[Product]:
+        products = self._snapshot().products
+        return [copy.copy(products[pid]) for pid in set(product_ids) if pid in products]
+
+    def get_by_sku(self, sku: str) -> Optional[Product]:
+        return find_by(self._snapshot().products, "sku", sku)
+
+    def get_by_name(self, name: str) -> Optional[Product]:
+        return find_by(self._snapshot().products, "name", name)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+        return active_page(self._snapshot().products, skip, limit)
+
+    def save(self, product: Product) -> Product:
+        return self._write(self.inner.save(product))
+
+    def delete(self, product_id: int) -> Optional[Product]:
+        return self._write(self.inner.delete(product_id))
+
+    def add_product_types(self, product: Product, product_types: List[ProductType]) -> Product:
+        return self._write(self.inner.add_product_types(product, product_types))
+
+    def set_product_types(self, product: Product, product_types: List[ProductType]) -> Product:
+        return self._write(self.inner.set_product_types(product, product_types))
+
+    def remove_product_types(self, product: Product, product_type_ids: List[int]) -> Product:
+        return self._write(self.inner.remove_product_types(product, product_type_ids))
+
+    def add_extra_options(self, product: Product, extra_options: List[ExtraOption]) -> Product:
+        return self._write(self.inner.add_extra_options(product, extra_options))
+
+    def set_extra_options(self, product: Product, extra_options: List[ExtraOption]) -> Product:
+        return self._write(self.inner.set_extra_options(product, extra_options))
+
+    def remove_extra_options(self, product: Product, extra_option_ids: List[int]) -> Product:
+        return self._write(self.inner.remove_extra_options(product, extra_option_ids))
+
+
+class CachedExtraOptionRepository(_CachedCatalogRepository, ExtraOptionRepository):
+    def __init__(self, db: Session, cache: CatalogCache = catalog_cache):
+        super().__init__(db, cache)
+        self.inner = SQLAlchemyExtraOptionRepository(db)
+
+    def get_by_id(self, extra_option_id: int) -> Optional[ExtraOption]:
+        extra_option = self._snapshot().extra_options.get(extra_option_id)
+        return copy.copy(extra_option) if extra_option else None
+
+    def get_many_by_ids(self, extra_option_ids: List[int]) -> List[ExtraOption]:
+        extra_options = self._snapshot().extra_options
+        return [copy.copy(extra_options[eid]) for eid in set(extra_option_ids) if eid in extra_options]
+
+    def get_by_name(self, name: str) -> Optional[ExtraOption]:
+        return find_by(self._snapshot().extra_options, "name", name)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[ExtraOption]:
+        return active_page(self._snapshot().extra_options, skip, limit)
+
+    def save(self, extra_option: ExtraOption) -> ExtraOption:
+        return self._write(self.inner.save(extra_option))
+
+    def delete(self, extra_option_id: int) -> Optional[ExtraOption]:
+        return self._write(self.inner.delete(extra_option_id))
+
+
+class CachedProductTypeRepository(_CachedCatalogRepository, ProductTypeRepository):
+    def __init__(self, db: Session, cache: CatalogCache = catalog_cache):
+        super().__init__(db, cache)
+        self.inner = SQLAlchemyProductTypeRepository(db)
+
+    def get_by_id(self, product_type_id: int) -> Optional[ProductType]:
+        product_type = self._snapshot().product_types.get(product_type_id)
+        return copy.copy(product_type) if product_type else None
+
+    def get_by_name(self, name: str) -> Optional[ProductType]:
+        return find_by(self._snapshot().product_types, "name", name)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[ProductType]:
+        return active_page(self._snapshot().product_types, skip, limit)
+
+    def save(self, product_type: ProductType) -> ProductType:
+        return self._write(self.inner.save(product_type))
+
+    def delete(self, product_type_id: int) -> Optional[ProductType]:
+        return self._write(self.inner.delete(product_type_id))
@@ -0,0 +1,199 @@
+# src/infrastructure/cache/reference.py
+import copy
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional
+
+from sqlalchemy.orm import Session
+
+from src.application.ports.order_status import OrderStatusRepository
+from src.application.ports.type_client import TypeClientRepository
+from src.application.ports.store import StoreRepository
+from src.domain.models.order_status import OrderStatus
+from src.domain.models.type_client import TypeClient
+from src.domain.models.store import Store
+from src.infrastructure.persistence.repositories.order_status import SQLAlchemyOrderStatusRepository
+from src.infrastructure.persistence.repositories.type_client import SQLAlchemyTypeClientRepository
+from src.infrastructure.persistence.repositories.store import SQLAlchemyStoreRepository
+from src.infrastructure.cache.snapshot import active_page, find_by
+
+# Segundos tras los cuales una tabla se vuelve a leer (cubre cambios hechos por otros workers)
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", "600"))
+
+# Tablas cacheadas y cómo leer cada una completa
+REFERENCE_LOADERS: Dict[str, Callable[[Session], list]] = {
+    "order_status": lambda db: SQLAlchemyOrderStatusRepository(db).load_all(),
+    "type_clients": lambda db: SQLAlchemyTypeClientRepository(db).load_all(),
+    "stores": lambda db: SQLAlchemyStoreRepository(db).load_all(),
+}
+
+
+class ReferenceDataCache:
+    """
+    Snapshot inmutable en memoria de las tablas de referencia (estados de pedido, tipos de cliente y tiendas).
+    Se carga al iniciar la aplicación; cada escritura vuelve a leer solo la tabla modificada.
+    Cada tabla se guarda como un mapeo de solo lectura que se reemplaza completo, nunca se modifica.
+    """
+    def __init__(self, ttl: float = REFERENCE_CACHE_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Mapping[int, object]] = {}
+        self._loaded_at: Dict[str, float] = {}
+        # Versión en la base con la que se cargó cada tabla (solo las que exponen versión para ETag)
+        self._versions: Dict[str, Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def load_all(self, db: Session) -> None:
+        for table in REFERENCE_LOADERS:
+            self.refresh(table, db)
+
+    def refresh(self, table: str, db: Session, version: Optional[str] = None) -> Mapping[int, object]:
+        """Relee la tabla. `version` debe leerse antes que los datos, para no publicar datos más antiguos que ella."""
+        rows = MappingProxyType({row.id: row for row in REFERENCE_LOADERS[table](db)})
+        with self._lock:
+            self._tables[table] = rows
+            self._loaded_at[table] = time.monotonic()
+            self._versions[table] = version
+            self.loads += 1
+        return rows
+
+    def version(self, table: str) -> Optional[str]:
+        return self._versions.get(table)
+
+    def table(self, table: str, db: Session) -> Mapping[int, object]:
+        rows = self._tables.get(table)
+        if rows is not None and time.monotonic() - self._loaded_at[table] < self.ttl:
+            self.hits += 1
+            return rows
+        self.misses += 1
+        return self.refresh(table, db)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        lookups = self.hits + self.misses
+        return {
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "loads": self.loads,
+            "tables": {
+                table: {"rows": len(rows), "age_seconds": round(now - self._loaded_at[table], 1)}
+                for table, rows in self._tables.items()
+            },
+        }
+
+
+reference_cache = ReferenceDataCache()
+
+
+class _CachedReferenceRepository:
+    """
+    Base de los repositorios de tablas de referencia: las lecturas salen del snapshot (copias)
+    y las escrituras se delegan al repositorio SQLAlchemy y recargan la tabla.
+    """
+    table_name: str
+
+    def __init__(self, db: Session, inner, cache: ReferenceDataCache):
+        self.db = db
+        self.inner = inner
+        self.cache = cache
+
+    def _rows(self) -> Mapping[int, object]:
+        return self.cache.table(self.table_name, self.db)
+
+    def _get(self, record_id: int):
+        row = self._rows().get(record_id)
+        return copy.copy(row) if row else None
+
+    def _write(self, result):
+        self.cache.refresh(self.table_name, self.db)
+        return result
+
+
+class CachedOrderStatusRepository(_CachedReferenceRepository, OrderStatusRepository):
+    table_name = "order_status"
+
+    def __init__(self, db: Session, cache: ReferenceDataCache = reference_cache):
+        super().__init__(db, SQLAlchemyOrderStatusRepository(db), cache)
+
+    def get_by_id(self, order_status_id: int) -> Optional[OrderStatus]:
+        return self._get(order_status_id)
+
+    def get_by_code(self, code: str) -> Optional[OrderStatus]:
+        return find_by(self._rows(), "code", code)
+
+    def get_by_name(self, name: str) -> Optional[OrderStatus]:
+        return find_by(self._rows(), "name", name)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[OrderStatus]:
+        return active_page(self._rows(), skip, limit)
+
+    def save(self, order_status: OrderStatus) -> OrderStatus:
+        return self._write(self.inner.save(order_status))
+
+    def delete(self, order_status_id: int) -> Optional[OrderStatus]:
+        return self._write(self.inner.delete(order_status_id))
+
+
+class CachedTypeClientRepository(_CachedReferenceRepository, TypeClientRepository):
+    table_name = "type_clients"
+
+    def __init__(self, db: Session, cache: ReferenceDataCache = reference_cache):
+        super().__init__(db, SQLAlchemyTypeClientRepository(db), cache)
+
+    def get_by_id(self, type_client_id: int) -> Optional[TypeClient]:
+        return self._get(type_client_id)
+
+    def get_by_code(self, code: str) -> Optional[TypeClient]:
+        return find_by(self._rows(), "code", code)
+
+    def get_by_name(self, name: str) -> Optional[TypeClient]:
+        return find_by(self._rows(), "name", name)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[TypeClient]:
+        return active_page(self._rows(), skip, limit)
+
+    def get_version(self) -> str:
+        # Siempre desde la base: así la versión es la misma en todos los workers.
+        # Si la tabla en memoria es de otra versión (otro worker escribió) se relee antes de servir,
+        # para que el ETag nunca acompañe un cuerpo más antiguo.
+        version = self.inner.get_version()
+        if self.cache.version(self.table_name) != version:
+            self.cache.refresh(self.table_name, self.db, version=version)
+        return version
+
+    def save(self, type_client: TypeClient) -> TypeClient:
+        return self._write(self.inner.save(type_client))
+
+    def delete(self, type_client_id: int) -> Optional[TypeClient]:
+        return self._write(self.inner.delete(type_client_id))
+
+
+class CachedStoreRepository(_CachedReferenceRepository, StoreRepository):
+    table_name = "stores"
+
+    def __init__(self, db: Session, cache: ReferenceDataCache = reference_cache):
+        super().__init__(db, SQLAlchemyStoreRepository(db), cache)
+
+    def get_by_id(self, store_id: int) -> Optional[Store]:
+        return self._get(store_id)
+
+    def get_by_code(self, code: str) -> Optional[Store]:
+        return find_by(self._rows(), "code", code)
+
+    def get_by_name(self, name: str) -> Optional[Store]:
+        return find_by(self._rows(), "name", name)
+
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[Store]:
+        return active_page(self._rows(), skip, limit)
+
+    def save(self, store: Store) -> Store:
+        return self._write(self.inner.save(store))
+
+    def delete(self, store_id: int) -> Optional[Store]:
+        return self._write(self.inner.delete(store_id))
@@ -0,0 +1,17 @@
+# src/infrastructure/cache/snapshot.py
+import copy
+from typing import Mapping, Optional
+
+
+def active_page(items: Mapping[int, object], skip: int, limit: int) -> list:
+    """Misma semántica que get_all en la base: activos ordenados por id, con offset/limit."""
+    active = [item for _, item in sorted(items.items()) if item.deleted_at is None]
+    return [copy.copy(item) for item in active[skip:skip + limit]]
+
+
+def find_by(items: Mapping[int, object], attribute: str, value) -> Optional[object]:
+    """Primer registro cuyo atributo coincide (incluye eliminados, igual que get_by_name/get_by_code)."""
+    for item in items.values():
+        if getattr(item, attribute) == value:
+            return copy.copy(item)
+    return None
@@ -0,0 +1,23 @@
+# src/infrastructure/persistence/models/catalog_version.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.database import Base
+
+class CatalogVersionORM(Base):
+    """
+    Modelo ORM para la tabla 'catalog_versions'.
+    Contador por grupo de tablas ('catalog': productos, opciones extra y tipos de producto;
+    'type_clients'): cada escritura lo incrementa en su misma transacción y los ETag se derivan de él.
+    """
+    __tablename__ = "catalog_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<CatalogVersionORM(name={self.name}, version={self.version})>"
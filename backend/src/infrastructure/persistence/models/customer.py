@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, func, ForeignKey
+from sqlalchemy import String, DateTime, func, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.database import Base
@@ -11,6 +11,10 @@ class CustomerORM(Base):
     Modelo ORM para la tabla 'customers'.
     """
     __tablename__ = "customers"
+    __table_args__ = (
+        Index("idx_customers_active", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_customers_active_created", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     type_client_id: Mapped[int] = mapped_column(ForeignKey("type_clients.id"), nullable=False)
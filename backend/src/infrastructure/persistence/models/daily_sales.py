@@ -0,0 +1,29 @@
+# src/infrastructure/persistence/models/daily_sales.py
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.database import Base
+
+class DailySalesORM(Base):
+    """
+    Modelo ORM para la tabla 'daily_sales'.
+    Resumen diario de pedidos activos por tienda y estado; se mantiene en la misma
+    transacción que los cambios de pedidos (ver SQLAlchemyDailySalesRepository).
+    """
+    __tablename__ = "daily_sales"
+
+    store_id: Mapped[int] = mapped_column(ForeignKey("stores.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    order_status_id: Mapped[int] = mapped_column(ForeignKey("order_status.id"), primary_key=True)
+    order_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_amount: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    final_amount: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    discount_applied: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    profit: Mapped[float] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<DailySalesORM(store_id={self.store_id}, day={self.day}, order_status_id={self.order_status_id}, order_count={self.order_count})>"
@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/models/extra_option.py (ACTUALIZADO - CORRECCIÓN CIRCULAR IMPORT)
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, DateTime, Numeric, Text, func
+from sqlalchemy import String, DateTime, Numeric, Text, func, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.database import Base
@@ -9,6 +9,9 @@ from src.infrastructure.database.database import Base
 
 class ExtraOptionORM(Base):
     __tablename__ = "extra_options"
+    __table_args__ = (
+        Index("idx_extra_options_active", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -0,0 +1,26 @@
+# src/infrastructure/persistence/models/idempotency_key.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.database import Base
+
+class IdempotencyKeyORM(Base):
+    """
+    Modelo ORM para la tabla 'idempotency_keys'.
+    Guarda, por cada Idempotency-Key de POST /orders/, el hash de la solicitud, el pedido creado
+    y la respuesta original, para devolverla en los reintentos sin volver a crear el pedido.
+    """
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    order_id: Mapped[Optional[int]] = mapped_column(ForeignKey("orders.id"), nullable=True)
+    response: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<IdempotencyKeyORM(key='{self.key}', order_id={self.order_id})>"
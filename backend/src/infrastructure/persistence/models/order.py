@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/models/order.py
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, DateTime, func, ForeignKey, DECIMAL, Text
+from sqlalchemy import String, DateTime, func, ForeignKey, DECIMAL, Text, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.database import Base
@@ -13,6 +13,11 @@ class OrderORM(Base):
     Modelo ORM para la tabla 'orders'.
     """
     __tablename__ = "orders"
+    __table_args__ = (
+        # Índices parciales: los listados filtran deleted_at IS NULL y paginan por id o por cursor (created_at, id)
+        Index("idx_orders_active", "id", postgresql_where=text("deleted_at IS NULL")),
+        Index("idx_orders_active_created", "created_at", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), nullable=False)
@@ -39,7 +44,7 @@ class OrderORM(Base):
     details: Mapped[List['OrderDetailORM']] = relationship( # type: ignore
         back_populates="order",
         cascade="all, delete-orphan", # Para que los detalles se eliminen con el pedido
-        lazy="joined" # Carga los detalles automáticamente al consultar un pedido
+        lazy="select" # Cada consulta indica cómo cargarlos (joinedload/selectinload); así los listados no multiplican filas
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,39 @@
+# src/infrastructure/persistence/models/price_list_entry.py
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, Numeric, String, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.database import Base
+
+class PriceListEntryORM(Base):
+    """
+    Modelo ORM para la tabla 'price_list_entries'.
+    Lista de precios materializada: una fila por producto u opción extra activo y tipo de cliente,
+    con el margen ya aplicado. Se regenera desde los casos de uso de productos, extras y tipos de cliente
+    (ver SQLAlchemyPriceListRepository).
+    """
+    __tablename__ = "price_list_entries"
+    __table_args__ = (
+        CheckConstraint("num_nonnulls(product_id, extra_option_id) = 1", name="price_list_entries_item_check"),
+        Index("idx_price_list_entries_type_client", "type_client_id"),
+        # Una sola fila por ítem y tipo de cliente: las regeneraciones concurrentes no pueden duplicar la lista
+        Index("uq_price_list_entries_product", "type_client_id", "product_id",
+              unique=True, postgresql_where=text("product_id IS NOT NULL")),
+        Index("uq_price_list_entries_extra_option", "type_client_id", "extra_option_id",
+              unique=True, postgresql_where=text("extra_option_id IS NOT NULL")),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    type_client_id: Mapped[int] = mapped_column(ForeignKey("type_clients.id"), nullable=False)
+    product_id: Mapped[Optional[int]] = mapped_column(ForeignKey("products.id"), nullable=True)
+    extra_option_id: Mapped[Optional[int]] = mapped_column(ForeignKey("extra_options.id"), nullable=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    base_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    final_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<PriceListEntryORM(type_client_id={self.type_client_id}, product_id={self.product_id}, extra_option_id={self.extra_option_id}, price={self.price})>"
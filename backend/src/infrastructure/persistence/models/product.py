@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/models/product.py (ACTUALIZADO - CORRECCIÓN CIRCULAR IMPORT)
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, DateTime, Numeric, Text, ForeignKey, Table, Column
+from sqlalchemy import String, DateTime, Numeric, Text, ForeignKey, Table, Column, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import func
 
@@ -27,6 +27,9 @@ product_extra_options_table = Table(
 
 class ProductORM(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        Index("idx_products_active", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     sku: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
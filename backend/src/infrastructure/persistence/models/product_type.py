@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/models/product_type.py (ACTUALIZADO - CORRECCIÓN CIRCULAR IMPORT)
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, DateTime, func, Text
+from sqlalchemy import String, DateTime, func, Text, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.database import Base
@@ -9,6 +9,9 @@ from src.infrastructure.database.database import Base
 
 class ProductTypeORM(Base):
     __tablename__ = "product_types"
+    __table_args__ = (
+        Index("idx_product_types_active", "id", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
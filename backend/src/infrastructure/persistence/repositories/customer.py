@@ -1,7 +1,7 @@
 # src/infrastructure/persistence/repositories/customer.py
-from typing import List, Optional, cast, Literal
+from typing import List, Optional, Tuple, cast, Literal
 from sqlalchemy.orm import Session, selectinload # selectinload para cargar relaciones
-from sqlalchemy import or_ # Para consultas OR
+from sqlalchemy import or_, tuple_ # Para consultas OR y comparación de filas
 from datetime import datetime
 
 from src.application.ports.customer import CustomerRepository
@@ -109,10 +109,19 @@ class SQLAlchemyCustomerRepository(CustomerRepository):
     def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainCustomer]:
         orm_customers = self.db.query(CustomerORM).options(
             selectinload(CustomerORM.type_client)
-        ).offset(skip).limit(limit).all()
+        ).filter(CustomerORM.deleted_at.is_(None)).order_by(CustomerORM.id).offset(skip).limit(limit).all()
         domain_customers = [self._to_domain_model(c) for c in orm_customers]
         return [dc for dc in domain_customers if dc is not None]
 
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[DomainCustomer]:
+        query = self.db.query(CustomerORM).options(
+            selectinload(CustomerORM.type_client)
+        ).filter(CustomerORM.deleted_at.is_(None))
+        if after is not None:
+            query = query.filter(tuple_(CustomerORM.created_at, CustomerORM.id) < tuple_(*after))
+        orm_customers = query.order_by(CustomerORM.created_at.desc(), CustomerORM.id.desc()).limit(limit).all()
+        return [self._to_domain_model(c) for c in orm_customers]
+
     def save(self, customer: DomainCustomer) -> DomainCustomer:
         if customer.id is None:
             # Crear nuevo cliente
@@ -0,0 +1,83 @@
+# src/infrastructure/persistence/repositories/daily_sales.py
+from typing import Iterable
+from sqlalchemy import Date, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models.daily_sales import DailySalesORM
+from src.infrastructure.persistence.models.order import OrderORM
+
+
+class SQLAlchemyDailySalesRepository:
+    """
+    Mantiene la tabla de resumen 'daily_sales'.
+    No hace commit: las operaciones se ejecutan dentro de la transacción del repositorio
+    de pedidos, así el resumen y los pedidos nunca quedan desalineados.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_orders(self, order_ids: Iterable[int], sign: int) -> None:
+        """
+        Suma (sign=1) o resta (sign=-1) al resumen los pedidos indicados, tal como están
+        en la base de datos en este momento. Los pedidos eliminados lógicamente se ignoran.
+        Para un cambio de estado: restar antes de modificar y sumar después del flush.
+        """
+        order_ids = list(order_ids)
+        if not order_ids:
+            return
+
+        day = cast(OrderORM.created_at, Date)
+        source = select(
+            OrderORM.store_id,
+            day.label("day"),
+            OrderORM.order_status_id,
+            (literal(sign) * func.count(OrderORM.id)).label("order_count"),
+            (literal(sign) * func.sum(OrderORM.total_amount)).label("total_amount"),
+            (literal(sign) * func.sum(OrderORM.final_amount)).label("final_amount"),
+            (literal(sign) * func.sum(OrderORM.discount_applied)).label("discount_applied"),
+            (literal(sign) * func.sum(OrderORM.profit_margin)).label("profit"),
+        ).where(
+            OrderORM.id.in_(order_ids),
+            OrderORM.deleted_at.is_(None)
+        ).group_by(OrderORM.store_id, day, OrderORM.order_status_id)
+
+        columns = ["store_id", "day", "order_status_id", "order_count", "total_amount", "final_amount", "discount_applied", "profit"]
+        stmt = insert(DailySalesORM).from_select(columns, source)
+        table = DailySalesORM.__table__
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.store_id, table.c.day, table.c.order_status_id],
+            set_={
+                "order_count": table.c.order_count + stmt.excluded.order_count,
+                "total_amount": table.c.total_amount + stmt.excluded.total_amount,
+                "final_amount": table.c.final_amount + stmt.excluded.final_amount,
+                "discount_applied": table.c.discount_applied + stmt.excluded.discount_applied,
+                "profit": table.c.profit + stmt.excluded.profit,
+                "updated_at": func.now(),
+            }
+        )
+        self.db.execute(stmt)
+
+    def rebuild(self) -> int:
+        """Recalcula todo el resumen desde la tabla de pedidos. Retorna la cantidad de filas generadas."""
+        day = cast(OrderORM.created_at, Date)
+        source = select(
+            OrderORM.store_id,
+            day.label("day"),
+            OrderORM.order_status_id,
+            func.count(OrderORM.id),
+            func.sum(OrderORM.total_amount),
+            func.sum(OrderORM.final_amount),
+            func.sum(OrderORM.discount_applied),
+            func.sum(OrderORM.profit_margin),
+        ).where(
+            OrderORM.deleted_at.is_(None)
+        ).group_by(OrderORM.store_id, day, OrderORM.order_status_id)
+
+        self.db.execute(delete(DailySalesORM))
+        self.db.execute(insert(DailySalesORM).from_select(
+            ["store_id", "day", "order_status_id", "order_count", "total_amount", "final_amount", "discount_applied", "profit"],
+            source
+        ))
+        self.db.commit()
+        return self.db.query(func.count()).select_from(DailySalesORM).scalar()
@@ -6,6 +6,7 @@ from datetime import datetime
 from src.application.ports.extra_option import ExtraOptionRepository
 from src.domain.models.extra_option import ExtraOption as DomainExtraOption # Alias
 from src.infrastructure.persistence.models.extra_option import ExtraOptionORM
+from src.infrastructure.persistence.repositories.table_version import CATALOG_VERSION, commit_with_version, get_table_version
 
 class SQLAlchemyExtraOptionRepository(ExtraOptionRepository):
     """
@@ -47,21 +48,37 @@ class SQLAlchemyExtraOptionRepository(ExtraOptionRepository):
         orm_extra_option = self.db.query(ExtraOptionORM).filter(ExtraOptionORM.id == extra_option_id).first()
         return self._to_domain_model(orm_extra_option)
 
+    def get_many_by_ids(self, extra_option_ids: List[int]) -> List[DomainExtraOption]:
+        if not extra_option_ids:
+            return []
+        orm_extra_options = self.db.query(ExtraOptionORM).filter(ExtraOptionORM.id.in_(set(extra_option_ids))).all()
+        return [self._to_domain_model(orm_option) for orm_option in orm_extra_options]
+
     def get_by_name(self, name: str) -> Optional[DomainExtraOption]:
         orm_extra_option = self.db.query(ExtraOptionORM).filter(ExtraOptionORM.name == name).first()
         return self._to_domain_model(orm_extra_option)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainExtraOption]:
-        orm_extra_options = self.db.query(ExtraOptionORM).offset(skip).limit(limit).all()
+        orm_extra_options = self.db.query(ExtraOptionORM).filter(
+            ExtraOptionORM.deleted_at.is_(None)
+        ).order_by(ExtraOptionORM.id).offset(skip).limit(limit).all()
         domain_extra_options = [self._to_domain_model(orm_option) for orm_option in orm_extra_options]
         return [option for option in domain_extra_options if option is not None]  
 
+    def load_all(self) -> List[DomainExtraOption]:
+        """Todas las opciones extra, incluidas las eliminadas (snapshot del caché de catálogo)."""
+        orm_extra_options = self.db.query(ExtraOptionORM).order_by(ExtraOptionORM.id).all()
+        return [self._to_domain_model(orm_option) for orm_option in orm_extra_options]
+
+    def get_version(self) -> str:
+        return get_table_version(self.db, CATALOG_VERSION)
+
     def save(self, extra_option: DomainExtraOption) -> DomainExtraOption:
         if extra_option.id is None:
             # Crear nueva opción extra
             orm_extra_option = self._to_orm_model(extra_option)
             self.db.add(orm_extra_option)
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_extra_option)
         else:
             # Actualizar opción extra existente
@@ -71,7 +88,7 @@ class SQLAlchemyExtraOptionRepository(ExtraOptionRepository):
             
             orm_extra_option = self._to_orm_model(extra_option, orm_extra_option)
 
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_extra_option)
             
         domain_extra_option = self._to_domain_model(orm_extra_option)
@@ -83,7 +100,7 @@ class SQLAlchemyExtraOptionRepository(ExtraOptionRepository):
         orm_extra_option = self.db.query(ExtraOptionORM).filter(ExtraOptionORM.id == extra_option_id).first()
         if orm_extra_option:
             orm_extra_option.deleted_at = datetime.now()
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_extra_option)
             return self._to_domain_model(orm_extra_option)
         return None
\ No newline at end of file
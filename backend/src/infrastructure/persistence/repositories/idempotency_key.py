@@ -0,0 +1,83 @@
+# src/infrastructure/persistence/repositories/idempotency_key.py
+import os
+from datetime import timedelta
+from typing import Optional
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.application.ports.idempotency_key import IdempotencyKeyRepository
+from src.domain.models.idempotency_key import IdempotencyKey
+from src.infrastructure.persistence.models.idempotency_key import IdempotencyKeyORM
+
+# Segundos tras los cuales una reserva sin pedido se considera abandonada (proceso caído a mitad)
+IDEMPOTENCY_PENDING_TIMEOUT = int(os.getenv("IDEMPOTENCY_PENDING_TIMEOUT", "120"))
+# Horas que se conserva una clave; pasado ese plazo la purga la elimina y el cliente ya no puede repetir la solicitud
+IDEMPOTENCY_KEY_RETENTION_HOURS = int(os.getenv("IDEMPOTENCY_KEY_RETENTION_HOURS", "24"))
+
+
+class SQLAlchemyIdempotencyKeyRepository(IdempotencyKeyRepository):
+    """
+    Implementación del puerto IdempotencyKeyRepository usando SQLAlchemy.
+    Cada operación es una sola sentencia por clave primaria y se confirma de inmediato:
+    la reserva tiene que ser visible para las otras solicitudes antes de crear el pedido.
+    El order_id lo escribe SQLAlchemyOrderRepository.save en la transacción del pedido.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, key: str) -> Optional[IdempotencyKey]:
+        t = IdempotencyKeyORM
+        row = self.db.execute(
+            select(t.key, t.request_hash, t.order_id, t.response, t.created_at).where(t.key == key)
+        ).first()
+        if row is None:
+            return None
+        return IdempotencyKey(
+            key=row.key,
+            request_hash=row.request_hash,
+            order_id=row.order_id,
+            response=row.response,
+            created_at=row.created_at
+        )
+
+    def reserve(self, key: str, request_hash: str) -> bool:
+        table = IdempotencyKeyORM.__table__
+        stmt = insert(IdempotencyKeyORM).values(key=key, request_hash=request_hash, created_at=func.now())
+        # Solo se pisa una reserva abandonada; las que ya tienen pedido y las recientes se respetan
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.key],
+            set_={"request_hash": stmt.excluded.request_hash, "created_at": func.now()},
+            where=(table.c.order_id.is_(None))
+            & (table.c.created_at < func.now() - timedelta(seconds=IDEMPOTENCY_PENDING_TIMEOUT))
+        ).returning(table.c.key)
+        reserved = self.db.execute(stmt).first() is not None
+        self.db.commit()
+        return reserved
+
+    def complete(self, key: str, order_id: int, response: dict) -> None:
+        try:
+            self.db.execute(
+                update(IdempotencyKeyORM)
+                .where(IdempotencyKeyORM.key == key, IdempotencyKeyORM.order_id == order_id)
+                .values(response=response)
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def release(self, key: str) -> None:
+        self.db.rollback()
+        self.db.execute(
+            delete(IdempotencyKeyORM).where(IdempotencyKeyORM.key == key, IdempotencyKeyORM.order_id.is_(None))
+        )
+        self.db.commit()
+
+    def purge_expired(self) -> int:
+        result = self.db.execute(
+            delete(IdempotencyKeyORM)
+            .where(IdempotencyKeyORM.created_at < func.now() - timedelta(hours=IDEMPOTENCY_KEY_RETENTION_HOURS))
+        )
+        self.db.commit()
+        return result.rowcount
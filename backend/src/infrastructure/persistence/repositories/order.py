@@ -1,13 +1,33 @@
 # src/infrastructure/persistence/repositories/order.py
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from typing import Iterator, List, Optional, Tuple
+from sqlalchemy import func, tuple_, update
+from sqlalchemy.orm import Session, joinedload, noload, selectinload
 from datetime import datetime
 
 from src.application.ports.order import OrderRepository
+from src.application.exceptions import ConflictException
 from src.domain.models.order import Order as DomainOrder
+from src.domain.models.order_summary import OrderSummary
 from src.domain.models.order_detail import OrderDetail as DomainOrderDetail, OrderDetailExtraOption as DomainOrderDetailExtraOption
+from src.domain.models.product import Product as DomainProduct
+from src.domain.models.extra_option import ExtraOption as DomainExtraOption
 from src.infrastructure.persistence.models.order import OrderORM
 from src.infrastructure.persistence.models.order_detail import OrderDetailORM, OrderDetailExtraOptionORM
+from src.infrastructure.persistence.models.customer import CustomerORM
+from src.infrastructure.persistence.models.store import StoreORM
+from src.infrastructure.persistence.models.order_status import OrderStatusORM
+from src.infrastructure.persistence.models.idempotency_key import IdempotencyKeyORM
+from src.infrastructure.persistence.repositories.daily_sales import SQLAlchemyDailySalesRepository
+
+def _as_naive_local(value: datetime) -> datetime:
+    """
+    Las columnas de fecha son DateTime sin zona (hora local del servidor, como datetime.now()).
+    Un valor con zona (p. ej. '...Z') se pasa a hora local y se le quita la zona para poder compararlo.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
 
 class SQLAlchemyOrderRepository(OrderRepository):
     """
@@ -15,6 +35,8 @@ class SQLAlchemyOrderRepository(OrderRepository):
     """
     def __init__(self, db: Session):
         self.db = db
+        # Resumen diario de ventas, actualizado en la misma transacción que los pedidos
+        self.daily_sales = SQLAlchemyDailySalesRepository(db)
 
     def _to_domain_model(self, orm_model: Optional[OrderORM]) -> Optional[DomainOrder]:
         """Convierte un modelo ORM de pedido a un modelo de dominio."""
@@ -122,6 +144,16 @@ class SQLAlchemyOrderRepository(OrderRepository):
         
         return orm_model
 
+    def _apply_generated_values(self, domain_model: DomainOrder, orm_model: OrderORM) -> None:
+        """Copia al modelo de dominio los valores generados por la base en el INSERT (ids y fechas)."""
+        domain_model.id = orm_model.id
+        domain_model.created_at = orm_model.created_at
+        domain_model.updated_at = orm_model.updated_at
+        for detail_domain, detail_orm in zip(domain_model.details, orm_model.details):
+            detail_domain.id = detail_orm.id
+            detail_domain.order_id = orm_model.id
+            detail_domain.created_at = detail_orm.created_at
+
     def get_by_id(self, order_id: int) -> Optional[DomainOrder]:
         orm_order = self.db.query(OrderORM).options(
             joinedload(OrderORM.details).joinedload(OrderDetailORM.extra_options),
@@ -131,40 +163,184 @@ class SQLAlchemyOrderRepository(OrderRepository):
         ).filter(OrderORM.id == order_id).first()
         return self._to_domain_model(orm_order)
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainOrder]:
+    def get_by_id_with_catalog(self, order_id: int) -> Optional[DomainOrder]:
+        # Una sola consulta: pedido + cliente/tienda/estado + detalles con su producto + extras con su opción del catálogo
+        orm_order = self.db.query(OrderORM).options(
+            joinedload(OrderORM.details).joinedload(OrderDetailORM.product),
+            joinedload(OrderORM.details).joinedload(OrderDetailORM.extra_options).joinedload(OrderDetailExtraOptionORM.extra_option),
+            joinedload(OrderORM.customer),
+            joinedload(OrderORM.store),
+            joinedload(OrderORM.order_status)
+        ).filter(OrderORM.id == order_id).first()
+
+        domain_order = self._to_domain_model(orm_order)
+        if domain_order is None:
+            return None
+
+        # Enriquecer los detalles con los datos del catálogo (mismo orden que orm_order.details)
+        for detail_domain, detail_orm in zip(domain_order.details, orm_order.details):
+            product_orm = detail_orm.product
+            detail_domain.product = DomainProduct(
+                id=product_orm.id,
+                sku=product_orm.sku,
+                name=product_orm.name,
+                description=product_orm.description,
+                unity_measure=product_orm.unity_measure,
+                price=float(product_orm.price),
+                image_url=product_orm.image_url,
+                created_at=product_orm.created_at,
+                updated_at=product_orm.updated_at,
+                deleted_at=product_orm.deleted_at
+            )
+            for eo_domain, eo_orm in zip(detail_domain.extra_options, detail_orm.extra_options):
+                extra_option_orm = eo_orm.extra_option
+                eo_domain.extra_option = DomainExtraOption(
+                    id=extra_option_orm.id,
+                    name=extra_option_orm.name,
+                    price=float(extra_option_orm.price),
+                    description=extra_option_orm.description,
+                    created_at=extra_option_orm.created_at,
+                    updated_at=extra_option_orm.updated_at,
+                    deleted_at=extra_option_orm.deleted_at
+                )
+        return domain_order
+
+    def _list_options(self, include_details: bool) -> list:
+        """
+        Estrategia de carga para listados: un SELECT de pedidos más una consulta IN por relación,
+        en lugar de un JOIN que devuelve pedidos×detalles×extras filas.
+        """
+        options = [
+            selectinload(OrderORM.customer),
+            selectinload(OrderORM.store),
+            selectinload(OrderORM.order_status)
+        ]
+        if include_details:
+            options.append(selectinload(OrderORM.details).selectinload(OrderDetailORM.extra_options))
+        else:
+            # Modo resumen: los detalles no se consultan y el pedido se devuelve con la lista vacía
+            options.append(noload(OrderORM.details))
+        return options
+
+    def get_all(self, skip: int = 0, limit: int = 100, include_details: bool = True) -> List[DomainOrder]:
         orm_orders = self.db.query(OrderORM).options(
-            joinedload(OrderORM.details).joinedload(OrderDetailORM.extra_options),
-            joinedload(OrderORM.customer),  # Cargar Customer
-            joinedload(OrderORM.store),     # Cargar Store
-            joinedload(OrderORM.order_status)  # Cargar OrderStatus
-        ).offset(skip).limit(limit).all()
-        domain_orders = [self._to_domain_model(order) for order in orm_orders ]
-        return [d for d in domain_orders if d is not None]  # Filtrar None
+            *self._list_options(include_details)
+        ).filter(OrderORM.deleted_at.is_(None)).order_by(OrderORM.id).offset(skip).limit(limit).all()
+        return [self._to_domain_model(order) for order in orm_orders]
+
+    def get_page(self, limit: int, after: Optional[Tuple[datetime, int]] = None) -> List[DomainOrder]:
+        query = self.db.query(OrderORM).options(
+            *self._list_options(include_details=True)
+        ).filter(OrderORM.deleted_at.is_(None))
+        if after is not None:
+            # Comparación de fila (created_at, id) < cursor: usa idx_orders_active_created sin recorrer páginas previas
+            query = query.filter(tuple_(OrderORM.created_at, OrderORM.id) < tuple_(*after))
+        orm_orders = query.order_by(OrderORM.created_at.desc(), OrderORM.id.desc()).limit(limit).all()
+        return [self._to_domain_model(order) for order in orm_orders]
+
+    def get_summaries(self, skip: int = 0, limit: int = 100, store_id: Optional[int] = None,
+                      order_status_id: Optional[int] = None) -> List[OrderSummary]:
+        # Razón social para personas jurídicas; nombre y apellido para personas naturales
+        customer_name = func.coalesce(
+            CustomerORM.business_name,
+            func.concat_ws(" ", CustomerORM.name, CustomerORM.last_name)
+        )
+        query = self.db.query(
+            OrderORM.id,
+            customer_name.label("customer_name"),
+            StoreORM.name.label("store_name"),
+            OrderStatusORM.name.label("status_name"),
+            OrderORM.final_amount,
+            OrderORM.created_at
+        ).outerjoin(CustomerORM, OrderORM.customer_id == CustomerORM.id
+        ).outerjoin(StoreORM, OrderORM.store_id == StoreORM.id
+        ).outerjoin(OrderStatusORM, OrderORM.order_status_id == OrderStatusORM.id
+        ).filter(OrderORM.deleted_at.is_(None))
+        if store_id is not None:
+            query = query.filter(OrderORM.store_id == store_id)
+        if order_status_id is not None:
+            query = query.filter(OrderORM.order_status_id == order_status_id)
+
+        rows = query.order_by(OrderORM.id).offset(skip).limit(limit).all()
+        return [
+            OrderSummary(
+                id=row.id,
+                customer_name=row.customer_name or None,
+                store_name=row.store_name,
+                status_name=row.status_name,
+                final_amount=float(row.final_amount),
+                created_at=row.created_at
+            ) for row in rows
+        ]
+
+    def get_ids_created_between(self, start: datetime, end: datetime, store_id: Optional[int] = None) -> List[int]:
+        # Solo la columna id: no carga detalles ni relaciones
+        query = self.db.query(OrderORM.id).filter(
+            OrderORM.deleted_at.is_(None),
+            OrderORM.created_at >= start,
+            OrderORM.created_at < end
+        )
+        if store_id is not None:
+            query = query.filter(OrderORM.store_id == store_id)
+        return [order_id for (order_id,) in query.order_by(OrderORM.created_at, OrderORM.id).all()]
+
+    def iter_report_rows(self, start: Optional[datetime] = None, end: Optional[datetime] = None, store_id: Optional[int] = None) -> Iterator[tuple]:
+        # Solo las columnas del reporte; cursor del lado del servidor leído por lotes (memoria constante)
+        query = self.db.query(
+            OrderORM.id,
+            CustomerORM.name,
+            StoreORM.name,
+            OrderStatusORM.name,
+            OrderORM.final_amount,
+            OrderORM.created_at
+        ).outerjoin(CustomerORM, OrderORM.customer_id == CustomerORM.id
+        ).outerjoin(StoreORM, OrderORM.store_id == StoreORM.id
+        ).outerjoin(OrderStatusORM, OrderORM.order_status_id == OrderStatusORM.id
+        ).filter(OrderORM.deleted_at.is_(None))
+        if start is not None:
+            query = query.filter(OrderORM.created_at >= start)
+        if end is not None:
+            query = query.filter(OrderORM.created_at < end)
+        if store_id is not None:
+            query = query.filter(OrderORM.store_id == store_id)
+
+        query = query.order_by(OrderORM.created_at, OrderORM.id).execution_options(stream_results=True, yield_per=1000)
+        for row in query:
+            yield tuple(row)
 
-    def save(self, order: DomainOrder) -> DomainOrder:
+    def save(self, order: DomainOrder, idempotency_key: Optional[str] = None) -> DomainOrder:
         if order.id is None:
-            # Crear un nuevo pedido
+            # Crear un nuevo pedido: el flush inserta pedido, detalles y extras con INSERT ... RETURNING
+            # (ids y fechas generadas), así no hace falta refrescar ni volver a consultar tras el commit
             orm_order = self._to_orm_model(order)
             self.db.add(orm_order)
-            self.db.flush() # Para obtener el ID del pedido antes de commitear
-            
-            # Asignar el order_id a cada detalle
-            for detail_orm in orm_order.details:
-                detail_orm.order_id = orm_order.id
-                
+            self.db.flush()
+            if idempotency_key is not None:
+                self._attach_idempotency_key(idempotency_key, orm_order.id)
+            self.daily_sales.apply_orders([orm_order.id], sign=1)
+            self._apply_generated_values(order, orm_order)
             self.db.commit()
-            self.db.refresh(orm_order)
+            # El pedido de dominio ya trae cliente, tienda, estado y productos validados por el caso de uso
+            return order
         else:
-            # Actualizar un pedido existente
-            orm_order = self.db.query(OrderORM).filter(OrderORM.id == order.id).first()
+            # Actualizar un pedido existente; se bloquea la fila antes de tocar el resumen diario,
+            # igual que en update_status, para que otra escritura no se intercale entre el -1 y el +1
+            orm_order = self.db.query(OrderORM).filter(
+                OrderORM.id == order.id
+            ).with_for_update().populate_existing().first()
             if not orm_order:
                 raise ValueError(f"Order with ID {order.id} not found for update in repository.")
+
+            # Quitar el pedido del resumen diario con sus valores actuales (se vuelve a sumar tras el cambio)
+            self.daily_sales.apply_orders([order.id], sign=-1)
             
             # Borrar los detalles existentes para reconstruirlos con la nueva lista
             orm_order.details.clear() 
             self.db.flush() # Aplica el borrado
             
             orm_order = self._to_orm_model(order, orm_order)
+            self.db.flush()
+            self.daily_sales.apply_orders([order.id], sign=1)
             self.db.commit()
             self.db.refresh(orm_order)
 
@@ -173,11 +349,106 @@ class SQLAlchemyOrderRepository(OrderRepository):
             raise ValueError("Failed to convert ORM model to domain model after saving.")
         return domain_order
 
+    def _attach_idempotency_key(self, key: str, order_id: int) -> None:
+        """
+        Asocia la clave reservada al pedido dentro de su transacción: si el commit del pedido ocurre,
+        la clave ya apunta a él y nunca se vuelve a reservar. Si otra solicitud que retomó la clave
+        ya creó su pedido, el UPDATE no encuentra la fila libre y este pedido se descarta.
+        """
+        attached = self.db.execute(
+            update(IdempotencyKeyORM.__table__)
+            .where(IdempotencyKeyORM.__table__.c.key == key, IdempotencyKeyORM.__table__.c.order_id.is_(None))
+            .values(order_id=order_id)
+            .returning(IdempotencyKeyORM.__table__.c.key)
+        ).first()
+        if attached is None:
+            self.db.rollback()
+            raise ConflictException("La Idempotency-Key ya se usó para crear otro pedido.")
+
+    def update_status(self, order_id: int, order_status_id: int, notes: Optional[str] = None,
+                      payment_method: Optional[str] = None,
+                      expected_updated_at: Optional[datetime] = None) -> Optional[DomainOrder]:
+        # Bloquea la fila: dos cambios de estado simultáneos no pueden restar dos veces el mismo estado del resumen
+        current = self.db.query(OrderORM.id, OrderORM.updated_at).filter(
+            OrderORM.id == order_id,
+            OrderORM.deleted_at.is_(None)
+        ).with_for_update().first()
+        if current is None:
+            self.db.rollback()
+            return None
+        if expected_updated_at is not None and current.updated_at != _as_naive_local(expected_updated_at):
+            self.db.rollback()
+            raise ConflictException(f"El pedido con ID {order_id} fue modificado por otro usuario. Recargue e intente de nuevo.")
+
+        values = {"order_status_id": order_status_id}
+        if notes is not None:
+            values["notes"] = notes
+        if payment_method is not None:
+            values["payment_method"] = payment_method
+
+        self.daily_sales.apply_orders([order_id], sign=-1)
+        row = self.db.execute(
+            update(OrderORM.__table__)
+            .where(OrderORM.__table__.c.id == order_id)
+            .values(**values)
+            .returning(*OrderORM.__table__.c)
+        ).one()
+        self.daily_sales.apply_orders([order_id], sign=1)
+        self.db.commit()
+
+        return DomainOrder(
+            id=row.id,
+            customer_id=row.customer_id,
+            store_id=row.store_id,
+            order_status_id=row.order_status_id,
+            total_amount=float(row.total_amount),
+            profit_margin=float(row.profit_margin),
+            discount_applied=float(row.discount_applied),
+            final_amount=float(row.final_amount),
+            payment_method=row.payment_method,
+            shipping_address=row.shipping_address,
+            notes=row.notes,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            deleted_at=row.deleted_at
+        )
+
+    def update_status_many(self, order_ids: List[int], order_status_id: int, notes: Optional[str] = None) -> List[int]:
+        # Bloqueo en orden de id para que dos cambios masivos que se solapan no se bloqueen mutuamente
+        locked_ids = [order_id for (order_id,) in self.db.query(OrderORM.id).filter(
+            OrderORM.id.in_(order_ids),
+            OrderORM.deleted_at.is_(None)
+        ).order_by(OrderORM.id).with_for_update()]
+        if not locked_ids:
+            self.db.rollback()
+            return []
+
+        values = {"order_status_id": order_status_id}
+        if notes is not None:
+            values["notes"] = notes
+
+        self.daily_sales.apply_orders(locked_ids, sign=-1)
+        updated_ids = self.db.execute(
+            update(OrderORM.__table__)
+            .where(OrderORM.__table__.c.id.in_(locked_ids))
+            .values(**values)
+            .returning(OrderORM.__table__.c.id)
+        ).scalars().all()
+        self.daily_sales.apply_orders(updated_ids, sign=1)
+        self.db.commit()
+        return list(updated_ids)
+
     def delete(self, order_id: int) -> Optional[DomainOrder]:
-        orm_order = self.db.query(OrderORM).filter(OrderORM.id == order_id).first()
-        if orm_order:
-            orm_order.deleted_at = datetime.now()
-            self.db.commit()
-            self.db.refresh(orm_order)
-            return self._to_domain_model(orm_order)
-        return None
\ No newline at end of file
+        # Bloquea la fila: dos bajas simultáneas (o una baja y un cambio de estado) no pueden restar dos veces del resumen
+        orm_order = self.db.query(OrderORM).filter(
+            OrderORM.id == order_id,
+            OrderORM.deleted_at.is_(None)
+        ).with_for_update().populate_existing().first()
+        if orm_order is None:
+            self.db.rollback()
+            return None
+        self.daily_sales.apply_orders([order_id], sign=-1)
+        orm_order.deleted_at = datetime.now()
+        self.db.commit()
+        self.db.refresh(orm_order)
+        return self._to_domain_model(orm_order)
\ No newline at end of file
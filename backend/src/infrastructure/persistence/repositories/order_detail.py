@@ -83,7 +83,10 @@ class SQLAlchemyOrderDetailRepository(OrderDetailRepository):
         return self._to_domain_model(orm_detail)
 
     def get_all_by_order_id(self, order_id: int) -> List[DomainOrderDetail]:
-        orm_details = self.db.query(OrderDetailORM).filter(OrderDetailORM.order_id == order_id).all()
+        orm_details = self.db.query(OrderDetailORM).filter(
+            OrderDetailORM.order_id == order_id,
+            OrderDetailORM.deleted_at.is_(None)
+        ).order_by(OrderDetailORM.id).all()
         domain_details = [self._to_domain_model(d) for d in orm_details]
         return [d for d in domain_details if d is not None]  # Filtrar None
 
@@ -0,0 +1,94 @@
+# src/infrastructure/persistence/repositories/order_import.py
+from typing import List
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from src.application.ports.order_import import OrderImportRepository
+from src.domain.models.order import Order as DomainOrder
+from src.domain.models.order_import import OrderImportReferences
+from src.infrastructure.persistence.models.order import OrderORM
+from src.infrastructure.persistence.models.order_detail import OrderDetailORM, OrderDetailExtraOptionORM
+from src.infrastructure.persistence.models.customer import CustomerORM
+from src.infrastructure.persistence.models.store import StoreORM
+from src.infrastructure.persistence.models.order_status import OrderStatusORM
+from src.infrastructure.persistence.models.product import ProductORM
+from src.infrastructure.persistence.models.extra_option import ExtraOptionORM
+from src.infrastructure.persistence.repositories.daily_sales import SQLAlchemyDailySalesRepository
+
+
+class SQLAlchemyOrderImportRepository(OrderImportRepository):
+    """
+    Implementación del puerto OrderImportRepository usando SQLAlchemy.
+    Cada lote son tres INSERT multi-fila de Core (pedidos, detalles, extras): los dos primeros con
+    RETURNING id en el orden de los parámetros, para enlazar detalles y extras sin releer nada.
+    Se usa la tabla y no la clase ORM porque el bulk INSERT del ORM agrupa las filas por columnas con valor.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+        self.daily_sales = SQLAlchemyDailySalesRepository(db)
+
+    def _active_ids(self, model) -> set:
+        return set(self.db.execute(select(model.id).where(model.deleted_at.is_(None))).scalars())
+
+    def get_references(self) -> OrderImportReferences:
+        return OrderImportReferences(
+            customer_ids=self._active_ids(CustomerORM),
+            store_ids=self._active_ids(StoreORM),
+            order_status_ids=self._active_ids(OrderStatusORM),
+            product_ids=self._active_ids(ProductORM),
+            extra_option_ids=self._active_ids(ExtraOptionORM)
+        )
+
+    def insert_orders(self, orders: List[DomainOrder]) -> List[int]:
+        try:
+            order_ids = self.db.execute(
+                insert(OrderORM.__table__).returning(OrderORM.__table__.c.id, sort_by_parameter_order=True),
+                [{
+                    "customer_id": order.customer_id,
+                    "store_id": order.store_id,
+                    "order_status_id": order.order_status_id,
+                    "total_amount": order.total_amount,
+                    "profit_margin": order.profit_margin,
+                    "discount_applied": order.discount_applied,
+                    "final_amount": order.final_amount,
+                    "payment_method": order.payment_method,
+                    "shipping_address": order.shipping_address,
+                    "notes": order.notes,
+                    "created_at": order.created_at,
+                } for order in orders]
+            ).scalars().all()
+
+            details = [(order_id, detail) for order_id, order in zip(order_ids, orders) for detail in order.details]
+            detail_ids = []
+            if details:
+                detail_ids = self.db.execute(
+                    insert(OrderDetailORM.__table__).returning(OrderDetailORM.__table__.c.id, sort_by_parameter_order=True),
+                    [{
+                        "order_id": order_id,
+                        "product_id": detail.product_id,
+                        "height": detail.height,
+                        "width": detail.width,
+                        "quantity": detail.quantity,
+                        "linear_meter": detail.linear_meter,
+                        "subtotal": detail.subtotal,
+                        "total_extra_options": detail.total_extra_options,
+                    } for order_id, detail in details]
+                ).scalars().all()
+
+            extra_rows = [{
+                "order_detail_id": detail_id,
+                "extra_option_id": eo.extra_option_id,
+                "quantity": eo.quantity,
+                "linear_meter": eo.linear_meter,
+                "width": eo.width,
+                "giga_select": eo.giga_select,
+            } for detail_id, (_, detail) in zip(detail_ids, details) for eo in detail.extra_options]
+            if extra_rows:
+                self.db.execute(insert(OrderDetailExtraOptionORM.__table__), extra_rows)
+
+            self.daily_sales.apply_orders(order_ids, sign=1)
+            self.db.commit()
+            return list(order_ids)
+        except Exception:
+            self.db.rollback()
+            raise
@@ -54,10 +54,17 @@ class SQLAlchemyOrderStatusRepository(OrderStatusRepository):
         return self._to_domain_model(orm_status)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainOrderStatus]:
-        orm_statuses = self.db.query(OrderStatusORM).offset(skip).limit(limit).all()
+        orm_statuses = self.db.query(OrderStatusORM).filter(
+            OrderStatusORM.deleted_at.is_(None)
+        ).order_by(OrderStatusORM.id).offset(skip).limit(limit).all()
         domain_statuses = [self._to_domain_model(status) for status in orm_statuses]
         return [ds for ds in domain_statuses if ds is not None]
 
+    def load_all(self) -> List[DomainOrderStatus]:
+        """Todos los estados de pedido, incluidos los eliminados (snapshot del caché de tablas de referencia)."""
+        orm_statuses = self.db.query(OrderStatusORM).order_by(OrderStatusORM.id).all()
+        return [self._to_domain_model(row) for row in orm_statuses]
+
     def save(self, order_status: DomainOrderStatus) -> DomainOrderStatus:
         if order_status.id is None:
             # Crear nuevo estado de pedido
@@ -0,0 +1,115 @@
+# src/infrastructure/persistence/repositories/price_list.py
+from typing import List, Optional
+from sqlalchemy import delete, func, nulls_last, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.application.ports.price_list import PriceListRepository
+from src.domain.models.price_list import PriceListEntry
+from src.domain.services.pricing import list_price, with_igv
+from src.infrastructure.persistence.models.price_list_entry import PriceListEntryORM
+from src.infrastructure.persistence.models.product import ProductORM
+from src.infrastructure.persistence.models.extra_option import ExtraOptionORM
+from src.infrastructure.persistence.models.type_client import TypeClientORM
+
+
+class SQLAlchemyPriceListRepository(PriceListRepository):
+    """
+    Implementación del puerto PriceListRepository usando SQLAlchemy.
+    Los precios se calculan con el motor de precios del dominio (no en SQL) para que
+    coincidan al céntimo con las cotizaciones; luego se insertan con un INSERT ... ON CONFLICT
+    por tipo de ítem, apoyado en los índices únicos parciales de la tabla: si dos regeneraciones
+    corren a la vez, la segunda sobrescribe los precios en lugar de duplicar filas.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_type_client(self, type_client_id: int) -> List[PriceListEntry]:
+        t = PriceListEntryORM
+        rows = self.db.execute(
+            select(t.type_client_id, t.product_id, t.extra_option_id, t.name, t.base_price, t.price, t.final_price, t.updated_at)
+            .where(t.type_client_id == type_client_id)
+            .order_by(nulls_last(t.product_id), t.extra_option_id)
+        ).all()
+        return [
+            PriceListEntry(
+                type_client_id=row.type_client_id,
+                item_type="product" if row.product_id is not None else "extra_option",
+                item_id=row.product_id if row.product_id is not None else row.extra_option_id,
+                name=row.name,
+                base_price=float(row.base_price),
+                price=float(row.price),
+                final_price=float(row.final_price),
+                updated_at=row.updated_at
+            ) for row in rows
+        ]
+
+    def rebuild(
+        self,
+        product_id: Optional[int] = None,
+        extra_option_id: Optional[int] = None,
+        type_client_id: Optional[int] = None
+    ) -> int:
+        full = product_id is None and extra_option_id is None
+
+        type_clients = select(TypeClientORM.id, TypeClientORM.margin).where(TypeClientORM.deleted_at.is_(None))
+        products = select(ProductORM.id, ProductORM.name, ProductORM.price).where(ProductORM.deleted_at.is_(None))
+        extra_options = select(ExtraOptionORM.id, ExtraOptionORM.name, ExtraOptionORM.price).where(ExtraOptionORM.deleted_at.is_(None))
+        stale = delete(PriceListEntryORM)
+
+        if type_client_id is not None:
+            type_clients = type_clients.where(TypeClientORM.id == type_client_id)
+            stale = stale.where(PriceListEntryORM.type_client_id == type_client_id)
+        if product_id is not None:
+            products = products.where(ProductORM.id == product_id)
+            stale = stale.where(PriceListEntryORM.product_id == product_id)
+        if extra_option_id is not None:
+            extra_options = extra_options.where(ExtraOptionORM.id == extra_option_id)
+            stale = stale.where(PriceListEntryORM.extra_option_id == extra_option_id)
+
+        margins = self.db.execute(type_clients).all()
+        items = []
+        if full or product_id is not None:
+            items += [("product_id", row) for row in self.db.execute(products).all()]
+        if full or extra_option_id is not None:
+            items += [("extra_option_id", row) for row in self.db.execute(extra_options).all()]
+
+        entries = []
+        for type_client in margins:
+            for column, item in items:
+                base_price = float(item.price)
+                price = list_price(base_price, float(type_client.margin))
+                entries.append({
+                    "type_client_id": type_client.id,
+                    "product_id": None,
+                    "extra_option_id": None,
+                    column: item.id,
+                    "name": item.name,
+                    "base_price": base_price,
+                    "price": price,
+                    "final_price": with_igv(price),
+                })
+
+        self.db.execute(stale)
+        for column in ("product_id", "extra_option_id"):
+            rows = [entry for entry in entries if entry[column] is not None]
+            if rows:
+                self.db.execute(self._upsert(column), rows)
+        self.db.commit()
+        return len(entries)
+
+    def _upsert(self, column: str):
+        """INSERT que actualiza la fila existente del mismo ítem y tipo de cliente (índice único parcial de `column`)."""
+        table = PriceListEntryORM.__table__
+        stmt = insert(PriceListEntryORM)
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c.type_client_id, table.c[column]],
+            index_where=table.c[column].isnot(None),
+            set_={
+                "name": stmt.excluded.name,
+                "base_price": stmt.excluded.base_price,
+                "price": stmt.excluded.price,
+                "final_price": stmt.excluded.final_price,
+                "updated_at": func.now(),
+            }
+        )
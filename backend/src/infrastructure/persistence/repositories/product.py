@@ -1,5 +1,6 @@
 # src/infrastructure/persistence/repositories/product.py
 from typing import List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session, selectinload # selectinload para cargar relaciones
 from datetime import datetime
 
@@ -12,6 +13,7 @@ from src.domain.models.extra_option import ExtraOption as DomainExtraOption
 from src.infrastructure.persistence.models.product import ProductORM
 from src.infrastructure.persistence.models.product_type import ProductTypeORM
 from src.infrastructure.persistence.models.extra_option import ExtraOptionORM
+from src.infrastructure.persistence.repositories.table_version import CATALOG_VERSION, commit_with_version, get_table_version
 
 
 class SQLAlchemyProductRepository(ProductRepository):
@@ -94,6 +96,15 @@ class SQLAlchemyProductRepository(ProductRepository):
         ).filter(ProductORM.id == product_id).first()
         return self._to_domain_model(orm_product)
 
+    def get_many_by_ids(self, product_ids: List[int]) -> List[DomainProduct]:
+        if not product_ids:
+            return []
+        orm_products = self.db.query(ProductORM).options(
+            selectinload(ProductORM.product_types),
+            selectinload(ProductORM.extra_options)
+        ).filter(ProductORM.id.in_(set(product_ids))).all()
+        return [self._to_domain_model(p) for p in orm_products]
+
     def get_by_sku(self, sku: str) -> Optional[DomainProduct]:
         orm_product = self.db.query(ProductORM).options(
             selectinload(ProductORM.product_types),
@@ -112,16 +123,27 @@ class SQLAlchemyProductRepository(ProductRepository):
         orm_products = self.db.query(ProductORM).options(
             selectinload(ProductORM.product_types),
             selectinload(ProductORM.extra_options)
-        ).offset(skip).limit(limit).all()
+        ).filter(ProductORM.deleted_at.is_(None)).order_by(ProductORM.id).offset(skip).limit(limit).all()
         domain_products = [self._to_domain_model(p) for p in orm_products]
         return [dp for dp in domain_products if dp is not None]  # Filtrar None si hay productos eliminados
 
+    def load_all(self) -> List[DomainProduct]:
+        """Todos los productos, incluidos los eliminados, con sus relaciones (snapshot del caché de catálogo)."""
+        orm_products = self.db.query(ProductORM).options(
+            selectinload(ProductORM.product_types),
+            selectinload(ProductORM.extra_options)
+        ).order_by(ProductORM.id).all()
+        return [self._to_domain_model(p) for p in orm_products]
+
+    def get_version(self) -> str:
+        return get_table_version(self.db, CATALOG_VERSION)
+
     def save(self, product: DomainProduct) -> DomainProduct:
         if product.id is None:
             # Crear nuevo producto
             orm_product = self._to_orm_model(product)
             self.db.add(orm_product)
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product) # Obtener el ID generado por la DB
         else:
             # Actualizar producto existente
@@ -130,7 +152,7 @@ class SQLAlchemyProductRepository(ProductRepository):
                 raise ValueError(f"Product with ID {product.id} not found for update in repository.")
             
             orm_product = self._to_orm_model(product, orm_product)
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product) # Refrescar para asegurar que cualquier dato actualizado esté cargado
 
         # Después de guardar el producto base, cargamos sus relaciones (si el producto tiene ID)
@@ -151,7 +173,7 @@ class SQLAlchemyProductRepository(ProductRepository):
         orm_product = self.db.query(ProductORM).filter(ProductORM.id == product_id).first()
         if orm_product:
             orm_product.deleted_at = datetime.now()
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product)
             # Re-cargar con relaciones para el DTO de respuesta
             orm_product_with_relations = self.db.query(ProductORM).options(
@@ -179,7 +201,8 @@ class SQLAlchemyProductRepository(ProductRepository):
 
         # Establece la relación: sobrescribe la lista existente
         orm_product.product_types = product_type_orms
-        self.db.commit()
+        orm_product.updated_at = func.now() # Cambiar relaciones también cambia la versión del catálogo
+        commit_with_version(self.db, CATALOG_VERSION)
         self.db.refresh(orm_product) # Refresca para cargar las nuevas relaciones
         domain_product = self._to_domain_model(orm_product)
         if domain_product is None:
@@ -207,7 +230,8 @@ class SQLAlchemyProductRepository(ProductRepository):
                 ProductTypeORM.id.in_(new_product_type_ids)
             ).all()
             orm_product.product_types.extend(new_product_type_orms)
-            self.db.commit()
+            orm_product.updated_at = func.now()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product)
         
         domain_product = self._to_domain_model(orm_product)
@@ -234,7 +258,8 @@ class SQLAlchemyProductRepository(ProductRepository):
             orm_product.product_types.remove(pt_orm)
         
         if product_types_to_remove: # Solo commitea si hay cambios
-            self.db.commit()
+            orm_product.updated_at = func.now()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product)
         
         domain_product = self._to_domain_model(orm_product)
@@ -257,7 +282,8 @@ class SQLAlchemyProductRepository(ProductRepository):
         ).all()
 
         orm_product.extra_options = extra_option_orms
-        self.db.commit()
+        orm_product.updated_at = func.now()
+        commit_with_version(self.db, CATALOG_VERSION)
         self.db.refresh(orm_product)
 
         domain_product = self._to_domain_model(orm_product)
@@ -283,7 +309,8 @@ class SQLAlchemyProductRepository(ProductRepository):
                 ExtraOptionORM.id.in_(new_extra_option_ids)
             ).all()
             orm_product.extra_options.extend(new_extra_option_orms)
-            self.db.commit()
+            orm_product.updated_at = func.now()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product)
         
         domain_product = self._to_domain_model(orm_product)
@@ -309,7 +336,8 @@ class SQLAlchemyProductRepository(ProductRepository):
             orm_product.extra_options.remove(eo_orm)
         
         if extra_options_to_remove:
-            self.db.commit()
+            orm_product.updated_at = func.now()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product)
         
         domain_product = self._to_domain_model(orm_product)
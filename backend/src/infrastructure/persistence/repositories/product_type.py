@@ -6,6 +6,7 @@ from datetime import datetime # Necesario para datetime.now()
 from src.application.ports.product_type import ProductTypeRepository
 from src.domain.models.product_type import ProductType as DomainProductType # Alias
 from src.infrastructure.persistence.models.product_type import ProductTypeORM
+from src.infrastructure.persistence.repositories.table_version import CATALOG_VERSION, commit_with_version, get_table_version
 
 class SQLAlchemyProductTypeRepository(ProductTypeRepository):
     """
@@ -50,16 +51,26 @@ class SQLAlchemyProductTypeRepository(ProductTypeRepository):
         return self._to_domain_model(orm_product_type)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainProductType]:
-        orm_product_types = self.db.query(ProductTypeORM).offset(skip).limit(limit).all()
+        orm_product_types = self.db.query(ProductTypeORM).filter(
+            ProductTypeORM.deleted_at.is_(None)
+        ).order_by(ProductTypeORM.id).offset(skip).limit(limit).all()
         domain_product_types = [self._to_domain_model(pt) for pt in orm_product_types]
         return [pt for pt in domain_product_types if pt is not None]  # Filtrar None
 
+    def load_all(self) -> List[DomainProductType]:
+        """Todos los tipos de producto, incluidos los eliminados (snapshot del caché de catálogo)."""
+        orm_product_types = self.db.query(ProductTypeORM).order_by(ProductTypeORM.id).all()
+        return [self._to_domain_model(pt) for pt in orm_product_types]
+
+    def get_version(self) -> str:
+        return get_table_version(self.db, CATALOG_VERSION)
+
     def save(self, product_type: DomainProductType) -> DomainProductType:
         if product_type.id is None:
             # Crear nuevo tipo de producto
             orm_product_type = self._to_orm_model(product_type)
             self.db.add(orm_product_type)
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product_type)
         else:
             # Actualizar tipo de producto existente
@@ -69,7 +80,7 @@ class SQLAlchemyProductTypeRepository(ProductTypeRepository):
             
             orm_product_type = self._to_orm_model(product_type, orm_product_type)
 
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product_type)
 
         domain_product_type = self._to_domain_model(orm_product_type)
@@ -81,7 +92,7 @@ class SQLAlchemyProductTypeRepository(ProductTypeRepository):
         orm_product_type = self.db.query(ProductTypeORM).filter(ProductTypeORM.id == product_type_id).first()
         if orm_product_type:
             orm_product_type.deleted_at = datetime.now()
-            self.db.commit()
+            commit_with_version(self.db, CATALOG_VERSION)
             self.db.refresh(orm_product_type)
             return self._to_domain_model(orm_product_type)
         return None
\ No newline at end of file
@@ -0,0 +1,160 @@
+# src/infrastructure/persistence/repositories/sales_report.py
+from typing import List, Optional
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.application.ports.sales_report import SalesReportRepository
+from src.domain.models.sales_report import SalesReportRow
+from src.infrastructure.persistence.models.order import OrderORM
+from src.infrastructure.persistence.models.order_detail import OrderDetailORM
+from src.infrastructure.persistence.models.customer import CustomerORM
+from src.infrastructure.persistence.models.store import StoreORM
+from src.infrastructure.persistence.models.type_client import TypeClientORM
+from src.infrastructure.persistence.models.product import ProductORM
+from src.infrastructure.persistence.models.daily_sales import DailySalesORM
+
+# Unidades de date_trunc de PostgreSQL para los reportes por periodo
+PERIOD_UNITS = {"day": "day", "week": "week", "month": "month"}
+
+
+def _to_float(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class SQLAlchemySalesReportRepository(SalesReportRepository):
+    """
+    Implementación del puerto SalesReportRepository usando SQLAlchemy.
+    Cada reporte es una sola consulta GROUP BY que devuelve una fila por grupo.
+    Por tienda y por periodo se lee el resumen 'daily_sales' (pocas filas por día);
+    por tipo de cliente y por producto se agregan los pedidos directamente.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _apply_order_filters(self, query, start, end, store_id, order_status_id):
+        query = query.filter(OrderORM.deleted_at.is_(None))
+        if start is not None:
+            query = query.filter(OrderORM.created_at >= start)
+        if end is not None:
+            query = query.filter(OrderORM.created_at < end)
+        if store_id is not None:
+            query = query.filter(OrderORM.store_id == store_id)
+        if order_status_id is not None:
+            query = query.filter(OrderORM.order_status_id == order_status_id)
+        return query
+
+    def get_sales_summary(
+        self,
+        group_by: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        store_id: Optional[int] = None,
+        order_status_id: Optional[int] = None
+    ) -> List[SalesReportRow]:
+        if group_by == "product":
+            return self._get_product_summary(start, end, store_id, order_status_id)
+        if group_by == "store" or group_by in PERIOD_UNITS:
+            return self._get_daily_sales_summary(group_by, start, end, store_id, order_status_id)
+
+        if group_by != "customer_type":
+            raise ValueError(f"Agrupación de reporte no soportada: {group_by}")
+
+        query = self.db.query(
+            CustomerORM.type_client_id.label("group_key"),
+            TypeClientORM.name.label("group_label"),
+            func.count(OrderORM.id).label("order_count"),
+            func.sum(OrderORM.total_amount).label("total_amount"),
+            func.sum(OrderORM.discount_applied).label("discount_applied"),
+            func.sum(OrderORM.profit_margin).label("profit"),
+            func.sum(OrderORM.final_amount).label("final_amount"),
+        ).join(CustomerORM, OrderORM.customer_id == CustomerORM.id
+        ).join(TypeClientORM, CustomerORM.type_client_id == TypeClientORM.id)
+
+        query = self._apply_order_filters(query, start, end, store_id, order_status_id)
+        rows = query.group_by(CustomerORM.type_client_id, TypeClientORM.name).order_by(CustomerORM.type_client_id).all()
+
+        return [
+            SalesReportRow(
+                group_key=str(row.group_key),
+                group_label=row.group_label,
+                order_count=row.order_count,
+                total_amount=float(row.total_amount or 0),
+                discount_applied=_to_float(row.discount_applied),
+                profit=_to_float(row.profit),
+                final_amount=_to_float(row.final_amount)
+            ) for row in rows
+        ]
+
+    def _get_daily_sales_summary(self, group_by, start, end, store_id, order_status_id) -> List[SalesReportRow]:
+        """Por tienda o por periodo, sumando las filas del resumen diario."""
+        if group_by == "store":
+            key_col = DailySalesORM.store_id
+            label_col = StoreORM.name
+        else:
+            key_col = func.date_trunc(PERIOD_UNITS[group_by], DailySalesORM.day)
+            label_col = None
+
+        columns = [
+            key_col.label("group_key"),
+            func.sum(DailySalesORM.order_count).label("order_count"),
+            func.sum(DailySalesORM.total_amount).label("total_amount"),
+            func.sum(DailySalesORM.discount_applied).label("discount_applied"),
+            func.sum(DailySalesORM.profit).label("profit"),
+            func.sum(DailySalesORM.final_amount).label("final_amount"),
+        ]
+        if label_col is not None:
+            columns.insert(1, label_col.label("group_label"))
+
+        query = self.db.query(*columns)
+        if group_by == "store":
+            query = query.join(StoreORM, DailySalesORM.store_id == StoreORM.id)
+        # Los límites del reporte son medianoche, así que se comparan directamente con el día
+        if start is not None:
+            query = query.filter(DailySalesORM.day >= start.date())
+        if end is not None:
+            query = query.filter(DailySalesORM.day < end.date())
+        if store_id is not None:
+            query = query.filter(DailySalesORM.store_id == store_id)
+        if order_status_id is not None:
+            query = query.filter(DailySalesORM.order_status_id == order_status_id)
+
+        group_cols = [key_col] if label_col is None else [key_col, label_col]
+        rows = query.group_by(*group_cols).having(func.sum(DailySalesORM.order_count) > 0).order_by(key_col).all()
+
+        return [
+            SalesReportRow(
+                group_key=row.group_key.date().isoformat() if isinstance(row.group_key, datetime) else str(row.group_key),
+                group_label=getattr(row, "group_label", None),
+                order_count=int(row.order_count),
+                total_amount=float(row.total_amount or 0),
+                discount_applied=_to_float(row.discount_applied),
+                profit=_to_float(row.profit),
+                final_amount=_to_float(row.final_amount)
+            ) for row in rows
+        ]
+
+    def _get_product_summary(self, start, end, store_id, order_status_id) -> List[SalesReportRow]:
+        """Por producto: suma de subtotales + extras de los detalles, cantidad vendida y pedidos distintos."""
+        query = self.db.query(
+            OrderDetailORM.product_id.label("group_key"),
+            ProductORM.name.label("group_label"),
+            func.count(func.distinct(OrderDetailORM.order_id)).label("order_count"),
+            func.sum(OrderDetailORM.subtotal + OrderDetailORM.total_extra_options).label("total_amount"),
+            func.sum(OrderDetailORM.quantity).label("quantity"),
+        ).join(OrderORM, OrderDetailORM.order_id == OrderORM.id
+        ).join(ProductORM, OrderDetailORM.product_id == ProductORM.id
+        ).filter(OrderDetailORM.deleted_at.is_(None))
+
+        query = self._apply_order_filters(query, start, end, store_id, order_status_id)
+        rows = query.group_by(OrderDetailORM.product_id, ProductORM.name).order_by(OrderDetailORM.product_id).all()
+
+        return [
+            SalesReportRow(
+                group_key=str(row.group_key),
+                group_label=row.group_label,
+                order_count=row.order_count,
+                total_amount=float(row.total_amount or 0),
+                quantity=int(row.quantity or 0)
+            ) for row in rows
+        ]
@@ -75,11 +75,18 @@ class SQLAlchemyStoreRepository(StoreRepository):
         return self._to_domain_model(orm_store)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainStore]:
-        # Aquí obtenemos todos, la lógica de filtrar activos se mueve al use case
-        orm_stores = self.db.query(StoreORM).offset(skip).limit(limit).all()
+        # Solo tiendas activas: el filtro va en SQL para que la paginación sea correcta
+        orm_stores = self.db.query(StoreORM).filter(
+            StoreORM.deleted_at.is_(None)
+        ).order_by(StoreORM.id).offset(skip).limit(limit).all()
         domain_stores = [self._to_domain_model(store) for store in orm_stores]
         return [store for store in domain_stores if store is not None]  # Filtrar None para cumplir con List[DomainStore]
 
+    def load_all(self) -> List[DomainStore]:
+        """Todas las tiendas, incluidas las eliminadas (snapshot del caché de tablas de referencia)."""
+        orm_stores = self.db.query(StoreORM).order_by(StoreORM.id).all()
+        return [self._to_domain_model(row) for row in orm_stores]
+
     def save(self, store: DomainStore) -> DomainStore:
         if store.id is None:
             # Crear nueva tienda
@@ -0,0 +1,39 @@
+# src/infrastructure/persistence/repositories/table_version.py
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models.catalog_version import CatalogVersionORM
+
+# Grupos de tablas con versión propia
+CATALOG_VERSION = "catalog"              # productos, opciones extra y tipos de producto (y sus relaciones)
+TYPE_CLIENTS_VERSION = "type_clients"
+
+
+def get_table_version(db: Session, name: str) -> str:
+    """
+    Versión del contenido de un grupo de tablas: un contador que solo crece.
+    A diferencia de max(updated_at) (hora de inicio de la transacción), no puede quedar igual
+    si una transacción que empezó antes confirma después.
+    """
+    version = db.execute(select(CatalogVersionORM.version).where(CatalogVersionORM.name == name)).scalar()
+    return str(version or 0)
+
+
+def bump_table_version(db: Session, name: str) -> None:
+    """
+    Incrementa el contador dentro de la transacción en curso (sin confirmarla).
+    El UPDATE bloquea la fila hasta el commit, así dos escrituras concurrentes obtienen versiones distintas.
+    """
+    table = CatalogVersionORM.__table__
+    stmt = insert(CatalogVersionORM).values(name=name, version=1, updated_at=func.now())
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[table.c.name],
+        set_={"version": table.c.version + 1, "updated_at": func.now()}
+    ))
+
+
+def commit_with_version(db: Session, name: str) -> None:
+    """Incrementa la versión del grupo y confirma la transacción de la escritura."""
+    bump_table_version(db, name)
+    db.commit()
@@ -6,6 +6,7 @@ from datetime import datetime # Para el deleted_at si se maneja aquí
 from src.application.ports.type_client import TypeClientRepository
 from src.domain.models.type_client import TypeClient as DomainTypeClient # Alias para evitar conflicto
 from src.infrastructure.persistence.models.type_client import TypeClientORM
+from src.infrastructure.persistence.repositories.table_version import TYPE_CLIENTS_VERSION, commit_with_version, get_table_version
 
 class SQLAlchemyTypeClientRepository(TypeClientRepository):
     """
@@ -56,16 +57,26 @@ class SQLAlchemyTypeClientRepository(TypeClientRepository):
         return self._to_domain_model(orm_type_client)
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[DomainTypeClient]:
-        orm_type_clients = self.db.query(TypeClientORM).offset(skip).limit(limit).all()
+        orm_type_clients = self.db.query(TypeClientORM).filter(
+            TypeClientORM.deleted_at.is_(None)
+        ).order_by(TypeClientORM.id).offset(skip).limit(limit).all()
         domain_clients = [self._to_domain_model(tc) for tc in orm_type_clients]
         return [dc for dc in domain_clients if dc is not None]
 
+    def load_all(self) -> List[DomainTypeClient]:
+        """Todos los tipos de cliente, incluidos los eliminados (snapshot del caché de tablas de referencia)."""
+        orm_type_clients = self.db.query(TypeClientORM).order_by(TypeClientORM.id).all()
+        return [self._to_domain_model(row) for row in orm_type_clients]
+
+    def get_version(self) -> str:
+        return get_table_version(self.db, TYPE_CLIENTS_VERSION)
+
     def save(self, type_client: DomainTypeClient) -> DomainTypeClient:
         if type_client.id is None:
             # Crear nuevo tipo de cliente
             orm_type_client = self._to_orm_model(type_client)
             self.db.add(orm_type_client)
-            self.db.commit()
+            commit_with_version(self.db, TYPE_CLIENTS_VERSION)
             self.db.refresh(orm_type_client)
         else:
             # Actualizar tipo de cliente existente
@@ -75,7 +86,7 @@ class SQLAlchemyTypeClientRepository(TypeClientRepository):
             
             orm_type_client = self._to_orm_model(type_client, orm_type_client)
 
-            self.db.commit()
+            commit_with_version(self.db, TYPE_CLIENTS_VERSION)
             self.db.refresh(orm_type_client)
 
         domain_model = self._to_domain_model(orm_type_client)
@@ -87,7 +98,7 @@ class SQLAlchemyTypeClientRepository(TypeClientRepository):
         orm_type_client = self.db.query(TypeClientORM).filter(TypeClientORM.id == type_client_id).first()
         if orm_type_client:
             orm_type_client.deleted_at = datetime.now()
-            self.db.commit()
+            commit_with_version(self.db, TYPE_CLIENTS_VERSION)
             self.db.refresh(orm_type_client)
             return self._to_domain_model(orm_type_client)
         return None
\ No newline at end of file
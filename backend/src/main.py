@@ -1,18 +1,37 @@
 # src/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.infrastructure.api.routers import api_router
+from src.services.order_pdf.pdf_executor import pdf_render_executor
+from src.infrastructure.database.database import SessionLocal
+from src.infrastructure.cache.reference import reference_cache
 
 # # Crea las tablas en la base de datos si no existen
 # # ¡ADVERTENCIA! En entornos de producción, se recomienda usar herramientas de migración como Alembic.
 # Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Precarga las tablas de referencia; si la base no responde se cargarán en la primera consulta
+    db = SessionLocal()
+    try:
+        reference_cache.load_all(db)
+    except Exception as e:
+        print(f"No se pudieron precargar las tablas de referencia: {e}")
+    finally:
+        db.close()
+    yield
+    # Cierra los procesos de generación de PDF al apagar el servidor
+    pdf_render_executor.shutdown()
+
 app = FastAPI(
     title="Cotizaciones API",
     description="API para la gestión de productos, clientes y cotizaciones",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 origins = [
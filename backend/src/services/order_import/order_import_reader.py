@@ -0,0 +1,87 @@
+# src/services/order_import/order_import_reader.py
+import csv
+import json
+from typing import Iterable, Iterator, List, Optional
+
+from src.domain.models.order_import import OrderImportRow
+
+# Columnas del CSV: una fila por detalle; las columnas del pedido se toman de la primera fila de cada order_ref
+CSV_ORDER_COLUMNS = [
+    "customer_id", "store_id", "order_status_id", "total_amount", "profit_margin", "discount_applied",
+    "final_amount", "payment_method", "shipping_address", "notes", "created_at"
+]
+CSV_DETAIL_COLUMNS = ["product_id", "height", "width", "quantity", "linear_meter", "subtotal", "total_extra_options"]
+# Las extras del detalle van en una celda como lista JSON: [{"extra_option_id": 5, "quantity": 1, "linear_meter": 2}]
+CSV_EXTRAS_COLUMN = "extra_options"
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[OrderImportRow]:
+    """Un pedido por línea, con la misma forma que el cuerpo de POST /orders/ (más created_at y order_ref opcionales)."""
+    for row, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield OrderImportRow(row=row, error=f"JSON inválido: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield OrderImportRow(row=row, error="Cada línea debe ser un objeto JSON con un pedido.")
+            continue
+        ref = data.pop("order_ref", None)
+        yield OrderImportRow(row=row, ref=str(ref) if ref is not None else None, data=data)
+
+
+def _cells(record: dict, columns: List[str]) -> dict:
+    """Celdas no vacías de las columnas indicadas; pydantic convierte los textos a números y fechas."""
+    return {column: record[column].strip() for column in columns if (record.get(column) or "").strip()}
+
+
+def _csv_detail(record: dict) -> dict:
+    detail = _cells(record, CSV_DETAIL_COLUMNS)
+    raw_extras = (record.get(CSV_EXTRAS_COLUMN) or "").strip()
+    if raw_extras:
+        try:
+            detail["extra_options"] = json.loads(raw_extras)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"extra_options no es una lista JSON válida: {e.msg}")
+    return detail
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[OrderImportRow]:
+    """
+    CSV con encabezado y una fila por detalle; las filas de un mismo pedido comparten order_ref
+    y deben ir seguidas. El número de fila reportado es el de la primera fila del pedido.
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None or "order_ref" not in reader.fieldnames:
+        yield OrderImportRow(row=1, error="El CSV debe tener encabezado con la columna order_ref.")
+        return
+
+    seen_refs = set()
+    current: Optional[OrderImportRow] = None
+    for record in reader:
+        # line_num cuenta el encabezado, así que coincide con la línea del archivo
+        row = reader.line_num
+        ref = (record.get("order_ref") or "").strip()
+        if not ref:
+            yield OrderImportRow(row=row, error="Fila sin order_ref.")
+            continue
+
+        if current is None or ref != current.ref:
+            if current is not None:
+                yield current
+            if ref in seen_refs:
+                current = OrderImportRow(row=row, ref=ref, error="Las filas de un pedido deben ir seguidas (order_ref repetido).")
+            else:
+                current = OrderImportRow(row=row, ref=ref, data={**_cells(record, CSV_ORDER_COLUMNS), "details": []})
+            seen_refs.add(ref)
+
+        if current.error is None and (record.get("product_id") or "").strip():
+            try:
+                current.data["details"].append(_csv_detail(record))
+            except ValueError as e:
+                current.data, current.error = None, f"Fila {row}: {e}"
+
+    if current is not None:
+        yield current
@@ -0,0 +1,111 @@
+# src/services/order_pdf/pdf_batch.py
+import asyncio
+import os
+import zipfile
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from src.application.exceptions import NotFoundException
+from src.services.order_pdf.pdf_cache import compute_pdf_cache_key, pdf_disk_cache
+from src.services.order_pdf.pdf_executor import pdf_render_executor
+
+# Máximo de pedidos por exportación (protege contra rangos de fechas demasiado amplios)
+PDF_BATCH_MAX_ORDERS = int(os.getenv("PDF_BATCH_MAX_ORDERS", "1000"))
+
+
+class _ZipChunkWriter:
+    """
+    Destino no posicionable para zipfile: acumula lo escrito hasta que se drena.
+    Sin seek/tell, zipfile escribe descriptores de datos tras cada archivo, así
+    cada PDF se puede enviar apenas termina y el ZIP nunca está completo en memoria.
+    """
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _read_cached_pdf(order_id: int, cache_key: str) -> Optional[bytes]:
+    """Lee el PDF cacheado (E/S de disco, se ejecuta en el threadpool); None si no existe o fue desalojado."""
+    cached_path = pdf_disk_cache.get(order_id, cache_key)
+    if not cached_path:
+        return None
+    try:
+        with open(cached_path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+async def _get_order_pdf(order_id: int, load_order: Callable[[int], Tuple[object, List[dict]]]) -> bytes:
+    """Carga el pedido, reutiliza el PDF cacheado si existe y si no lo genera en el pool de procesos."""
+    order, display_items = await run_in_threadpool(load_order, order_id)
+    cache_key = compute_pdf_cache_key(order, display_items)
+    cached = await run_in_threadpool(_read_cached_pdf, order_id, cache_key)
+    if cached is not None:
+        return cached
+    pdf_bytes = await pdf_render_executor.render_order_pdf(order, display_items, wait=True)
+    await run_in_threadpool(pdf_disk_cache.put, order_id, cache_key, pdf_bytes)
+    return pdf_bytes
+
+
+async def stream_orders_pdf_zip(
+    order_ids: List[int],
+    load_order: Callable[[int], Tuple[object, List[dict]]]
+) -> AsyncIterator[bytes]:
+    """
+    Genera los PDFs de los pedidos en paralelo y emite el ZIP por partes a medida que cada uno termina.
+    En memoria solo hay como máximo tantos PDFs como workers tiene el pool.
+    `load_order` es síncrono (abre su propia sesión de BD) y devuelve (orden, ítems del PDF).
+    Los pedidos que fallan se listan en 'errores.txt' al final del archivo.
+    """
+    writer = _ZipChunkWriter()
+    errors = []
+    max_in_flight = pdf_render_executor.workers
+    pending_ids = iter(order_ids)
+    in_flight = {}
+
+    def schedule_next() -> bool:
+        order_id = next(pending_ids, None)
+        if order_id is None:
+            return False
+        in_flight[asyncio.ensure_future(_get_order_pdf(order_id, load_order))] = order_id
+        return True
+
+    # Los PDF ya vienen comprimidos: ZIP_STORED evita gastar CPU del event loop en deflate
+    with zipfile.ZipFile(writer, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        try:
+            while len(in_flight) < max_in_flight and schedule_next():
+                pass
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    order_id = in_flight.pop(task)
+                    try:
+                        archive.writestr(f"orden_{order_id}.pdf", task.result())
+                    except NotFoundException as e:
+                        errors.append(f"{order_id}: {e.message}")
+                    except Exception as e:
+                        errors.append(f"{order_id}: {e}")
+                    schedule_next()
+                chunk = writer.drain()
+                if chunk:
+                    yield chunk
+            if errors:
+                archive.writestr("errores.txt", "\n".join(errors))
+        finally:
+            # Si el cliente se desconecta, se cancelan los PDFs pendientes
+            for task in in_flight:
+                task.cancel()
+    yield writer.drain()
@@ -0,0 +1,139 @@
+# src/services/order_pdf/pdf_cache.py
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from src.services.order_pdf.pdf_resources import get_pdf_resources
+
+load_dotenv()
+
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join(tempfile.gettempdir(), "cotizacion_pdf_cache"))
+PDF_CACHE_MAX_MB = int(os.getenv("PDF_CACHE_MAX_MB", "256"))
+
+# Se incrementa cuando cambia el diseño del PDF para no servir archivos generados con la versión anterior
+PDF_LAYOUT_VERSION = "3"
+
+
+def _order_fingerprint(order) -> dict:
+    """Campos de la orden que influyen en el PDF."""
+    return {
+        "id": order.id,
+        "updated_at": order.updated_at.isoformat() if order.updated_at else None,
+        "total_amount": order.total_amount,
+        "profit_margin": order.profit_margin,
+        "discount_applied": order.discount_applied,
+        "final_amount": order.final_amount,
+        "store": order.store.model_dump(mode="json") if order.store else None,
+        "customer": order.customer.model_dump(mode="json") if order.customer else None,
+    }
+
+
+def compute_pdf_cache_key(order, display_items: List[dict]) -> str:
+    """
+    Clave direccionada por contenido: hash de la orden + ítems enviados + versión del diseño y de los assets.
+    Dos solicitudes con el mismo contenido producen el mismo PDF, así que comparten archivo (y ETag).
+    """
+    payload = {
+        "layout": PDF_LAYOUT_VERSION,
+        "assets": get_pdf_resources().asset_hash,
+        "order": _order_fingerprint(order),
+        "items": display_items,
+    }
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class PdfDiskCache:
+    """
+    Caché de PDFs generados en disco local.
+    Cada archivo se llama `order_{id}_{clave}.pdf`; el mtime hace de marca LRU
+    (se actualiza en cada acierto) y al superar `max_bytes` se eliminan los más antiguos.
+    """
+    def __init__(self, directory: str = PDF_CACHE_DIR, max_bytes: int = PDF_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, order_id: int, key: str) -> str:
+        return os.path.join(self.directory, f"order_{order_id}_{key}.pdf")
+
+    def get(self, order_id: int, key: str) -> Optional[str]:
+        """Retorna la ruta del PDF cacheado (marcándolo como usado recientemente) o None."""
+        path = self._path(order_id, key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, order_id: int, key: str, data: bytes) -> str:
+        """Guarda el PDF de forma atómica (archivo temporal + rename) y aplica la política de tamaño."""
+        path = self._path(order_id, key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+        return path
+
+    def invalidate_order(self, order_id: int) -> None:
+        """Elimina todas las versiones cacheadas del PDF de una orden."""
+        prefix = f"order_{order_id}_"
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.startswith(prefix) and entry.name.endswith(".pdf"):
+                    self._remove(entry.path)
+
+    def invalidate_orders(self, order_ids) -> None:
+        """Como invalidate_order, pero para varias órdenes recorriendo el directorio una sola vez."""
+        prefixes = tuple(f"order_{order_id}_" for order_id in order_ids)
+        if not prefixes:
+            return
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.startswith(prefixes) and entry.name.endswith(".pdf"):
+                    self._remove(entry.path)
+
+    def _evict(self) -> None:
+        """Elimina los archivos menos usados recientemente hasta quedar por debajo del límite."""
+        with self._lock:
+            files = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".pdf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+            if total <= self.max_bytes:
+                return
+            files.sort()
+            for _, size, path in files:
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+pdf_disk_cache = PdfDiskCache()
@@ -0,0 +1,107 @@
+# src/services/order_pdf/pdf_executor.py
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from src.application.exceptions import ServiceUnavailableException
+
+load_dotenv()
+
+# Procesos dedicados a ReportLab (CPU-bound) y cuántos PDFs pueden esperar turno además de los que se están generando
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", "2"))
+PDF_RENDER_QUEUE_LIMIT = int(os.getenv("PDF_RENDER_QUEUE_LIMIT", "8"))
+# Segundos sugeridos al cliente (cabecera Retry-After) cuando el pool está saturado
+PDF_RENDER_RETRY_AFTER = int(os.getenv("PDF_RENDER_RETRY_AFTER", "5"))
+
+
+def _init_worker():
+    """Precarga estilos e imágenes en cada proceso hijo para que el primer PDF no pague ese costo."""
+    from src.services.order_pdf.pdf_resources import get_pdf_resources
+    get_pdf_resources()
+
+
+def _render_order_pdf(order, display_items: List[dict]) -> bytes:
+    """Se ejecuta en el proceso hijo: genera el PDF y devuelve los bytes (un BytesIO no viaja bien entre procesos)."""
+    from src.services.order_pdf.pdf_generator import generate_order_pdf
+    return generate_order_pdf(order=order, display_items=display_items).getvalue()
+
+
+class PdfRenderExecutor:
+    """
+    Pool de procesos acotado para generar PDFs fuera del event loop.
+    Admite como máximo `workers + queue_limit` PDFs en vuelo; por encima de eso
+    rechaza de inmediato con ServiceUnavailableException (503 + Retry-After)
+    en lugar de encolar sin límite.
+    """
+    def __init__(self, workers: int = PDF_RENDER_WORKERS, queue_limit: int = PDF_RENDER_QUEUE_LIMIT,
+                 retry_after: int = PDF_RENDER_RETRY_AFTER):
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_limit)
+        self.retry_after = retry_after
+        # Solo se usa desde el event loop: un asyncio.Semaphore despierta a quien espera al liberarse un lugar
+        self._slots = asyncio.BoundedSemaphore(self.capacity)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: no hereda el estado del proceso padre (conexiones a la BD, hilos de uvicorn)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker
+                )
+            return self._pool
+
+    def _reset_pool(self, broken: ProcessPoolExecutor):
+        """Descarta un pool roto (p. ej. un hijo murió) para que la siguiente solicitud cree uno nuevo."""
+        with self._pool_lock:
+            if self._pool is broken:
+                self._pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def _acquire_slot(self):
+        """Toma un lugar libre sin esperar; si el pool está lleno (o hay otros esperando) responde 503."""
+        if self._slots.locked():
+            raise ServiceUnavailableException(
+                "El servicio de generación de PDF está saturado, intente nuevamente en unos segundos.",
+                retry_after=self.retry_after
+            )
+        # Con lugares libres acquire() no suspende, así que nadie puede ganar el lugar entre la comprobación y la toma
+        await self._slots.acquire()
+
+    async def render_order_pdf(self, order, display_items: List[dict], wait: bool = False) -> bytes:
+        """
+        Genera el PDF de una orden en el pool de procesos sin bloquear el event loop.
+        Con wait=True (exportaciones masivas) espera un lugar libre en vez de responder 503.
+        """
+        if wait:
+            await self._slots.acquire()
+        else:
+            await self._acquire_slot()
+        try:
+            pool = self._get_pool()
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(pool, _render_order_pdf, order, display_items)
+            except BrokenProcessPool:
+                self._reset_pool(pool)
+                raise
+        finally:
+            self._slots.release()
+
+    def shutdown(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+pdf_render_executor = PdfRenderExecutor()
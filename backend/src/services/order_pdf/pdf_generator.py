@@ -1,17 +1,15 @@
 from pydantic import BaseModel
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import Image
 from io import BytesIO
 from typing import List, Optional
-from datetime import datetime
-import locale
-from zoneinfo import ZoneInfo
 
 from src.services.order_pdf.number_to_text import convert_number_to_text
+from src.services.order_pdf.pdf_resources import get_pdf_resources
+from src.services.order_pdf.pdf_template import StorePageTemplate
+from src.domain.services.pricing import AREA, FIXED, LINEAR, EXTRA_GIGA_SELECT_IDS, extra_option_rule, product_rule
 from src.application.dtos.order import OrderResponseDto
 from src.application.dtos.customer import CustomerResponseDto
 from src.application.dtos.order_detail import OrderDetailResponseDto
@@ -45,203 +43,6 @@ class DisplayCartItemSchema(BaseModel):
     class Config:
         from_attributes = True # Para permitir mapeo si se usa de forma diferente
 
-LOGO_PATH = "./src/shared/generate_pdf/laser.png"
-FOOTER_UBICATION = "./src/shared/generate_pdf/footer_ubication.png"
-LOGO_BCP = "./src/shared/generate_pdf/bcp.png"
-LOGO_VISA = "./src/shared/generate_pdf/visa.png"
-LOGO_YAPE = "./src/shared/generate_pdf/yape.png"
-
-def _header_footer_template(canvas_obj, doc, store_info):
-    """
-    Función que dibuja el encabezado y pie de página en cada página del PDF,
-    incluyendo un logo en el encabezado.
-    """
-    canvas_obj.saveState()
-    styles = getSampleStyleSheet()
-    try:
-        locale.setlocale(locale.LC_TIME, 'es_ES.UTF-8')
-    except locale.Error:
-        try:
-            locale.setlocale(locale.LC_TIME, 'es_ES')
-        except locale.Error:
-            pass  # fallback to default
-    
-    # Estilos específicos para header/footer
-    styles.add(ParagraphStyle(name='HeaderCompanyFixedStyle', fontSize=9, leading=12, alignment=0, fontName='Helvetica'))
-    styles.add(ParagraphStyle(name='HeaderClientFixedStyle', fontSize=9, leading=11, alignment=0, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name='DateStyle', fontSize=11, leading=11, alignment=0, fontName='Helvetica'))
-    styles.add(ParagraphStyle(name='NormalFixedStyle', fontSize=8, leading=10, spaceAfter=1))
-    styles.add(ParagraphStyle(name='FooterContactInfoStyle', fontSize=13, leading=16, alignment= 1, fontName='Helvetica', spaceAfter=6, spaceBefore=2 , ))
-    styles.add(ParagraphStyle(name='PageNumberStyle', fontSize=8, leading=10, alignment=2)) # Para el número de página
-
-    #############################
-    ######## H E A D E R ########
-    #############################
-    # Posiciones fijas para el encabezado
-    header_y_start = A4[1] - 20 * mm   # 15mm desde el borde superior
-   
-    # Información de la empresa    # Fecha del documento
-    doc_date_p = Paragraph(f"Lima, {datetime.now().strftime('%d de %B del %Y')}", styles['DateStyle'])
-    doc_date_p.wrapOn(canvas_obj, doc.width, doc.height)
-    doc_date_p.drawOn(canvas_obj, doc.leftMargin + 2 * mm, header_y_start + 10 * mm)  # Ajusta la posición Y según sea necesario
-
-    logo_width = 75 * mm
-    logo_height = 22.5 * mm # Ajusta esto para mantener la proporción o especifica ambos
-    logo_x = A4[0] - doc.rightMargin - logo_width 
-    logo_y = header_y_start 
-    canvas_obj.drawImage(LOGO_PATH, logo_x, logo_y, width=logo_width, height=logo_height, preserveAspectRatio=True)
-
-    #############################
-    ######## F O O T E R ########
-    #############################
-    footer_y_start = 50 * mm  # 50mm desde el borde inferior
-
-    styles.add(ParagraphStyle(name='TablePay', fontSize=12, leading=12, alignment=1, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name='TableContent', fontSize=10, leading=12, alignment=0, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name='NoteFooter', fontSize=10, leading=12, alignment=0, fontName='Helvetica'))
-
-    # Dibujar una tabla de 2 filas y 1 columna , la primera fila background rojo que dira "Modalidad de pago" y la otra fila estara inicialmente como espacio vacio visible
-    adelanto = Paragraph("- Se procede la impresión previa autorización del cliente.", styles['NoteFooter'])
-    no_delivery = Paragraph("- El delivery no esta considerado en la cotización.", styles['NoteFooter'])
-    title_footer_table = Paragraph("<b><font color=white>Modalidad de pago</font></b>", styles['TablePay'])
-    efectivo = Paragraph("Efectivo:", styles['TableContent'])
-    transferencia_bancaria = Paragraph("Transferencia Bancaria:", styles['TableContent'])    
-    nro_cuenta = Paragraph("Nro. de Cuenta BCP:", styles['TableContent'])
-    nro_cuenta_value = Paragraph(f"{store_info.bcp_cta}", styles['TableContent'])
-    nro_cci = Paragraph("Nro. de CCI Interbancaria:", styles['TableContent'])
-    nro_cci_value = Paragraph(f"{store_info.bcp_cci}", styles['TableContent'])
-
-    bcp_logo = Image(LOGO_BCP, width=12 * mm, height=3 * mm)
-    visa_logo = Image(LOGO_VISA, width=12 * mm, height= 4 * mm)
-    yape_logo = Image(LOGO_YAPE, width= 10 * mm, height= 10 * mm)
-
-    payment_terms_table_data = [
-        [adelanto,''],
-        [no_delivery,''],
-        [title_footer_table, ''],
-        [efectivo,visa_logo, yape_logo],
-        [transferencia_bancaria, bcp_logo],
-        [nro_cuenta,nro_cuenta_value,''] ,
-        [nro_cci, nro_cci_value,''] 
-    ]
-    footer_payment_info_table = Table(
-        payment_terms_table_data,
-        colWidths=[(doc.width / 2 + 15 * mm) * 0.45, 
-                   (doc.width / 2 + 15 * mm) * 0.15,
-                    (doc.width / 2 + 15 * mm) * 0.40
-                  ]  # Ajusta proporción texto/logo
-    )
-    
-    footer_payment_info_table.setStyle(TableStyle([ 
-        ('SPAN', (0, 0), (2, 0)),
-        ('SPAN', (0, 1), (2, 1)), # Fusiona las dos celdas de la primera fila
-        ('SPAN', (0, 2), (2, 2)),  # La primera fila abarca ambas columnas
-        ('BACKGROUND', (0, 2), (2, 2), colors.HexColor("#ec2e2c")),  # Rojo para la primera fila   
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),  # Fuente negrita
-        ('FONTSIZE', (0, 0), (-1, -1), 10) , # Tamaño de fuente
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('BOX', (0, 2), (-1, -1), 0.5, colors.black),  # Borde de la tabla
-        ('SPAN', (1, 5), (2, 5)),
-        ('SPAN', (1, 6), (2, 6)),
-    ]))
-    footer_payment_info_table.wrapOn(canvas_obj, doc.width, doc.bottomMargin)
-    footer_payment_info_table.drawOn(canvas_obj, doc.leftMargin, 23 * mm)  # Ajusta la posición Y según sea necesario      
-
-    phone = ''
-    for i in range(len(store_info.phone_number)):
-        if i == 3:
-            phone += ' '
-        if i == 6:
-            phone += ' '
-        if i == 9:
-            phone += ' '
-        phone += store_info.phone_number[i]
-    
-    # Footer con información de contacto y ubicación
-    styles.add(ParagraphStyle(name='FooterContact', fontSize=10,  alignment=0, fontName='Helvetica'))
-
-    email_logo = Image("./src/shared/generate_pdf/email.png", width=5 * mm, height=5 * mm)
-    web_logo = Image("./src/shared/generate_pdf/web.png", width=5 * mm, height=5 * mm)
-    phone_logo = Image("./src/shared/generate_pdf/phone.png", width=5 * mm, height=5 * mm)
-
-    email = Paragraph(f"{store_info.email}", styles['FooterContact'])
-    web_laser = Paragraph("www.lasercolorveloz.com", styles['FooterContact'])
-    web_toque = Paragraph("www.toqueunicoperu.com", styles['FooterContact'])
-    contact_phone = Paragraph(f"{phone}", styles['FooterContact'])
-
-    contact_table_data = [
-        [email_logo,email,phone_logo,contact_phone],  # Primera fila con email y teléfono
-        [web_logo,web_laser , web_logo,web_toque],  # Segunda fila con web y teléfono,
-    ]
-    footer_contact_info_table = Table(
-        contact_table_data,
-        colWidths=[(doc.width / 2 - 4 * mm)* 0.07 ,
-                   (doc.width / 2 - 4 * mm) * 0.61,
-                   (doc.width / 2 - 4 * mm)* 0.07,
-                   (doc.width / 2 - 4 * mm)* 0.6   ]  # Ajusta el ancho de la columna
-    )
-    footer_contact_info_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-    footer_contact_info_table.wrapOn(canvas_obj, doc.width / 2, doc.bottomMargin)
-    footer_contact_info_table.drawOn(canvas_obj, doc.leftMargin, 5 * mm)  # Ajusta la posición Y según sea necesario
-
-    footer_ubication_width = 85 * mm  # Ancho del box de ubicación
-    footer_ubication_height = 65 * mm  # Alto del box de ubicación
-    footer_ubication_x = A4[0] - doc.rightMargin - footer_ubication_width + 9 * mm 
-    footer_ubication_y =  3 * mm     
-    canvas_obj.drawImage(FOOTER_UBICATION, footer_ubication_x, footer_ubication_y, width=footer_ubication_width, height=footer_ubication_height, preserveAspectRatio=True)
-
-
-    # Dirección (alineada a la derecha del contacto)
-    address_info = [
-        "C.C. Guizado Record Plaza",
-        "1er Piso",
-        "Stand 194",
-        "Jr. Huaraz 1717 (altura de la Cra. 9 de la Av. Brasil)",
-        "Breña"
-    ]
-
-
-    box_width = 65 * mm  # Ajusta el ancho según lo que quieras probar
-    # Calcula el alto real sumando el alto de cada línea
-    line_heights = []
-    for line in address_info:
-        p = Paragraph(line, styles['FooterContactInfoStyle'])
-        w, h = p.wrap(box_width - 4 * mm, doc.bottomMargin)
-        line_heights.append(h)
-
-    box_x = doc.leftMargin + doc.width / 2 + 38 * mm
-    box_y = 17 * mm + sum(line_heights[::-1][1:])  # Ajusta según tu diseño
-
-    # Dibuja las líneas de dirección dentro del box, una debajo de otra
-    current_y = box_y - 2 * mm  # Empieza desde arriba, deja margen superior
-    for i, line in enumerate(address_info):
-        p = Paragraph(line, styles['FooterContactInfoStyle'])
-        w, h = p.wrap(box_width - 4 * mm, doc.bottomMargin)
-        p.drawOn(canvas_obj, box_x , current_y - h ) 
-        current_y -= h
-
-    # Número de página (centrado en el pie de página)
-    page_number = Paragraph(f"P. {doc.page}", styles['PageNumberStyle'])
-    page_number.wrapOn(canvas_obj, doc.width, doc.bottomMargin)
-    page_number_x = (doc.width - page_number.width) / 2 + doc.leftMargin
-    page_number_y =  3 * mm  # Ajusta la posición Y según sea necesario
-    page_number.drawOn(canvas_obj, page_number_x, page_number_y)
-
-    # Fecha de generación del PDF
-    generated_date = datetime.now(ZoneInfo("America/Lima")).strftime("%d/%m/%Y %H:%M:%S")
-    generated_date_p = Paragraph(f"Generado el: {generated_date}", styles['PageNumberStyle'])
-    generated_date_p.wrapOn(canvas_obj, doc.width, doc.bottomMargin)
-    generated_date_x =  0 * mm
-    generated_date_y = 3 * mm  # Ajusta la posición Y según sea necesario
-    generated_date_p.drawOn(canvas_obj, generated_date_x, generated_date_y)     
-    
-    canvas_obj.restoreState()
-
 def generate_order_pdf(
     order: OrderResponseDto,
     display_items: List[dict]
@@ -254,22 +55,8 @@ def generate_order_pdf(
                             rightMargin=20, leftMargin=20,
                             topMargin=23 * mm, bottomMargin=68 * mm)
     
-    styles = getSampleStyleSheet()
-    
-    # Estilos personalizados
-    styles.add(ParagraphStyle(name='Intro', fontSize=12, leading=28, alignment=0,  fontName='Helvetica'))
-    styles.add(ParagraphStyle(name='IntroIdent', fontSize=12, leading=28, alignment=0, firstLineIndent=100, fontName='Helvetica'))
-    styles.add(ParagraphStyle(name='HeaderStyle', fontSize=12, leading=14, spaceAfter=6, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name='NormalStyle', fontSize=12, leading=12, spaceAfter=1))
-    styles.add(ParagraphStyle(name='ItemHeaderStyle', fontSize=10, leading=12, alignment=1, fontName='Helvetica-Bold'),)
-    styles.add(ParagraphStyle(name='ItemDataStyle', fontSize=9, leading=11 , alignment=2, fontName='Helvetica'))
-    styles.add(ParagraphStyle(name='TotalStyle', fontSize=14, leading=16, alignment=2, fontName='Helvetica-Bold'))
-    styles.add(ParagraphStyle(name='CodeName', fontSize=10, leading=10, alignment=1, ))
-    styles.add(ParagraphStyle(name='NumberItem', fontSize=10, leading=10, alignment=1, ))
-    styles.add(ParagraphStyle(name="ProductName", fontSize=10, leading=10, alignment=0, fontName='Helvetica'))
-    styles.add(ParagraphStyle(name="Quantity", fontSize=10, leading=10, alignment=1, fontName='Helvetica'))
-
-
+    # Estilos personalizados (compartidos por el proceso, ver pdf_resources)
+    styles = get_pdf_resources().styles
 
     elements = []
 
@@ -336,9 +123,10 @@ def generate_order_pdf(
         subtotal = product.get('subtotal') 
         total_extra_options = product.get('total_extra_options') 
 
-        if product_id == 1:
+        rule = product_rule(product_id)
+        if rule == AREA:
              product_name = f"<b>{product_name}</b> | Largo: {linear_meter}m | Ancho: {width}m | Area: {linear_meter * width} m²"
-        elif product_id is not None and 2 <= product_id <= 9:
+        elif rule == LINEAR:
             product_name  = f"<b>{product_name}</b> | Metro Lineal: {linear_meter} m"
 
         data.append([
@@ -374,18 +162,18 @@ def generate_order_pdf(
 
 
                 extra_price = extra.get('price')
-                if 1 <= extra_option_id <= 4:
-                    if 1 <= extra_option_id <= 2:
-                        extra_name += f" | Seleccionado: {extra.get('giga_select')}"
-                if extra_linear_meter and 5 <= extra_option_id <= 8:
+                extra_rule = extra_option_rule(extra_option_id)
+                if extra_option_id in EXTRA_GIGA_SELECT_IDS:
+                    extra_name += f" | Seleccionado: {extra.get('giga_select')}"
+                if extra_linear_meter and extra_rule == LINEAR:
                     extra_name += f" | Metro Lineal: {extra_linear_meter} m"
-                if extra_linear_meter and 10 <= extra_option_id <= 13:
+                if extra_linear_meter and extra_rule == AREA:
                     extra_name += f" | Largo: {extra_linear_meter}m | Ancho: {extra_width}m"
 
-                importe = extra_price * extra_quantity
-                if 15 <= extra_option_id <= 21:
-                    importe = extra_price
-                
+                # Mismo importe con el que se guardó el pedido (precio x cantidad, monto fijo para las extras fijas),
+                # para que las filas sumen el "Sub Total Producto" persistido
+                importe = extra_price if extra_rule == FIXED else extra_price * extra_quantity
+
                 data.append([
                     Paragraph("", ),
                     Paragraph("", ),
@@ -478,11 +266,8 @@ def generate_order_pdf(
     elements.append(table)
     elements.append(Spacer(1, 0.2 * inch))
 
-    # doc.build(elements, onFirstPage=_header_footer_template, onLaterPages=_header_footer_template)
-    doc.build(
-        elements,
-        onFirstPage=lambda canvas_obj, doc: _header_footer_template(canvas_obj, doc, store_info),
-        onLaterPages=lambda canvas_obj, doc: _header_footer_template(canvas_obj, doc, store_info)
-    )
+    # Encabezado/pie de página: la parte fija se dibuja una vez como form XObject (ver pdf_template)
+    page_template = StorePageTemplate(store_info)
+    doc.build(elements, onFirstPage=page_template, onLaterPages=page_template)
     buffer.seek(0)
     return buffer
\ No newline at end of file
@@ -0,0 +1,145 @@
+# src/services/order_pdf/pdf_resources.py
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+ASSETS_DIR = "./src/shared/generate_pdf"
+
+# Imágenes estáticas usadas en el encabezado/pie de página de las cotizaciones
+IMAGE_PATHS = {
+    "laser": f"{ASSETS_DIR}/laser.png",
+    "footer_ubication": f"{ASSETS_DIR}/footer_ubication.png",
+    "bcp": f"{ASSETS_DIR}/bcp.png",
+    "visa": f"{ASSETS_DIR}/visa.png",
+    "yape": f"{ASSETS_DIR}/yape.png",
+    "email": f"{ASSETS_DIR}/email.png",
+    "web": f"{ASSETS_DIR}/web.png",
+    "phone": f"{ASSETS_DIR}/phone.png",
+}
+
+# Meses en español: evita depender de locale.setlocale, que es global al proceso y no es seguro entre hilos
+MONTHS_ES = [
+    "enero", "febrero", "marzo", "abril", "mayo", "junio",
+    "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"
+]
+
+
+@dataclass(frozen=True)
+class PdfResources:
+    """
+    Recursos inmutables compartidos por todas las generaciones de PDF del proceso:
+    la hoja de estilos completa, las imágenes ya decodificadas y el hash de esas imágenes
+    (sirve para invalidar cachés derivadas cuando cambian los assets).
+    """
+    styles: StyleSheet1
+    images: Mapping[str, ImageReader]
+    asset_hash: str
+
+
+class CachedImage(Flowable):
+    """
+    Flowable que dibuja un ImageReader ya decodificado.
+    Reemplaza a platypus.Image, que vuelve a leer el archivo en cada instancia.
+    """
+    def __init__(self, reader: ImageReader, width: float, height: float, mask: Optional[str] = "auto"):
+        super().__init__()
+        self.reader = reader
+        self.width = width
+        self.height = height
+        self.mask = mask
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, width=self.width, height=self.height, mask=self.mask)
+
+
+def _build_styles() -> StyleSheet1:
+    """Construye la hoja de estilos con todos los estilos personalizados del PDF."""
+    styles = getSampleStyleSheet()
+
+    # Estilos del cuerpo del documento
+    styles.add(ParagraphStyle(name='Intro', fontSize=12, leading=28, alignment=0,  fontName='Helvetica'))
+    styles.add(ParagraphStyle(name='IntroIdent', fontSize=12, leading=28, alignment=0, firstLineIndent=100, fontName='Helvetica'))
+    styles.add(ParagraphStyle(name='HeaderStyle', fontSize=12, leading=14, spaceAfter=6, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='NormalStyle', fontSize=12, leading=12, spaceAfter=1))
+    styles.add(ParagraphStyle(name='ItemHeaderStyle', fontSize=10, leading=12, alignment=1, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='ItemDataStyle', fontSize=9, leading=11 , alignment=2, fontName='Helvetica'))
+    styles.add(ParagraphStyle(name='TotalStyle', fontSize=14, leading=16, alignment=2, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='CodeName', fontSize=10, leading=10, alignment=1, ))
+    styles.add(ParagraphStyle(name='NumberItem', fontSize=10, leading=10, alignment=1, ))
+    styles.add(ParagraphStyle(name="ProductName", fontSize=10, leading=10, alignment=0, fontName='Helvetica'))
+    styles.add(ParagraphStyle(name="Quantity", fontSize=10, leading=10, alignment=1, fontName='Helvetica'))
+
+    # Estilos específicos para header/footer
+    styles.add(ParagraphStyle(name='HeaderCompanyFixedStyle', fontSize=9, leading=12, alignment=0, fontName='Helvetica'))
+    styles.add(ParagraphStyle(name='HeaderClientFixedStyle', fontSize=9, leading=11, alignment=0, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='DateStyle', fontSize=11, leading=11, alignment=0, fontName='Helvetica'))
+    styles.add(ParagraphStyle(name='NormalFixedStyle', fontSize=8, leading=10, spaceAfter=1))
+    styles.add(ParagraphStyle(name='FooterContactInfoStyle', fontSize=13, leading=16, alignment= 1, fontName='Helvetica', spaceAfter=6, spaceBefore=2 , ))
+    styles.add(ParagraphStyle(name='PageNumberStyle', fontSize=8, leading=10, alignment=2)) # Para el número de página
+    styles.add(ParagraphStyle(name='TablePay', fontSize=12, leading=12, alignment=1, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='TableContent', fontSize=10, leading=12, alignment=0, fontName='Helvetica-Bold'))
+    styles.add(ParagraphStyle(name='NoteFooter', fontSize=10, leading=12, alignment=0, fontName='Helvetica'))
+    styles.add(ParagraphStyle(name='FooterContact', fontSize=10,  alignment=0, fontName='Helvetica'))
+    return styles
+
+
+def _load_image(path: str) -> ImageReader:
+    """
+    Decodifica una imagen una sola vez.
+    Se fuerza la lectura de los datos RGB (que también separa la máscara alfa) con la API
+    pública de ReportLab; si un hilo decodifica la máscara a la vez que otro, ambos
+    obtienen el mismo resultado, solo se repite trabajo.
+    """
+    reader = ImageReader(path)
+    reader.getSize()
+    reader.getRGBData()
+    return reader
+
+
+def _hash_assets() -> str:
+    """Calcula un hash estable del contenido de todas las imágenes estáticas."""
+    digest = hashlib.sha256()
+    for key in sorted(IMAGE_PATHS):
+        with open(IMAGE_PATHS[key], "rb") as f:
+            digest.update(key.encode())
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+_resources: Optional[PdfResources] = None
+_resources_lock = threading.Lock()
+
+
+def get_pdf_resources() -> PdfResources:
+    """
+    Retorna el registro de recursos del proceso, construyéndolo en el primer uso.
+    Seguro para el threadpool de FastAPI (doble verificación con lock).
+    """
+    global _resources
+    if _resources is None:
+        with _resources_lock:
+            if _resources is None:
+                images = {key: _load_image(path) for key, path in IMAGE_PATHS.items()}
+                _resources = PdfResources(
+                    styles=_build_styles(),
+                    images=MappingProxyType(images),
+                    asset_hash=_hash_assets()
+                )
+    return _resources
+
+
+@lru_cache(maxsize=8)
+def format_document_date(day: date) -> str:
+    """Formatea la fecha del documento en español (ej. '05 de julio del 2025')."""
+    return f"{day.day:02d} de {MONTHS_ES[day.month - 1]} del {day.year}"
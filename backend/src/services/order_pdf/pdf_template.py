@@ -0,0 +1,260 @@
+# src/services/order_pdf/pdf_template.py
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Tuple
+from zoneinfo import ZoneInfo
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.platypus import Paragraph, Table, TableStyle
+
+from src.services.order_pdf.pdf_resources import CachedImage, format_document_date, get_pdf_resources
+
+# Dirección (alineada a la derecha del contacto)
+ADDRESS_INFO = (
+    "C.C. Guizado Record Plaza",
+    "1er Piso",
+    "Stand 194",
+    "Jr. Huaraz 1717 (altura de la Cra. 9 de la Av. Brasil)",
+    "Breña"
+)
+ADDRESS_BOX_WIDTH = 65 * mm  # Ajusta el ancho según lo que quieras probar
+
+
+@dataclass(frozen=True)
+class StoreTemplateLayout:
+    """
+    Datos invariantes del encabezado/pie de página de una tienda.
+    Se calculan una sola vez por tienda (y versión de assets) y se reutilizan entre documentos.
+    """
+    key: str
+    phone: str
+    address_line_heights: Tuple[float, ...]
+
+    @property
+    def form_name(self) -> str:
+        return f"StoreTemplate_{self.key}"
+
+
+_layouts: Dict[str, StoreTemplateLayout] = {}
+_layouts_lock = threading.Lock()
+
+
+def _format_phone(phone_number: str) -> str:
+    """Agrupa el teléfono de 3 en 3 dígitos (ej. '987 654 321')."""
+    phone = ''
+    for i in range(len(phone_number)):
+        if i == 3:
+            phone += ' '
+        if i == 6:
+            phone += ' '
+        if i == 9:
+            phone += ' '
+        phone += phone_number[i]
+    return phone
+
+
+def _store_template_key(store_info) -> str:
+    """Clave de caché: ID de la tienda + hash de los datos impresos + hash de los assets."""
+    printed_fields = (store_info.bcp_cta, store_info.bcp_cci, store_info.phone_number, store_info.email)
+    digest = hashlib.sha256(repr(printed_fields).encode()).hexdigest()[:12]
+    return f"{store_info.id}_{digest}_{get_pdf_resources().asset_hash}"
+
+
+def get_store_layout(store_info, doc) -> StoreTemplateLayout:
+    """Obtiene (o calcula y guarda) el layout invariante de la tienda."""
+    key = _store_template_key(store_info)
+    layout = _layouts.get(key)
+    if layout is not None:
+        return layout
+
+    styles = get_pdf_resources().styles
+    # Calcula el alto real de cada línea de la dirección (antes se envolvía dos veces por página)
+    line_heights = []
+    for line in ADDRESS_INFO:
+        p = Paragraph(line, styles['FooterContactInfoStyle'])
+        w, h = p.wrap(ADDRESS_BOX_WIDTH - 4 * mm, doc.bottomMargin)
+        line_heights.append(h)
+
+    layout = StoreTemplateLayout(
+        key=key,
+        phone=_format_phone(store_info.phone_number or ''),
+        address_line_heights=tuple(line_heights)
+    )
+    with _layouts_lock:
+        _layouts[key] = layout
+    return layout
+
+
+def _draw_static_header_footer(canvas_obj, doc, store_info, layout: StoreTemplateLayout, doc_date: str):
+    """
+    Dibuja todo lo que no cambia entre páginas: fecha del documento, logo,
+    modalidad de pago, contacto, imagen de ubicación y dirección.
+    """
+    resources = get_pdf_resources()
+    styles = resources.styles
+    images = resources.images
+
+    #############################
+    ######## H E A D E R ########
+    #############################
+    # Posiciones fijas para el encabezado
+    header_y_start = A4[1] - 20 * mm   # 15mm desde el borde superior
+
+    # Información de la empresa    # Fecha del documento
+    doc_date_p = Paragraph(f"Lima, {doc_date}", styles['DateStyle'])
+    doc_date_p.wrapOn(canvas_obj, doc.width, doc.height)
+    doc_date_p.drawOn(canvas_obj, doc.leftMargin + 2 * mm, header_y_start + 10 * mm)  # Ajusta la posición Y según sea necesario
+
+    logo_width = 75 * mm
+    logo_height = 22.5 * mm # Ajusta esto para mantener la proporción o especifica ambos
+    logo_x = A4[0] - doc.rightMargin - logo_width
+    logo_y = header_y_start
+    canvas_obj.drawImage(images['laser'], logo_x, logo_y, width=logo_width, height=logo_height, preserveAspectRatio=True)
+
+    #############################
+    ######## F O O T E R ########
+    #############################
+    # Dibujar una tabla de 2 filas y 1 columna , la primera fila background rojo que dira "Modalidad de pago" y la otra fila estara inicialmente como espacio vacio visible
+    adelanto = Paragraph("- Se procede la impresión previa autorización del cliente.", styles['NoteFooter'])
+    no_delivery = Paragraph("- El delivery no esta considerado en la cotización.", styles['NoteFooter'])
+    title_footer_table = Paragraph("<b><font color=white>Modalidad de pago</font></b>", styles['TablePay'])
+    efectivo = Paragraph("Efectivo:", styles['TableContent'])
+    transferencia_bancaria = Paragraph("Transferencia Bancaria:", styles['TableContent'])
+    nro_cuenta = Paragraph("Nro. de Cuenta BCP:", styles['TableContent'])
+    nro_cuenta_value = Paragraph(f"{store_info.bcp_cta}", styles['TableContent'])
+    nro_cci = Paragraph("Nro. de CCI Interbancaria:", styles['TableContent'])
+    nro_cci_value = Paragraph(f"{store_info.bcp_cci}", styles['TableContent'])
+
+    bcp_logo = CachedImage(images['bcp'], width=12 * mm, height=3 * mm)
+    visa_logo = CachedImage(images['visa'], width=12 * mm, height= 4 * mm)
+    yape_logo = CachedImage(images['yape'], width= 10 * mm, height= 10 * mm)
+
+    payment_terms_table_data = [
+        [adelanto,''],
+        [no_delivery,''],
+        [title_footer_table, ''],
+        [efectivo,visa_logo, yape_logo],
+        [transferencia_bancaria, bcp_logo],
+        [nro_cuenta,nro_cuenta_value,''] ,
+        [nro_cci, nro_cci_value,'']
+    ]
+    footer_payment_info_table = Table(
+        payment_terms_table_data,
+        colWidths=[(doc.width / 2 + 15 * mm) * 0.45,
+                   (doc.width / 2 + 15 * mm) * 0.15,
+                    (doc.width / 2 + 15 * mm) * 0.40
+                  ]  # Ajusta proporción texto/logo
+    )
+
+    footer_payment_info_table.setStyle(TableStyle([
+        ('SPAN', (0, 0), (2, 0)),
+        ('SPAN', (0, 1), (2, 1)), # Fusiona las dos celdas de la primera fila
+        ('SPAN', (0, 2), (2, 2)),  # La primera fila abarca ambas columnas
+        ('BACKGROUND', (0, 2), (2, 2), colors.HexColor("#ec2e2c")),  # Rojo para la primera fila
+        ('TOPPADDING', (0, 0), (-1, -1), 2),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),  # Fuente negrita
+        ('FONTSIZE', (0, 0), (-1, -1), 10) , # Tamaño de fuente
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOX', (0, 2), (-1, -1), 0.5, colors.black),  # Borde de la tabla
+        ('SPAN', (1, 5), (2, 5)),
+        ('SPAN', (1, 6), (2, 6)),
+    ]))
+    footer_payment_info_table.wrapOn(canvas_obj, doc.width, doc.bottomMargin)
+    footer_payment_info_table.drawOn(canvas_obj, doc.leftMargin, 23 * mm)  # Ajusta la posición Y según sea necesario
+
+    # Footer con información de contacto y ubicación
+    email_logo = CachedImage(images['email'], width=5 * mm, height=5 * mm)
+    web_logo = CachedImage(images['web'], width=5 * mm, height=5 * mm)
+    phone_logo = CachedImage(images['phone'], width=5 * mm, height=5 * mm)
+
+    email = Paragraph(f"{store_info.email}", styles['FooterContact'])
+    web_laser = Paragraph("www.lasercolorveloz.com", styles['FooterContact'])
+    web_toque = Paragraph("www.toqueunicoperu.com", styles['FooterContact'])
+    contact_phone = Paragraph(f"{layout.phone}", styles['FooterContact'])
+
+    contact_table_data = [
+        [email_logo,email,phone_logo,contact_phone],  # Primera fila con email y teléfono
+        [web_logo,web_laser , web_logo,web_toque],  # Segunda fila con web y teléfono,
+    ]
+    footer_contact_info_table = Table(
+        contact_table_data,
+        colWidths=[(doc.width / 2 - 4 * mm)* 0.07 ,
+                   (doc.width / 2 - 4 * mm) * 0.61,
+                   (doc.width / 2 - 4 * mm)* 0.07,
+                   (doc.width / 2 - 4 * mm)* 0.6   ]  # Ajusta el ancho de la columna
+    )
+    footer_contact_info_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ]))
+    footer_contact_info_table.wrapOn(canvas_obj, doc.width / 2, doc.bottomMargin)
+    footer_contact_info_table.drawOn(canvas_obj, doc.leftMargin, 5 * mm)  # Ajusta la posición Y según sea necesario
+
+    footer_ubication_width = 85 * mm  # Ancho del box de ubicación
+    footer_ubication_height = 65 * mm  # Alto del box de ubicación
+    footer_ubication_x = A4[0] - doc.rightMargin - footer_ubication_width + 9 * mm
+    footer_ubication_y =  3 * mm
+    canvas_obj.drawImage(images['footer_ubication'], footer_ubication_x, footer_ubication_y, width=footer_ubication_width, height=footer_ubication_height, preserveAspectRatio=True)
+
+    box_x = doc.leftMargin + doc.width / 2 + 38 * mm
+    box_y = 17 * mm + sum(layout.address_line_heights[::-1][1:])  # Ajusta según tu diseño
+
+    # Dibuja las líneas de dirección dentro del box, una debajo de otra (alturas ya medidas en el layout)
+    current_y = box_y - 2 * mm  # Empieza desde arriba, deja margen superior
+    for line, h in zip(ADDRESS_INFO, layout.address_line_heights):
+        p = Paragraph(line, styles['FooterContactInfoStyle'])
+        p.wrap(ADDRESS_BOX_WIDTH - 4 * mm, doc.bottomMargin)
+        p.drawOn(canvas_obj, box_x , current_y - h )
+        current_y -= h
+
+
+def _draw_page_stamp(canvas_obj, doc, generated_date: str):
+    """Dibuja lo único que cambia entre páginas: número de página y fecha de generación."""
+    styles = get_pdf_resources().styles
+
+    # Número de página (centrado en el pie de página)
+    page_number = Paragraph(f"P. {doc.page}", styles['PageNumberStyle'])
+    page_number.wrapOn(canvas_obj, doc.width, doc.bottomMargin)
+    page_number_x = (doc.width - page_number.width) / 2 + doc.leftMargin
+    page_number_y =  3 * mm  # Ajusta la posición Y según sea necesario
+    page_number.drawOn(canvas_obj, page_number_x, page_number_y)
+
+    # Fecha de generación del PDF
+    generated_date_p = Paragraph(f"Generado el: {generated_date}", styles['PageNumberStyle'])
+    generated_date_p.wrapOn(canvas_obj, doc.width, doc.bottomMargin)
+    generated_date_x =  0 * mm
+    generated_date_y = 3 * mm  # Ajusta la posición Y según sea necesario
+    generated_date_p.drawOn(canvas_obj, generated_date_x, generated_date_y)
+
+
+class StorePageTemplate:
+    """
+    Callback de página (onFirstPage/onLaterPages) para un documento.
+    La parte fija se dibuja una sola vez como form XObject de ReportLab y en cada
+    página solo se referencia (doForm) y se estampan el número de página y la fecha de generación.
+    Los form XObject pertenecen a un documento, por eso se crea una instancia por PDF;
+    lo que se comparte entre documentos es el layout de la tienda (get_store_layout).
+    """
+    def __init__(self, store_info):
+        self.store_info = store_info
+        now = datetime.now(ZoneInfo("America/Lima"))
+        self.doc_date = format_document_date(now.date())
+        self.generated_date = now.strftime("%d/%m/%Y %H:%M:%S")
+        self._form_name = None
+
+    def __call__(self, canvas_obj, doc):
+        canvas_obj.saveState()
+        if self._form_name is None:
+            layout = get_store_layout(self.store_info, doc)
+            canvas_obj.beginForm(layout.form_name)
+            _draw_static_header_footer(canvas_obj, doc, self.store_info, layout, self.doc_date)
+            canvas_obj.endForm()
+            self._form_name = layout.form_name
+        canvas_obj.doForm(self._form_name)
+        _draw_page_stamp(canvas_obj, doc, self.generated_date)
+        canvas_obj.restoreState()
@@ -1,19 +1,37 @@
-import pandas as pd
+import csv
 from io import StringIO
+from typing import Iterable, Iterator
 
-def generate_orders_csv(orders):
-    data = []
-    for order in orders:
-        data.append({
-            "ID": order.id,
-            "Cliente": getattr(order.customer, "name", ""),
-            "Tienda": getattr(order.store, "name", ""),
-            "Estado": getattr(order.status, "name", ""),
-            "Total": order.final_amount,
-            "Fecha": order.created_at.strftime("%d/%m/%Y %H:%M") if order.created_at else ""
-        })
-    df = pd.DataFrame(data)
-    output = StringIO()
-    df.to_csv(output, index=False)
-    output.seek(0)
-    return output
\ No newline at end of file
+REPORT_HEADER = ["ID", "Cliente", "Tienda", "Estado", "Total", "Fecha"]
+
+# Filas que se acumulan antes de emitir un bloque al StreamingResponse
+CSV_CHUNK_ROWS = 500
+
+
+def generate_orders_csv(rows: Iterable[tuple]) -> Iterator[str]:
+    """
+    Genera el reporte de pedidos en CSV por bloques, sin armar el archivo completo en memoria.
+    Cada fila es (id, cliente, tienda, estado, total, fecha) tal como la devuelve el repositorio.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(REPORT_HEADER)
+
+    pending = 0
+    for order_id, customer_name, store_name, status_name, final_amount, created_at in rows:
+        writer.writerow([
+            order_id,
+            customer_name or "",
+            store_name or "",
+            status_name or "",
+            final_amount,
+            created_at.strftime("%d/%m/%Y %H:%M") if created_at else ""
+        ])
+        pending += 1
+        if pending >= CSV_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+
+    yield buffer.getvalue()
@@ -0,0 +1,27 @@
+import csv
+from io import StringIO
+from typing import List
+
+from src.application.dtos.sales_report import SalesReportRowDto
+
+SALES_REPORT_HEADER = ["Grupo", "Nombre", "Pedidos", "Cantidad", "Total", "Descuento", "Ganancia", "Monto Final"]
+
+
+def generate_sales_report_csv(rows: List[SalesReportRowDto]) -> StringIO:
+    """Genera el CSV del reporte agregado (unas pocas filas, se arma completo en memoria)."""
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(SALES_REPORT_HEADER)
+    for row in rows:
+        writer.writerow([
+            row.group_key,
+            row.group_label or "",
+            row.order_count,
+            row.quantity if row.quantity is not None else "",
+            f"{row.total_amount:.2f}",
+            f"{row.discount_applied:.2f}" if row.discount_applied is not None else "",
+            f"{row.profit:.2f}" if row.profit is not None else "",
+            f"{row.final_amount:.2f}" if row.final_amount is not None else ""
+        ])
+    output.seek(0)
+    return output
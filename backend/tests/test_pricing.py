@@ -0,0 +1,95 @@
+# tests/test_pricing.py
+import pytest
+
+from src.domain.services.pricing import (
+    AREA, FIXED, LINEAR, UNIT, ExtraOptionPriceInput, LinePriceInput,
+    extra_option_rule, list_price, price_extra_option, price_line, price_product, price_quote, product_rule, with_igv
+)
+
+
+def test_reglas_por_rango_de_id():
+    assert product_rule(1) == AREA
+    assert product_rule(2) == LINEAR
+    assert product_rule(9) == LINEAR
+    assert product_rule(10) == UNIT
+    assert product_rule(None) == UNIT
+    assert extra_option_rule(5) == LINEAR
+    assert extra_option_rule(10) == AREA
+    assert extra_option_rule(15) == FIXED
+    assert extra_option_rule(21) == FIXED
+    assert extra_option_rule(3) == UNIT
+
+
+def test_producto_por_unidad():
+    assert price_product(20, 12.5, 3) == 37.5
+
+
+def test_producto_por_metro_lineal():
+    assert price_product(2, 10.0, 2, linear_meter=1.5) == 30.0
+
+
+def test_producto_por_area():
+    assert price_product(1, 40.0, 2, linear_meter=1.5, width=0.8) == 96.0
+
+
+@pytest.mark.parametrize("product_id, linear_meter, width", [(1, 2.0, None), (1, None, 1.0), (2, None, None)])
+def test_producto_sin_medidas_requeridas(product_id, linear_meter, width):
+    with pytest.raises(ValueError):
+        price_product(product_id, 10.0, 1, linear_meter=linear_meter, width=width)
+
+
+def test_extras_por_regla():
+    assert price_extra_option(3, 6.0, 2) == 12.0
+    assert price_extra_option(5, 10.0, 2, linear_meter=2.5) == 50.0
+    assert price_extra_option(10, 15.0, 1, linear_meter=2.0, width=1.5) == 45.0
+
+
+def test_extra_fija_no_depende_de_cantidad_ni_medidas():
+    assert price_extra_option(15, 20.0, 4) == 20.0
+    assert price_extra_option(21, 20.0, 4, linear_meter=3.0, width=2.0) == 20.0
+
+
+def test_redondeo_a_centimos_mitades_al_par():
+    assert price_product(20, 0.125, 1) == 0.12
+    assert price_product(20, 0.375, 1) == 0.38
+    assert price_product(20, 1 / 3, 1) == 0.33
+
+
+def test_linea_suma_producto_y_extras():
+    line = price_line(LinePriceInput(
+        product_id=2, price=10.0, quantity=2, linear_meter=1.5,
+        extra_options=[
+            ExtraOptionPriceInput(extra_option_id=5, price=3.0, quantity=2, linear_meter=1.5),
+            ExtraOptionPriceInput(extra_option_id=16, price=7.5, quantity=3),
+        ]
+    ))
+    assert line.rule == LINEAR
+    assert line.subtotal == 30.0
+    assert [eo.amount for eo in line.extra_options] == [9.0, 7.5]
+    assert line.total_extra_options == 16.5
+    assert line.total == 46.5
+
+
+def test_cotizacion_margen_descuento_e_igv():
+    quote = price_quote([LinePriceInput(product_id=20, price=50.0, quantity=2)], margin=0.5, discount=10.0)
+    assert quote.profit_margin == 50.0
+    assert quote.total_amount == 140.0
+    assert quote.discount_applied == 10.0
+    assert quote.final_amount == 165.2
+    assert quote.igv == 25.2
+
+
+def test_descuento_igual_al_total_se_permite():
+    quote = price_quote([LinePriceInput(product_id=20, price=50.0, quantity=1)], margin=0.2, discount=60.0)
+    assert quote.total_amount == 0.0
+    assert quote.final_amount == 0.0
+
+
+def test_descuento_mayor_al_total_se_rechaza():
+    with pytest.raises(ValueError):
+        price_quote([LinePriceInput(product_id=20, price=50.0, quantity=1)], margin=0.2, discount=60.01)
+
+
+def test_precio_de_lista_e_igv():
+    assert list_price(100.0, 0.35) == 135.0
+    assert with_igv(135.0) == 159.3